@@ -62,7 +62,7 @@ class AlertManager:
             Alert dict if warning should trigger, None otherwise
         """
         equity = self.portfolio_manager.get_equity()
-        high_equity = self.storage.get_equity_high_last_n_days(config.kill_switch_lookback_days)
+        high_equity = self.storage.get_drawdown_reference(config.kill_switch_lookback_days)
         if not high_equity or high_equity <= 0:
             return None
         drawdown = (equity - high_equity) / high_equity
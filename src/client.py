@@ -3,9 +3,15 @@ from public_api_sdk import PublicApiClient, PublicApiClientConfiguration
 from public_api_sdk.auth_config import ApiKeyAuthConfig
 from typing import Optional
 from loguru import logger
+from requests.adapters import HTTPAdapter
 
 from src.config import config
 
+# Market data fans out across thread pools (chains, Greeks, bulk selection); the requests
+# default of 10 pooled connections per host would drop and re-handshake sockets under load
+_POOL_CONNECTIONS = 16
+_POOL_MAXSIZE = 64
+
 
 class TradingClient:
     """Wrapper around PublicApiClient with enhanced error handling."""
@@ -36,9 +42,30 @@ class TradingClient:
             ApiKeyAuthConfig(api_secret_key=self.api_secret_key),
             config=client_config
         )
+        self._configure_connection_pool()
         
         logger.info(f"Trading client initialized for account: {self.account_number}")
     
+    def _configure_connection_pool(self) -> None:
+        """Remount the SDK session's HTTPS adapter with a larger keep-alive pool.
+
+        The SDK's urllib3 retry policy is carried over unchanged.
+        """
+        session = getattr(getattr(self.client, "api_client", None), "session", None)
+        if session is None:
+            return
+        current = session.get_adapter("https://")
+        if not isinstance(current, HTTPAdapter):
+            return
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=_POOL_CONNECTIONS,
+                pool_maxsize=_POOL_MAXSIZE,
+                max_retries=current.max_retries,
+            ),
+        )
+
     def close(self):
         """Close the client and clean up resources."""
         self.client.close()
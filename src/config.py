@@ -60,6 +60,9 @@ class HighConvexityConfig(BaseSettings):
     min_open_interest: int = Field(50, env="MIN_OPEN_INTEREST")
     min_volume: int = Field(10, env="MIN_VOLUME")
     use_max_pain_for_selection: bool = Field(True, env="USE_MAX_PAIN_FOR_SELECTION")
+    # Disk cache of fetched chains so a restart skips refetching; entries share the 60s in-memory chain TTL
+    option_chain_disk_cache: bool = Field(False, env="OPTION_CHAIN_DISK_CACHE")
+    option_chain_cache_dir: str = Field(".cache/chains", env="OPTION_CHAIN_CACHE_DIR")
     
     # Roll Rules
     roll_trigger_dte: int = Field(60, env="ROLL_TRIGGER_DTE")
@@ -82,6 +85,8 @@ class HighConvexityConfig(BaseSettings):
     order_poll_timeout_seconds: int = Field(300, env="ORDER_POLL_TIMEOUT_SECONDS")  # 5 minutes
     order_poll_timeout_loop_seconds: int = Field(30, env="ORDER_POLL_TIMEOUT_LOOP_SECONDS")  # short when run from trading loop
     order_poll_interval_seconds: int = Field(5, env="ORDER_POLL_INTERVAL_SECONDS")
+    quote_cache_ttl_seconds: int = Field(30, env="QUOTE_CACHE_TTL_SECONDS")  # get_quote reuse window (balances 429s vs freshness)
+    api_rate_limit_per_minute: int = Field(600, env="API_RATE_LIMIT_PER_MINUTE")  # Client-side pacing per endpoint class (0 = off)
     
     # Signals
     use_sma_filter: bool = Field(True, env="USE_SMA_FILTER")
@@ -99,6 +104,7 @@ class HighConvexityConfig(BaseSettings):
     # Guardrails
     kill_switch_drawdown_pct: float = Field(0.25, env="KILL_SWITCH_DRAWDOWN_PCT")  # 25%
     kill_switch_lookback_days: int = Field(30, env="KILL_SWITCH_LOOKBACK_DAYS")
+    kill_switch_epsilon: float = Field(0.005, env="KILL_SWITCH_EPSILON")  # Peak only resets on a >0.5% new high
     kill_switch_cooldown_days: int = Field(5, env="KILL_SWITCH_COOLDOWN_DAYS")
     max_single_position_pct: float = Field(0.30, env="MAX_SINGLE_POSITION_PCT")  # 30% cap per position
     max_correlated_pct: float = Field(0.60, env="MAX_CORRELATED_PCT")  # 60% themes A+B+C combined
@@ -109,6 +115,7 @@ class HighConvexityConfig(BaseSettings):
     # Logging
     log_level: str = Field("INFO", env="LOG_LEVEL")
     log_file: str = Field("logs/high_convexity_bot.log", env="LOG_FILE")
+    audit_log_file: str = Field("logs/order_audit.log", env="AUDIT_LOG_FILE")  # one line per order result
     
     # Dry Run Mode
     dry_run: bool = Field(False, env="DRY_RUN")
@@ -1,6 +1,7 @@
 """Order execution and management."""
 import re
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 from decimal import Decimal
 from datetime import datetime, timezone, date
 import uuid
@@ -27,11 +28,19 @@ from src.client import TradingClient
 from src.portfolio import PortfolioManager
 from src.utils.governance import check_governance
 
+_OPTION_SUFFIX = "-OPTION"  # Position symbols may carry this; the orders API does not accept it
+_OSI_EXPIRATION_RE = re.compile(r"^[A-Z]+(\d{6})(?:[CP])\d{8}$")
+
+
+def _strip_option_suffix(symbol: str) -> str:
+    """Drop a trailing -OPTION (literal suffix check; no regex)."""
+    return symbol[:-len(_OPTION_SUFFIX)] if symbol.endswith(_OPTION_SUFFIX) else symbol
+
 
 def _parse_expiration_date_from_osi(symbol: str) -> Optional[date]:
     """Parse expiration date from OSI option symbol (e.g. AAPL260130C00200000 -> 2026-01-30)."""
-    clean = re.sub(r"-OPTION$", "", str(symbol).strip()).upper()
-    match = re.match(r"^[A-Z]+(\d{6})(?:[CP])\d{8}$", clean)
+    clean = _strip_option_suffix(str(symbol).strip()).upper()
+    match = _OSI_EXPIRATION_RE.match(clean)
     if not match:
         return None
     try:
@@ -55,7 +64,7 @@ def _normalize_option_symbol(symbol: str) -> str:
     Returns:
         Clean OSI symbol without suffix
     """
-    return re.sub(r"-OPTION$", "", str(symbol)).strip()
+    return _strip_option_suffix(str(symbol)).strip()
 
 
 def _normalize_order_status(status) -> str:
@@ -74,6 +83,27 @@ def _normalize_order_status(status) -> str:
     return str(status).upper()
 
 
+@dataclass(slots=True)
+class FillResult:
+    """Typed view of an execute_order result dict for hot-path attribute access."""
+    order_id: Any
+    symbol: str
+    quantity: Any
+    price: Any
+    status: str
+
+    @classmethod
+    def from_result(cls, result: Dict) -> "FillResult":
+        """Build from an execute_order success dict (status upper-cased, missing keys -> None/"")."""
+        return cls(
+            order_id=result.get("order_id"),
+            symbol=result.get("symbol", ""),
+            quantity=result.get("quantity"),
+            price=result.get("price"),
+            status=(result.get("status") or "").upper(),
+        )
+
+
 class ExecutionManager:
     """Manages order execution with preflight checks and polling."""
 
@@ -286,6 +316,8 @@ class ExecutionManager:
                 )
             
             order_response = self.client.client.place_order(order_request)
+            # Cash/buying power change with the order; do not serve the cached portfolio
+            self.portfolio.invalidate_portfolio_cache()
             
             order_record = {
                 "order_id": order_response.order_id,
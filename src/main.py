@@ -2,24 +2,32 @@
 import os
 import signal
 import sys
+import threading
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 from zoneinfo import ZoneInfo
 
 from loguru import logger
 
 from src.config import config
+from src.alerts import AlertManager
 from src.client import TradingClient
 from src.market_data import MarketDataManager
 from src.portfolio import PortfolioManager
-from src.execution import ExecutionManager
+from src.execution import ExecutionManager, FillResult
 from src.strategy import HighConvexityStrategy
 from src.storage import StorageManager
 from src.utils.logger import setup_logging
 from src.utils.account_manager import AccountManager
 
 
+# Order statuses (broker results are upper-cased before comparison)
+_FILLED = "FILLED"
+_TERMINAL_STATUSES = frozenset({"CANCELLED", "REJECTED", "EXPIRED"})
+
+
 class TradingBot:
     """Main trading bot orchestrator."""
     
@@ -70,9 +78,18 @@ class TradingBot:
             self.data_manager,
             self.execution_manager
         )
+        self.alert_manager = AlertManager(self.storage, self.portfolio_manager)
+        # Background writer for snapshot rows nothing reads back this cycle (one worker keeps writes ordered)
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="storage-io")
         
         self.running = False
-        self._last_rebalance_date: Optional[datetime] = None  # date (in config TZ) we last ran
+        self._stop_event = threading.Event()  # set by stop() to wake start() immediately
+        # Rebalance schedule, resolved once (restart to pick up a changed time/timezone)
+        self._tz = ZoneInfo(config.rebalance_timezone)
+        self._rebalance_hm = (config.rebalance_time_hour, config.rebalance_time_minute)
+        self._rebal_secs = config.rebalance_time_hour * 3600 + config.rebalance_time_minute * 60
+        # When (in config TZ) we last ran; persisted so a restart does not rerun the same day
+        self._last_rebalance_date: Optional[datetime] = self.storage.get_last_rebalance_date()
         logger.info("Trading bot initialized")
     
     def check_kill_switch(self) -> bool:
@@ -86,37 +103,55 @@ class TradingBot:
         # Save equity history
         self.storage.save_equity_history(equity)
 
-        # Get high from last N days
-        high_equity = self.storage.get_equity_high_last_n_days(config.kill_switch_lookback_days)
+        # ε-adjusted peak (small new highs do not reset it), else the high from the last N days
+        high_equity = self.storage.get_drawdown_reference(config.kill_switch_lookback_days)
 
         # If no history yet (first month), use current equity as baseline
         if high_equity is None or high_equity <= 0:
-            logger.debug(f"No equity history yet, using current equity ${equity:.2f} as baseline")
+            logger.debug("No equity history yet, using current equity ${:.2f} as baseline", equity)
             return False
 
         drawdown_pct = (equity - high_equity) / high_equity
 
         if drawdown_pct <= -config.kill_switch_drawdown_pct:
             logger.warning(
-                f"Kill switch activated: drawdown={drawdown_pct*100:.2f}% "
-                f"(equity=${equity:.2f}, high=${high_equity:.2f})"
+                "Kill switch activated: drawdown={:.2f}% (equity=${:.2f}, high=${:.2f})",
+                drawdown_pct * 100,
+                equity,
+                high_equity,
             )
             return True
 
         return False
 
-    def check_and_trigger_cooldown(self, order_details: dict, result: dict) -> bool:
+    def check_and_trigger_cooldown(
+        self,
+        order_details: dict,
+        result: dict,
+        loss_pct_threshold: Optional[float] = None,
+        loss_usd_threshold: Optional[float] = None,
+        duration_minutes: Optional[int] = None,
+    ) -> bool:
         """REQ-012: Check if a fill triggers cool-down due to large loss.
 
         Args:
             order_details: Original order details with entry_price
             result: Execution result with fill_price, quantity, symbol
+            loss_pct_threshold: Loss fraction that triggers cool-down (None = config)
+            loss_usd_threshold: Dollar loss that triggers cool-down (None = config)
+            duration_minutes: Cool-down length in minutes (None = config)
 
         Returns:
             True if cool-down was triggered, False otherwise
         """
         if not config.cooldown_enabled:
             return False
+        if loss_pct_threshold is None:
+            loss_pct_threshold = config.cooldown_loss_threshold_pct
+        if loss_usd_threshold is None:
+            loss_usd_threshold = config.cooldown_loss_threshold_usd
+        if duration_minutes is None:
+            duration_minutes = config.cooldown_duration_minutes
 
         try:
             action = order_details.get("action", "").upper()
@@ -137,18 +172,17 @@ class TradingBot:
             pnl_total = pnl_per_share * quantity
             pnl_pct = (pnl_per_share / entry_price) if entry_price > 0 else 0
 
-            # Check thresholds
-            loss_pct_threshold = -abs(config.cooldown_loss_threshold_pct)
-            loss_usd_threshold = -abs(config.cooldown_loss_threshold_usd)
-
-            if pnl_pct <= loss_pct_threshold or pnl_total <= loss_usd_threshold:
+            # Check thresholds (sign of the configured thresholds is ignored)
+            if pnl_pct <= -abs(loss_pct_threshold) or pnl_total <= -abs(loss_usd_threshold):
                 # Trigger cool-down
-                from datetime import timedelta
-                cooldown_until = datetime.now() + timedelta(minutes=config.cooldown_duration_minutes)
+                cooldown_until = time.time() + duration_minutes * 60
                 self.storage.set_cooldown_until(cooldown_until)
                 logger.warning(
-                    f"Cool-down triggered: {symbol} loss {pnl_pct*100:.1f}% (${pnl_total:.2f}). "
-                    f"Blocking trades until {cooldown_until.isoformat()}"
+                    "Cool-down triggered: {} loss {:.1f}% (${:.2f}). Blocking trades until {:%Y-%m-%dT%H:%M:%S}",
+                    symbol,
+                    pnl_pct * 100,
+                    pnl_total,
+                    datetime.fromtimestamp(cooldown_until),
                 )
                 return True
 
@@ -157,6 +191,15 @@ class TradingBot:
 
         return False
     
+    def _submit_io(self, fn, *args) -> None:
+        """Run a storage write on the background I/O thread, logging (not raising) failures."""
+        def _log_failure(future):
+            exc = future.exception()
+            if exc is not None:
+                logger.error("Background storage write {} failed: {}", fn.__name__, exc)
+
+        self._io_pool.submit(fn, *args).add_done_callback(_log_failure)
+
     def run_daily_logic(
         self,
         poll_timeout_seconds: Optional[float] = None,
@@ -189,28 +232,20 @@ class TradingBot:
             if not quiet:
                 self.portfolio_manager.display_portfolio_breakdown()
 
-            # Save snapshots
-            equity = self.portfolio_manager.get_equity()
-            self.storage.save_config_snapshot(equity)
-
-            allocations = self.portfolio_manager.get_current_allocations()
-            self.storage.save_portfolio_snapshot({
-                "equity": equity,
-                "buying_power": self.portfolio_manager.get_buying_power(),
-                "cash": self.portfolio_manager.get_cash(),
-                "allocations": allocations,
-            })
+            # Save snapshots (one portfolio read for equity, buying power, cash and allocations)
+            # Written in the background so the SQLite commits overlap with strategy evaluation
+            snapshot = self.portfolio_manager.get_snapshot()
+            self._submit_io(self.storage.save_config_snapshot, snapshot.equity)
+            self._submit_io(self.storage.save_portfolio_snapshot, snapshot._asdict())
 
             # Check proactive alerts (REQ-014)
             if config.proactive_alerts_enabled:
-                from src.alerts import AlertManager
-                alert_manager = AlertManager(self.storage, self.portfolio_manager)
-                alerts = alert_manager.check_all_alerts()
+                alerts = self.alert_manager.check_all_alerts()
 
                 if alerts:
                     # Log warnings
                     for alert in alerts:
-                        logger.warning(f"⚠️  {alert['message']}")
+                        logger.warning("⚠️  {}", alert["message"])
 
                     # Store for Telegram delivery
                     self.storage.save_pending_alerts(alerts)
@@ -225,11 +260,12 @@ class TradingBot:
 
             # REQ-012: Check cooldown before executing orders
             if config.cooldown_enabled and self.storage.is_in_cooldown():
-                cooldown_until = self.storage.get_cooldown_until()
-                time_left = (cooldown_until - datetime.now()).total_seconds() / 60 if cooldown_until else 0
+                cooldown_until = self.storage.get_cooldown_until_ts()
+                time_left = (cooldown_until - time.time()) / 60 if cooldown_until else 0
                 logger.warning(
-                    f"Cool-down active. Trading blocked for {time_left:.0f} more minutes. "
-                    f"Skipping {len(orders)} orders."
+                    "Cool-down active. Trading blocked for {:.0f} more minutes. Skipping {} orders.",
+                    time_left,
+                    len(orders),
                 )
                 return run_result
 
@@ -247,19 +283,33 @@ class TradingBot:
             orders = filtered_orders
             if skipped_symbols:
                 logger.info(
-                    f"Skipping {len(skipped_symbols)} order(s) this cycle (already pending: {', '.join(skipped_symbols)})"
+                    "Skipping {} order(s) this cycle (already pending: {})",
+                    len(skipped_symbols),
+                    ", ".join(skipped_symbols),
                 )
             if not orders:
                 logger.info("No orders to execute (all skipped: pending orders or none proposed)")
                 return run_result
 
-            logger.info(f"Executing {len(orders)} orders")
+            logger.info("Executing {} orders", len(orders))
             orders_sent = 0
 
-            # Execute orders (poll_timeout_seconds: None = full config timeout; short value when run from trading loop)
+            # Snapshot config once for the loop (settings attribute access is not free)
+            max_trades = config.max_trades_per_day
+            threshold_usd = config.confirm_trade_threshold_usd
+            threshold_contracts = config.confirm_trade_threshold_contracts
+            cooldown_enabled = config.cooldown_enabled
+            # Per run rather than per instance: thresholds can be changed at runtime via config overrides
+            cooldown_loss_pct = -abs(config.cooldown_loss_threshold_pct)
+            cooldown_loss_usd = -abs(config.cooldown_loss_threshold_usd)
+            cooldown_minutes = config.cooldown_duration_minutes
+
+            # Execute orders one at a time, in the order the strategy planned them (trim, sells, then buys):
+            # each order's risk checks must see the cash and positions left by the previous one.
+            # (poll_timeout_seconds: None = full config timeout; short value when run from trading loop)
             for order_details in orders:
-                if self.strategy.trades_today >= config.max_trades_per_day:
-                    logger.warning(f"Max trades per day reached: {config.max_trades_per_day}")
+                if self.strategy.trades_today >= max_trades:
+                    logger.warning("Max trades per day reached: {}", max_trades)
                     break
 
                 # Check confirm trade threshold
@@ -270,15 +320,24 @@ class TradingBot:
                 action = order_details.get("action", "")
 
                 # Log large trades for visibility
-                if order_value > config.confirm_trade_threshold_usd:
+                if order_value > threshold_usd:
                     logger.warning(
-                        f"Large trade: {action} {quantity} {symbol} @ ${price:.2f} "
-                        f"(value: ${order_value:,.2f}, threshold: ${config.confirm_trade_threshold_usd:,.2f})"
+                        "Large trade: {} {} {} @ ${:.2f} (value: ${:,.2f}, threshold: ${:,.2f})",
+                        action,
+                        quantity,
+                        symbol,
+                        price,
+                        order_value,
+                        threshold_usd,
                     )
-                elif abs(quantity) > config.confirm_trade_threshold_contracts:
+                elif abs(quantity) > threshold_contracts:
                     logger.warning(
-                        f"Large trade: {action} {quantity} {symbol} "
-                        f"(contracts: {abs(quantity)}, threshold: {config.confirm_trade_threshold_contracts})"
+                        "Large trade: {} {} {} (contracts: {}, threshold: {})",
+                        action,
+                        quantity,
+                        symbol,
+                        abs(quantity),
+                        threshold_contracts,
                     )
 
                 result = self.execution_manager.execute_order(
@@ -286,82 +345,97 @@ class TradingBot:
                     poll_timeout_seconds=poll_timeout_seconds,
                 )
                 if isinstance(result, dict) and result.get("ok") is False:
-                    logger.warning(f"Order blocked: {result.get('error', 'unknown')}")
+                    logger.warning("Order blocked: {}", result.get("error", "unknown"))
                     continue
                 if result:
                     orders_sent += 1
                     run_result["orders_sent"] = orders_sent
-                    # Save order to database
-                    self.storage.save_order({
-                        **order_details,
-                        **result,
-                    })
-                    
-                    # Only update as filled when status is actually FILLED (not OPEN/NEW)
-                    order_status = (result.get("status") or "").upper()
-                    if order_status == "FILLED":
-                        self.storage.update_order_status(
-                            result["order_id"],
-                            "FILLED",
-                            datetime.now(timezone.utc).isoformat()
+                    fill = FillResult.from_result(result)
+                    # Only mark as filled when status is actually FILLED (not OPEN/NEW)
+                    order_status = fill.status
+                    if order_status == _FILLED:
+                        filled_order = {
+                            **order_details,
+                            **result,
+                            "status": _FILLED,
+                            "filled_at": datetime.now(timezone.utc).isoformat(),
+                        }
+
+                        # REQ-011: Compute realized P&L for SELL orders before saving
+                        is_exit = (
+                            order_details.get("action", "").upper() == "SELL"
+                            and "entry_price" in order_details
                         )
-                        
-                        # Save fill
-                        self.storage.save_fill({
-                            "order_id": result["order_id"],
-                            "symbol": result["symbol"],
-                            "quantity": result["quantity"],
-                            "fill_price": result["price"],
-                        })
-
-                        # REQ-011: Compute realized P&L for SELL orders
-                        action = order_details.get("action", "").upper()
-                        if action == "SELL" and "entry_price" in order_details:
+                        if is_exit:
                             entry_price = order_details["entry_price"]
-                            fill_price = result["price"]
-                            quantity = result["quantity"]
-                            realized_pnl = (fill_price - entry_price) * quantity
-                            outcome = "win" if realized_pnl > 0 else "loss"
-
-                            # Update the saved order with realized P&L and outcome
-                            self.storage.save_order({
-                                **order_details,
-                                **result,
-                                "realized_pnl": realized_pnl,
-                                "outcome": outcome,
-                            })
+                            fill_price = fill.price
+                            quantity = fill.quantity
+                            pnl_usd = (fill_price - entry_price) * quantity
+                            outcome = "win" if pnl_usd > 0 else "loss"
+                            filled_order["realized_pnl"] = pnl_usd
+                            filled_order["outcome"] = outcome
 
                             logger.info(
-                                f"Realized P&L: ${realized_pnl:,.2f} ({outcome}) "
-                                f"on {result.get('symbol')}"
+                                "Realized P&L: ${:,.2f} ({}) on {}",
+                                pnl_usd,
+                                outcome,
+                                fill.symbol,
                             )
 
-                        # REQ-012: Check if this fill triggers cool-down
-                        cooldown_triggered = self.check_and_trigger_cooldown(order_details, result)
+                        # Save order (as filled, with any realized P&L) and fill in one transaction
+                        self.storage.record_fill(
+                            filled_order,
+                            {
+                                "order_id": fill.order_id,
+                                "symbol": fill.symbol,
+                                "quantity": fill.quantity,
+                                "fill_price": fill.price,
+                            },
+                        )
+
+                        # REQ-012: Check if this fill triggers cool-down (only exits realize a loss)
+                        cooldown_triggered = cooldown_enabled and is_exit and self.check_and_trigger_cooldown(
+                            order_details,
+                            result,
+                            loss_pct_threshold=cooldown_loss_pct,
+                            loss_usd_threshold=cooldown_loss_usd,
+                            duration_minutes=cooldown_minutes,
+                        )
                         if cooldown_triggered:
                             logger.warning(
-                                f"Cool-down triggered after fill. Stopping execution of remaining orders."
+                                "Cool-down triggered after fill. Stopping execution of remaining orders."
                             )
                             # Stop executing remaining orders in this batch
                             break
 
                         # Update strategy trade counter
                         self.strategy.trades_today += 1
-                        logger.info(f"Order filled: {result.get('symbol')} x{result.get('quantity')}")
+                        logger.info("Order filled: {} x{}", fill.symbol, fill.quantity)
                     else:
-                        if order_status in ("CANCELLED", "REJECTED", "EXPIRED"):
-                            logger.info(
-                                f"Order did not fill (status={order_status})."
-                            )
+                        # Save order to database
+                        self.storage.save_order({
+                            **order_details,
+                            **result,
+                        })
+                        if order_status in _TERMINAL_STATUSES:
+                            logger.info("Order did not fill (status={}).", order_status)
                         else:
                             logger.info(
-                                f"Order submitted (status={order_status}); "
-                                "still open and may fill later."
+                                "Order submitted (status={}); still open and may fill later.",
+                                order_status,
                             )
-                    logger.info(f"Order result: {result}")
+                    logger.debug("Order result: {}", result)
+                    logger.bind(audit=True).info(
+                        "{},{},{},{},{}",
+                        fill.order_id,
+                        order_status,
+                        fill.symbol,
+                        fill.quantity,
+                        fill.price,
+                    )
                 else:
-                    logger.error(f"Order execution failed: {order_details}")
-            
+                    logger.error("Order execution failed: {}", order_details)
+
             logger.info("Daily logic completed")
             return run_result
 
@@ -371,61 +445,79 @@ class TradingBot:
     
     def _should_run_rebalance_now(self) -> bool:
         """Return True if current time in configured timezone is at or past rebalance time and we haven't run today."""
-        tz = ZoneInfo(config.rebalance_timezone)
-        now_tz = datetime.now(tz)
-        today = now_tz.date()
+        now_tz = datetime.now(self._tz)
+        return now_tz.hour * 3600 + now_tz.minute * 60 >= self._rebal_secs and (
+            self._last_rebalance_date is None or self._last_rebalance_date.date() < now_tz.date()
+        )
+
+    def _mark_rebalance_run(self, when: datetime):
+        """Record today's rebalance in memory and storage (survives restarts)."""
+        self._last_rebalance_date = when
+        try:
+            self.storage.set_last_rebalance_date(when)
+        except Exception as e:
+            logger.warning("Could not persist last rebalance time: {}", e)
+
+    def _next_rebalance_at(self, now_tz: datetime) -> datetime:
+        """Return the next rebalance instant at or after now_tz (today if not yet reached, else tomorrow)."""
+        hour, minute = self._rebalance_hm
         rebalance_today = now_tz.replace(
-            hour=config.rebalance_time_hour,
-            minute=config.rebalance_time_minute,
+            hour=hour,
+            minute=minute,
             second=0,
             microsecond=0,
         )
-        if now_tz < rebalance_today:
-            return False
-        if self._last_rebalance_date is None or self._last_rebalance_date.date() < today:
-            return True
-        return False
+        if now_tz >= rebalance_today:
+            return rebalance_today + timedelta(days=1)
+        return rebalance_today
 
     def start(self):
         """Start the trading bot."""
         self.running = True
-        tz = ZoneInfo(config.rebalance_timezone)
-        rebalance_time = f"{config.rebalance_time_hour:02d}:{config.rebalance_time_minute:02d}"
-        logger.info(
-            f"Scheduled daily rebalancing at {rebalance_time} {config.rebalance_timezone}"
-        )
-
-        # Run immediately if already past rebalance time today (in configured TZ)
-        if self._should_run_rebalance_now():
-            self._last_rebalance_date = datetime.now(tz)
-            logger.info("Running initial logic (past rebalance time in configured timezone)")
-            self.run_daily_logic()
+        self._stop_event.clear()
+        tz = self._tz
+        rebalance_time = "{:02d}:{:02d}".format(*self._rebalance_hm)
+        logger.info("Scheduled daily rebalancing at {} {}", rebalance_time, config.rebalance_timezone)
 
         logger.info("Bot is running. Press Ctrl+C to stop.")
 
+        # First iteration runs immediately if already past rebalance time today (in configured TZ)
         while self.running:
             if self._should_run_rebalance_now():
-                self._last_rebalance_date = datetime.now(tz)
+                self._mark_rebalance_run(datetime.now(tz))
                 self.run_daily_logic()
-            time.sleep(60)  # Check every minute
+            # Sleep until the next rebalance instant; stop() sets the event to wake immediately
+            now_tz = datetime.now(tz)
+            wait_seconds = (self._next_rebalance_at(now_tz) - now_tz).total_seconds()
+            self._stop_event.wait(timeout=max(wait_seconds, 0.0))
     
+    def request_stop(self):
+        """Ask start() to return (safe to call from a signal handler; does no I/O)."""
+        self.running = False
+        self._stop_event.set()
+
     def stop(self):
         """Stop the trading bot."""
         logger.info("Stopping trading bot...")
         self.running = False
+        self._stop_event.set()
+        self._io_pool.shutdown(wait=True)  # finish pending snapshot writes
         self.client.close()
         logger.info("Trading bot stopped")
+        logger.complete()  # flush enqueued log records
 
 
 def main():
     """Main function."""
     bot = TradingBot(account_number=None)  # Will prompt if not saved
     
-    # Handle graceful shutdown
+    # Handle graceful shutdown: the first signal wakes start() (finishing any run in progress),
+    # a second one aborts immediately. Cleanup happens once, in the finally below.
     def signal_handler(sig, frame):
+        if not bot.running:
+            raise KeyboardInterrupt
         logger.info("Shutdown signal received")
-        bot.stop()
-        sys.exit(0)
+        bot.request_stop()
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
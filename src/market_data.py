@@ -1,14 +1,49 @@
 """Market data retrieval and management."""
-import re
+import asyncio
+from bisect import bisect_left, bisect_right
+from collections import deque
+import random
+import threading
 import time
-from typing import Callable, Dict, List, Optional, Tuple, TypeVar
-from datetime import datetime, date
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, TypeVar
+from datetime import date, datetime, timedelta
+import numpy as np
 from loguru import logger
 
 T = TypeVar("T")
-_QUOTE_CACHE_TTL_SEC = 30  # Use cached quote for 30s to balance rate-limiting with data freshness
+_OPTION_SUFFIX = "-OPTION"  # Position symbols may carry this; the quotes API does not accept it
+_QUOTE_CACHE_MAX_ENTRIES = 10_000
+_INSTRUMENT_NAME_CACHE_MAX_ENTRIES = 50_000
+_INSTRUMENT_NAME_TTL_SEC = 24 * 3600  # Names are stable; refresh daily for long-running processes
+_INSTRUMENT_NAME_MISS_MAX_ENTRIES = 20_000
+_INSTRUMENT_NAME_MISS_TTL_SEC = 3600  # Failed lookups (delisted/odd symbols) are retried hourly
+_INSTRUMENT_NAME_MAX_WORKERS = 8  # Concurrent get_instrument calls in bulk name lookups
+_BID_ASK_CACHE_TTL_SEC = 2  # Limit pricing reuses a bid/ask only within one strategy tick
+_BID_ASK_CACHE_MAX_ENTRIES = 2000  # Keyed by OSI symbols, which roll daily; cap so a long run cannot grow it
+_ORDER_INSTRUMENT_MAX_ENTRIES = 5000  # Request instruments kept for reuse (option symbols roll daily)
+_QUOTE_BATCH_MAX_SYMBOLS = 50  # Concurrent get_quote calls coalesced into one get_quotes request
+_QUOTE_BATCH_TIMEOUT_SEC = 20  # Wait for a coalesced quote (covers 429 backoff + request)
+_QUOTE_BATCH_WINDOW_SEC = 0.005  # Leader waits this long for concurrent misses before the first request
+_QUOTE_BATCH_MAX_ROUNDS = 4  # Requests one leader sends before handing leadership to a waiter
+_QUOTE_BATCH_POLL_SEC = 0.05  # How often waiters check whether leadership was handed off
 _MAX_429_RETRIES = 3
 _429_BACKOFF_SEC = (1, 2, 4)
+# Listings change at most daily: entries are keyed by ET trading date and kept up to a day
+_EXPIRATIONS_CACHE_TTL_SEC = 24 * 3600
+_EXPIRATIONS_CACHE_MAX_ENTRIES = 2000
+_CHAIN_CACHE_TTL_SEC = 60  # Chains carry live bid/ask; keep reuse short
+_CHAIN_CACHE_MAX_ENTRIES = 1024
+_GREEKS_CHUNK_SIZE = 200  # Max OSI symbols per batch Greeks request
+_GREEKS_MAX_WORKERS = 8
+_CHAIN_LOOKAHEAD = 2  # Chains in flight per underlying during selection (current + next expiration)
+_CHAIN_FETCH_TIMEOUT_SEC = 20  # Per-chain wait in selection (covers 429 backoff + request)
+_SELECTION_MAX_WORKERS = 8  # Concurrent underlyings in bulk selection / prefetch
+_PREFETCH_EXPIRATIONS = 3  # Chains warmed per underlying by prefetch()
+# Max pain uses the O(N log N) prefix-sum kernel from this many candidate strikes up; tinier
+# chains use the strike x contract payoff matrix, which has less fixed overhead
+_MAX_PAIN_PREFIX_SUM_MIN_STRIKES = 64
 
 from public_api_sdk import (
     OrderInstrument,
@@ -18,12 +53,17 @@ from public_api_sdk import (
     OptionChainResponse,
     OptionExpirationsResponse,
 )
+from public_api_sdk.exceptions import RateLimitError
 
 from src.client import TradingClient
 from src.config import config
-from src.utils.trading_hours import is_after_same_day_option_cutoff_et
+from src.utils.bounded_cache import BoundedCache
+from src.utils.chain_disk_cache import ChainDiskCache
+from src.utils.maxpain_kernel import max_pain_totals
+from src.utils.rate_limiter import TokenBucket
+from src.utils.trading_hours import is_after_same_day_option_cutoff_et, now_et
 from src.utils.sdk_serializer import (
-    extract_quote_data,
+    LazyQuoteView,
     extract_option_chain_data,
     extract_option_contract_data,
     extract_greeks_data,
@@ -31,6 +71,69 @@ from src.utils.sdk_serializer import (
 )
 
 
+def _to_float(value, default=None):
+    """float(value), or default when value is None or not numeric."""
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _to_int(value, default=None):
+    """int(value), or default when value is None or not numeric."""
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _rate_limit_retry_after(exc: Exception) -> Optional[float]:
+    """Seconds to wait if exc is an HTTP 429, else None (0.0 = 429 without a usable Retry-After)."""
+    if isinstance(exc, RateLimitError):
+        return float(exc.retry_after) if exc.retry_after else 0.0
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None) or getattr(exc, "status_code", None)
+    if status != 429:
+        return None
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return max(float(headers.get("Retry-After")), 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class _CallPick(NamedTuple):
+    """Selected call plus the quote fields already parsed while filtering."""
+    contract: Any
+    strike: float
+    bid: float
+    ask: float
+    open_interest: Optional[int]
+    volume: Optional[int]
+
+
+@dataclass(slots=True, frozen=True)
+class SelectedContract:
+    """Option contract chosen by select_option_contract."""
+    osi_symbol: str
+    underlying: str
+    expiration: str
+    strike: float
+    bid: float
+    ask: float
+    mid: float
+    open_interest: Optional[int]
+    volume: Optional[int]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict (e.g. for order contract_info, which is logged/serialized)."""
+        return asdict(self)
+
+
 class MarketDataManager:
     """Manages market data retrieval including quotes, option chains, and Greeks."""
     
@@ -41,25 +144,78 @@ class MarketDataManager:
             client: Trading client instance
         """
         self.client = client
-        self._quote_cache: Dict[str, float] = {}
-        self._quote_cache_ts: Dict[str, float] = {}
-        self._instrument_name_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        # Prices expire after config.quote_cache_ttl_seconds (re-read so overrides apply)
+        self._quote_cache = BoundedCache(_QUOTE_CACHE_MAX_ENTRIES, ttl=lambda: config.quote_cache_ttl_seconds)
+        self._bid_ask_cache = BoundedCache(_BID_ASK_CACHE_MAX_ENTRIES, ttl=_BID_ASK_CACHE_TTL_SEC)
+        self._instrument_name_cache = BoundedCache(_INSTRUMENT_NAME_CACHE_MAX_ENTRIES, ttl=_INSTRUMENT_NAME_TTL_SEC)
+        self._instrument_name_misses = BoundedCache(_INSTRUMENT_NAME_MISS_MAX_ENTRIES, ttl=_INSTRUMENT_NAME_MISS_TTL_SEC)
+        # Validated request instruments reused across calls (never mutated after creation); LRU, no TTL
+        self._order_instruments = BoundedCache(_ORDER_INSTRUMENT_MAX_ENTRIES)
+        # Only successful responses are cached
+        self._expirations_cache = BoundedCache(_EXPIRATIONS_CACHE_MAX_ENTRIES, ttl=_EXPIRATIONS_CACHE_TTL_SEC)
+        self._chain_cache = BoundedCache(_CHAIN_CACHE_MAX_ENTRIES, ttl=_CHAIN_CACHE_TTL_SEC)
+        self._chain_disk_cache = ChainDiskCache(config.option_chain_cache_dir, _CHAIN_CACHE_TTL_SEC)
+        self._inflight_chains: Dict[Tuple[str, str, str], Future] = {}
+        self._inflight_lock = threading.Lock()
+        # get_quote calls waiting for the in-flight batch, per instrument type: symbol -> futures
+        self._pending_quotes: Dict[InstrumentType, Dict[str, List[Future]]] = {}
+        self._quote_batch_active: Set[InstrumentType] = set()
+        self._quote_batch_lock = threading.Lock()
+        # Independent quotas per endpoint class; requests are paced before they are sent
+        self._rate_limiters: Dict[str, TokenBucket] = {
+            endpoint: TokenBucket(config.api_rate_limit_per_minute)
+            for endpoint in ("quotes", "chains", "greeks")
+        }
         logger.info("Market data manager initialized")
 
-    def _retry_on_429(self, fn: Callable[[], T]) -> T:
-        """Run fn(); on 429 (rate limit), sleep and retry with backoff. Re-raise other errors."""
-        last_err = None
+    def _instrument(self, symbol: str, instrument_type: InstrumentType) -> OrderInstrument:
+        """Return a shared OrderInstrument for (symbol, type), validating it only once."""
+        key = (symbol, instrument_type)
+        instrument = self._order_instruments.get(key)
+        if instrument is None:
+            instrument = OrderInstrument(symbol=symbol, type=instrument_type)
+            self._order_instruments[key] = instrument
+        return instrument
+
+    def _instruments(self, symbols: List[str], instrument_type: InstrumentType) -> List[OrderInstrument]:
+        """Batch form of _instrument: one cache probe per symbol, constructing only new keys."""
+        cache_get = self._order_instruments.get
+        return [
+            cache_get((symbol, instrument_type)) or self._instrument(symbol, instrument_type)
+            for symbol in symbols
+        ]
+
+    def _retry_on_429(self, fn: Callable[[], T], endpoint: str = "quotes") -> T:
+        """Run fn(); on 429 (rate limit), sleep and retry with backoff. Re-raise other errors.
+
+        Each attempt first takes a token from the endpoint's rate limiter, and a 429
+        slows that limiter down for a while. Honors the server's Retry-After when the SDK exposes it; otherwise uses the fixed
+        backoff schedule plus jitter so concurrent workers do not retry in lockstep.
+        """
+        last_err: Optional[Exception] = None
+        limiter = self._rate_limiters[endpoint]
         for attempt in range(_MAX_429_RETRIES):
+            limiter.acquire()
             try:
                 return fn()
             except Exception as e:
-                last_err = e
-                err_str = str(e).lower()
-                if "429" not in err_str and "rate" not in err_str:
+                retry_after = _rate_limit_retry_after(e)
+                if retry_after is None:
                     raise
+                last_err = e
+                limiter.penalize()
                 if attempt < _MAX_429_RETRIES - 1:
-                    backoff = _429_BACKOFF_SEC[attempt] if attempt < len(_429_BACKOFF_SEC) else _429_BACKOFF_SEC[-1]
-                    logger.warning(f"API 429 rate limit; retrying in {backoff}s (attempt {attempt + 1}/{_MAX_429_RETRIES})")
+                    if retry_after > 0:
+                        backoff = retry_after
+                    else:
+                        base = _429_BACKOFF_SEC[min(attempt, len(_429_BACKOFF_SEC) - 1)]
+                        backoff = base + random.uniform(0, 0.5 * base)
+                    logger.warning(
+                        "API 429 rate limit; retrying in {:.2f}s (attempt {}/{})",
+                        backoff,
+                        attempt + 1,
+                        _MAX_429_RETRIES,
+                    )
                     time.sleep(backoff)
         raise last_err
 
@@ -69,8 +225,10 @@ class MarketDataManager:
         """Get display/company name for an instrument from the Public API.
 
         Uses get_instrument(symbol, instrument_type) and returns the best name field
-        (name, title, display_name, short_name, long_name). Results are cached per
-        (symbol, instrument_type) for longevity and to avoid repeated API calls.
+        (name, title, display_name, short_name, long_name). Names are cached per
+        (symbol, instrument_type) for _INSTRUMENT_NAME_TTL_SEC; failed or empty lookups
+        are negative-cached for _INSTRUMENT_NAME_MISS_TTL_SEC so bad symbols are not
+        re-queried on every call.
 
         For options, call with underlying symbol and InstrumentType.EQUITY to get
         the underlying company name.
@@ -81,8 +239,9 @@ class MarketDataManager:
         if not symbol or not symbol.strip():
             return None
         key = (symbol.strip().upper(), getattr(instrument_type, "value", str(instrument_type)))
-        if key in self._instrument_name_cache:
-            return self._instrument_name_cache[key]
+        name = self._instrument_name_cache.get(key)
+        if name is not None or key in self._instrument_name_misses:
+            return name
         try:
 
             def _fetch():
@@ -91,7 +250,7 @@ class MarketDataManager:
             inst = self._retry_on_429(_fetch)
             data = serialize_sdk_object(inst) if inst else {}
             if not isinstance(data, dict):
-                self._instrument_name_cache[key] = None
+                self._instrument_name_misses[key] = True
                 return None
             name = (
                 data.get("name")
@@ -103,31 +262,81 @@ class MarketDataManager:
             if name and isinstance(name, str) and name.strip():
                 self._instrument_name_cache[key] = name.strip()
                 return name.strip()
-            self._instrument_name_cache[key] = None
+            self._instrument_name_misses[key] = True
             return None
         except Exception as e:
-            logger.debug(f"Could not get instrument name for {symbol}: {e}")
-            self._instrument_name_cache[key] = None
+            logger.debug("Could not get instrument name for {}: {}", symbol, e)
+            self._instrument_name_misses[key] = True
             return None
 
-    def get_quotes(self, symbols: List[str], instrument_type: InstrumentType = InstrumentType.EQUITY) -> Dict[str, float]:
+    def get_instrument_display_names(
+        self, symbols: List[str], instrument_type: InstrumentType = InstrumentType.EQUITY
+    ) -> Dict[str, Optional[str]]:
+        """Display names for many symbols; cache misses are looked up concurrently.
+
+        The API has no by-symbol batch endpoint for instruments, so uncached symbols fan
+        out over a thread pool through get_instrument_display_name (which fills the cache).
+
+        Returns:
+            Dictionary mapping each non-empty symbol to its name or None.
+        """
+        symbols = list(dict.fromkeys(s for s in symbols if s and s.strip()))
+        type_key = getattr(instrument_type, "value", str(instrument_type))
+        result: Dict[str, Optional[str]] = {}
+        missing = []
+        for symbol in symbols:
+            key = (symbol.strip().upper(), type_key)
+            name = self._instrument_name_cache.get(key)
+            if name is not None or key in self._instrument_name_misses:
+                result[symbol] = name
+            else:
+                missing.append(symbol)
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(_INSTRUMENT_NAME_MAX_WORKERS, len(missing))) as pool:
+                names = pool.map(lambda s: self.get_instrument_display_name(s, instrument_type), missing)
+                result.update(zip(missing, names))
+        return {symbol: result[symbol] for symbol in symbols}
+
+    def get_quotes(
+        self,
+        symbols: List[str],
+        instrument_type: InstrumentType = InstrumentType.EQUITY,
+        force_refresh: bool = False,
+    ) -> Dict[str, Optional[float]]:
         """Get current quotes for multiple symbols.
 
-        Retries on 429 (rate limit) with backoff. Updates quote cache and cache timestamps on success.
+        Symbols with a price younger than config.quote_cache_ttl_seconds are served from the
+        quote cache and only the rest are requested; pass force_refresh=True to request all.
+        Retries on 429 (rate limit) with backoff. Updates the quote cache on success.
+
+        Returns:
+            Dictionary with an entry for every requested symbol. The value is None when the
+            API omitted the symbol or returned no usable last/bid/ask price for it.
         """
         try:
-            instruments = [
-                OrderInstrument(symbol=symbol, type=instrument_type)
-                for symbol in symbols
-            ]
+            # Requested symbols the API omits stay None
+            result: Dict[str, Optional[float]] = dict.fromkeys(symbols)
+            if force_refresh:
+                to_fetch = list(result)
+            else:
+                cache = self._quote_cache
+                to_fetch = []
+                for symbol in result:
+                    price = cache.get(symbol)
+                    if price is None:
+                        to_fetch.append(symbol)
+                    else:
+                        result[symbol] = price
+                if not to_fetch:
+                    return result
+            instruments = self._instruments(to_fetch, instrument_type)
 
             def _fetch():
                 return self.client.client.get_quotes(instruments)
 
             quotes = self._retry_on_429(_fetch)
 
-            result = {}
-            now = time.time()
+            priced: Dict[str, float] = {}
             for quote in quotes:
                 symbol = quote.instrument.symbol
                 # last can be None for illiquid options, crypto, or no recent trade
@@ -141,22 +350,21 @@ class MarketDataManager:
                             price = (float(bid) + float(ask)) / 2
                         except (TypeError, ValueError):
                             price = None
-                    else:
-                        price = None
                 else:
                     try:
                         price = float(price)
                     except (TypeError, ValueError):
                         price = None
+                result[symbol] = price
                 if price is not None:
-                    result[symbol] = price
-                    self._quote_cache[symbol] = price
-                    self._quote_cache_ts[symbol] = now
-                else:
-                    result[symbol] = None
-                    logger.debug(f"No price for {symbol} (last/bid/ask missing)")
+                    priced[symbol] = price
+
+            self._quote_cache.update(priced)
 
-            logger.debug(f"Retrieved quotes for {len([v for v in result.values() if v is not None])} symbols")
+            missing = len(to_fetch) - len(priced)
+            if missing:
+                logger.debug("No price for {} symbol(s) (last/bid/ask missing)", missing)
+            logger.debug("Retrieved quotes for {} symbols ({} from cache)", len(priced), len(result) - len(to_fetch))
             return result
 
         except Exception as e:
@@ -166,20 +374,71 @@ class MarketDataManager:
     def get_quote(self, symbol: str, instrument_type: InstrumentType = InstrumentType.EQUITY) -> Optional[float]:
         """Get current quote for a single symbol.
 
-        Uses cached price if available and younger than _QUOTE_CACHE_TTL_SEC to reduce 429s.
-        Retries on 429 with backoff when calling the API.
+        Uses cached price if available and younger than config.quote_cache_ttl_seconds to reduce 429s.
+        Retries on 429 with backoff when calling the API. Cache misses from concurrent callers
+        are coalesced: symbols requested while a quote request is in flight are fetched
+        together in the next get_quotes call instead of one request each.
         """
         try:
-            now = time.time()
-            cached_ts = self._quote_cache_ts.get(symbol, 0)
-            if symbol in self._quote_cache and (now - cached_ts) < _QUOTE_CACHE_TTL_SEC:
+            try:
                 return self._quote_cache[symbol]
-            quotes = self.get_quotes([symbol], instrument_type)
-            return quotes.get(symbol)
+            except KeyError:
+                pass
+            future: Future = Future()
+            with self._quote_batch_lock:
+                self._pending_quotes.setdefault(instrument_type, {}).setdefault(symbol, []).append(future)
+            deadline = time.monotonic() + _QUOTE_BATCH_TIMEOUT_SEC
+            while True:
+                with self._quote_batch_lock:
+                    lead = not future.done() and instrument_type not in self._quote_batch_active
+                    if lead:
+                        self._quote_batch_active.add(instrument_type)
+                if lead:
+                    self._drain_quote_batches(instrument_type)
+                remaining = deadline - time.monotonic()
+                try:
+                    # Wake periodically: a leader that hit its round cap leaves the rest to a waiter
+                    return future.result(timeout=max(0.0, min(remaining, _QUOTE_BATCH_POLL_SEC)))
+                except FuturesTimeoutError:
+                    if remaining <= _QUOTE_BATCH_POLL_SEC:
+                        raise
         except Exception as e:
             logger.error(f"Error retrieving quote for {symbol}: {e}")
             return None
 
+    def _drain_quote_batches(self, instrument_type: InstrumentType) -> None:
+        """Fetch pending get_quote symbols in batches, resolving their futures.
+
+        The leader first waits _QUOTE_BATCH_WINDOW_SEC so concurrent misses join its request, then
+        sends at most _QUOTE_BATCH_MAX_ROUNDS requests. Anything still pending after that is left
+        for a waiting caller to lead, so no single caller's latency grows with the queue.
+        """
+        time.sleep(_QUOTE_BATCH_WINDOW_SEC)
+        for _ in range(_QUOTE_BATCH_MAX_ROUNDS):
+            with self._quote_batch_lock:
+                pending = self._pending_quotes.get(instrument_type)
+                if not pending:
+                    self._pending_quotes.pop(instrument_type, None)
+                    self._quote_batch_active.discard(instrument_type)
+                    return
+                batch: Dict[str, List[Future]] = {}
+                for symbol in list(pending)[:_QUOTE_BATCH_MAX_SYMBOLS]:
+                    batch[symbol] = pending.pop(symbol)
+            try:
+                quotes = self.get_quotes(list(batch), instrument_type)
+            except Exception as e:
+                for futures in batch.values():
+                    for future in futures:
+                        future.set_exception(e)
+                continue
+            for symbol, futures in batch.items():
+                for future in futures:
+                    future.set_result(quotes.get(symbol))
+        with self._quote_batch_lock:
+            if not self._pending_quotes.get(instrument_type):
+                self._pending_quotes.pop(instrument_type, None)
+            self._quote_batch_active.discard(instrument_type)
+
     def get_quote_bid_ask(
         self, symbol: str, instrument_type: InstrumentType = InstrumentType.EQUITY
     ) -> Optional[Dict[str, float]]:
@@ -190,11 +449,21 @@ class MarketDataManager:
             instrument_type: Type of instrument (default: EQUITY)
             
         Returns:
-            Dict with keys bid, ask, mid (and last if available), or None if unavailable
+            Dict with keys bid, ask, mid (and last if available), or None if unavailable.
+            Results are reused for _BID_ASK_CACHE_TTL_SEC.
         """
+        key = (str(symbol), instrument_type)
+        cached = self._bid_ask_cache.get(key)
+        if cached is not None:
+            return dict(cached)
         try:
-            api_symbol = re.sub(r"-OPTION$", "", str(symbol)).strip() if instrument_type == InstrumentType.OPTION else symbol
-            instruments = [OrderInstrument(symbol=api_symbol, type=instrument_type)]
+            api_symbol = symbol
+            if instrument_type == InstrumentType.OPTION:
+                api_symbol = str(symbol)
+                if api_symbol.endswith(_OPTION_SUFFIX):
+                    api_symbol = api_symbol[:-len(_OPTION_SUFFIX)]
+                api_symbol = api_symbol.strip()
+            instruments = [self._instrument(api_symbol, instrument_type)]
 
             def _fetch_bid_ask():
                 return self.client.client.get_quotes(instruments)
@@ -207,13 +476,18 @@ class MarketDataManager:
             ask = float(quote.ask) if quote.ask is not None else None
             last = float(quote.last) if quote.last is not None else None
             if bid is None and ask is None:
-                return {"bid": last, "ask": last, "mid": last, "last": last} if last is not None else None
-            bid = bid if bid is not None else (ask if ask is not None else last)
-            ask = ask if ask is not None else (bid if bid is not None else last)
-            mid = (bid + ask) / 2.0 if (bid is not None and ask is not None) else (bid or ask)
-            return {"bid": bid, "ask": ask, "mid": mid, "last": last}
+                if last is None:
+                    return None
+                result = {"bid": last, "ask": last, "mid": last, "last": last}
+            else:
+                bid = bid if bid is not None else (ask if ask is not None else last)
+                ask = ask if ask is not None else (bid if bid is not None else last)
+                mid = (bid + ask) / 2.0 if (bid is not None and ask is not None) else (bid or ask)
+                result = {"bid": bid, "ask": ask, "mid": mid, "last": last}
+            self._bid_ask_cache[key] = dict(result)
+            return result
         except Exception as e:
-            logger.debug(f"Error getting bid/ask for {symbol}: {e}")
+            logger.debug("Error getting bid/ask for {}: {}", symbol, e)
             return None
     
     def get_option_expirations(
@@ -223,25 +497,35 @@ class MarketDataManager:
     ) -> List[date]:
         """Get available option expiration dates for an underlying.
         
+        Results are cached for the rest of the ET trading day (the cache key includes the
+        date, so the first lookup after midnight refetches); clear_cache() flushes them.
+        
         Args:
             underlying_symbol: Underlying symbol
             underlying_type: Type of underlying instrument
             
         Returns:
-            List of expiration dates
+            List of expiration dates, ascending
         """
+        key = (underlying_symbol, getattr(underlying_type, "value", str(underlying_type)), now_et().date())
+        cached = self._expirations_cache.get(key)
+        if cached is not None:
+            return list(cached)
         try:
             request = OptionExpirationsRequest(
-                instrument=OrderInstrument(
-                    symbol=underlying_symbol,
-                    type=underlying_type
-                )
+                instrument=self._instrument(underlying_symbol, underlying_type)
             )
             
-            response: OptionExpirationsResponse = self.client.client.get_option_expirations(request)
-            expirations = [datetime.fromisoformat(exp).date() for exp in response.expirations]
+            response: OptionExpirationsResponse = self._retry_on_429(
+                lambda: self.client.client.get_option_expirations(request), "chains"
+            )
+            # Date-only strings are expected; the slice also accepts full timestamps.
+            # Sorted once here so DTE windows can be found by bisection.
+            expirations = sorted(date.fromisoformat(exp[:10]) for exp in response.expirations)
+            if expirations:
+                self._expirations_cache[key] = expirations
             
-            logger.debug(f"Retrieved {len(expirations)} expirations for {underlying_symbol}")
+            logger.debug("Retrieved {} expirations for {}", len(expirations), underlying_symbol)
             return expirations
             
         except Exception as e:
@@ -256,6 +540,10 @@ class MarketDataManager:
     ) -> Optional[OptionChainResponse]:
         """Get option chain for a specific expiration.
         
+        Results are cached for _CHAIN_CACHE_TTL_SEC; clear_cache() flushes them. With
+        config.option_chain_disk_cache, chains are also persisted under
+        config.option_chain_cache_dir and reused across restarts.
+        
         Args:
             underlying_symbol: Underlying symbol
             expiration_date: Expiration date
@@ -264,21 +552,61 @@ class MarketDataManager:
         Returns:
             Option chain response or None if error
         """
+        expiration_str = expiration_date.isoformat()
+        key = (underlying_symbol, expiration_str, getattr(underlying_type, "value", str(underlying_type)))
+        cached = self._chain_cache.get(key)
+        if cached is not None:
+            return cached
+        if config.option_chain_disk_cache:
+            chain = self._chain_disk_cache.get(underlying_symbol, expiration_str, key[2])
+            if chain is not None:
+                self._chain_cache[key] = chain
+                return chain
+        # Concurrent callers for the same chain share one request
+        with self._inflight_lock:
+            future = self._inflight_chains.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight_chains[key] = future
+        if not owner:
+            try:
+                return future.result(timeout=_CHAIN_FETCH_TIMEOUT_SEC)
+            except FuturesTimeoutError:
+                logger.warning("Timed out waiting for in-flight chain {} {}", underlying_symbol, expiration_str)
+                return None
+        chain = None
+        try:
+            chain = self._fetch_option_chain(key, underlying_symbol, expiration_date, underlying_type)
+            return chain
+        finally:
+            with self._inflight_lock:
+                self._inflight_chains.pop(key, None)
+            future.set_result(chain)
+
+    def _fetch_option_chain(
+        self,
+        key: Tuple[str, str, str],
+        underlying_symbol: str,
+        expiration_date: date,
+        underlying_type: InstrumentType,
+    ) -> Optional[OptionChainResponse]:
+        """Request one chain from the API and store it in the chain caches (None on error)."""
+        expiration_str = key[1]
         try:
-            expiration_str = expiration_date.isoformat()
-            
             request = OptionChainRequest(
-                instrument=OrderInstrument(
-                    symbol=underlying_symbol,
-                    type=underlying_type
-                ),
+                instrument=self._instrument(underlying_symbol, underlying_type),
                 expiration_date=expiration_str
             )
             
-            chain = self.client.client.get_option_chain(request)
+            chain = self._retry_on_429(lambda: self.client.client.get_option_chain(request), "chains")
+            if chain is not None:
+                self._chain_cache[key] = chain
+                if config.option_chain_disk_cache:
+                    self._chain_disk_cache.set(underlying_symbol, expiration_str, key[2], chain)
             logger.debug(
-                f"Retrieved option chain for {underlying_symbol} "
-                f"expiring {expiration_str}: {len(chain.calls)} calls"
+                "Retrieved option chain for {} expiring {}: {} calls",
+                underlying_symbol, expiration_str, len(chain.calls),
             )
             return chain
             
@@ -289,62 +617,126 @@ class MarketDataManager:
             )
             return None
 
+    async def get_quotes_async(
+        self,
+        symbols: List[str],
+        instrument_type: InstrumentType = InstrumentType.EQUITY,
+        force_refresh: bool = False,
+    ) -> Dict[str, float]:
+        """Async get_quotes for event-loop callers (e.g. Telegram handlers).
+        
+        The SDK client is synchronous; the single batch request runs in the default
+        executor so the event loop is not blocked.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: self.get_quotes(symbols, instrument_type, force_refresh))
+
+    async def get_option_chains_async(
+        self,
+        underlying_symbol: str,
+        expiration_dates: List[date],
+        underlying_type: InstrumentType = InstrumentType.EQUITY
+    ) -> Dict[date, Optional[OptionChainResponse]]:
+        """Fetch chains for several expirations concurrently from an event loop.
+        
+        Returns:
+            Dictionary mapping expiration date to chain (None where the fetch failed)
+        """
+        loop = asyncio.get_running_loop()
+        chains = await asyncio.gather(*(
+            loop.run_in_executor(None, self.get_option_chain, underlying_symbol, exp, underlying_type)
+            for exp in expiration_dates
+        ))
+        return dict(zip(expiration_dates, chains))
+
+    async def get_option_greeks_async(
+        self, osi_symbols: List[str], chunk_size: int = _GREEKS_CHUNK_SIZE
+    ) -> Dict[str, Dict]:
+        """Async get_option_greeks_bulk: chunks are fetched concurrently from an event loop.
+        
+        At most _GREEKS_MAX_WORKERS batch requests are in flight at once; failed chunks are omitted.
+        """
+        symbols = list(dict.fromkeys(osi_symbols))
+        if not symbols:
+            return {}
+        loop = asyncio.get_running_loop()
+        limit = asyncio.Semaphore(_GREEKS_MAX_WORKERS)
+
+        async def _chunk(chunk: List[str]) -> Dict[str, Dict]:
+            async with limit:
+                return await loop.run_in_executor(None, self.get_option_greeks, chunk)
+
+        parts = await asyncio.gather(*(
+            _chunk(symbols[i:i + chunk_size]) for i in range(0, len(symbols), chunk_size)
+        ))
+        result: Dict[str, Dict] = {}
+        for greeks in parts:
+            result.update(greeks)
+        return result
+
     @staticmethod
-    def compute_max_pain(chain: OptionChainResponse) -> Optional[Tuple[float, float]]:
+    def compute_max_pain(
+        chain: OptionChainResponse,
+        call_arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> Optional[Tuple[float, float]]:
         """Compute max pain strike from option chain (open interest–weighted).
         
         Max pain is the strike at which total option holder value at expiration is minimized
         (i.e. maximum pain for holders / maximum gain for writers). Uses OI * 100 per contract.
         
+        Args:
+            chain: Option chain
+            call_arrays: _strike_oi_arrays(chain.calls) if the caller already built it
+        
         Returns:
             (max_pain_strike, total_value_at_max_pain) or None if no OI data.
         """
-        calls = getattr(chain, "calls", []) or []
-        puts = getattr(chain, "puts", []) or []
-        strikes_set = set()
-        # (strike, oi) for calls and puts
-        call_data: List[Tuple[float, int]] = []
-        put_data: List[Tuple[float, int]] = []
-        for c in calls:
-            strike = getattr(c, "strike", None)
-            if strike is None:
-                continue
-            k = float(strike)
-            strikes_set.add(k)
-            oi = getattr(c, "open_interest", None)
-            oi = int(oi) if oi is not None else 0
-            call_data.append((k, oi))
-        for p in puts:
-            strike = getattr(p, "strike", None)
-            if strike is None:
-                continue
-            k = float(strike)
-            strikes_set.add(k)
-            oi = getattr(p, "open_interest", None)
-            oi = int(oi) if oi is not None else 0
-            put_data.append((k, oi))
-        if not strikes_set:
+        if call_arrays is None:
+            call_arrays = MarketDataManager._strike_oi_arrays(getattr(chain, "calls", []) or [])
+        call_k, call_oi = call_arrays
+        put_k, put_oi = MarketDataManager._strike_oi_arrays(getattr(chain, "puts", []) or [])
+        # Contracts without a strike do not take part
+        valid = ~np.isnan(call_k)
+        call_k, call_oi = call_k[valid], call_oi[valid]
+        valid = ~np.isnan(put_k)
+        put_k, put_oi = put_k[valid], put_oi[valid]
+        if not call_k.size and not put_k.size:
             return None
         # If no OI anywhere, all totals are 0 -> arbitrary; skip.
-        if not call_data and not put_data:
+        if not call_oi.any() and not put_oi.any():
             return None
-        if all(oi == 0 for _, oi in call_data) and all(oi == 0 for _, oi in put_data):
-            return None
-        best_strike = None
-        best_total = float("inf")
-        for S in sorted(strikes_set):
-            call_value = sum(max(0.0, S - K) * 100 * oi for K, oi in call_data)
-            put_value = sum(max(0.0, K - S) * 100 * oi for K, oi in put_data)
-            total = call_value + put_value
-            if total < best_total:
-                best_total = total
-                best_strike = S
-        if best_strike is None:
-            return None
-        return (best_strike, best_total)
+        strikes = np.unique(np.concatenate((call_k, put_k)))
+        if strikes.size >= _MAX_PAIN_PREFIX_SUM_MIN_STRIKES:
+            total = max_pain_totals(strikes, call_k, call_oi, put_k, put_oi) * 100
+        else:
+            # Payoff matrix (candidate strike x contract strike) weighted by OI
+            call_value = np.maximum(0.0, strikes[:, None] - call_k[None, :]) @ call_oi
+            put_value = np.maximum(0.0, put_k[None, :] - strikes[:, None]) @ put_oi
+            total = (call_value + put_value) * 100
+        # Round away float noise so exact ties still resolve to the lowest strike
+        total = np.round(total, 6)
+        best = int(np.argmin(total))
+        return (float(strikes[best]), float(total[best]))
+
+    @staticmethod
+    def _strike_oi_arrays(contracts) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (strikes, open_interest) float arrays aligned with contracts.
+        
+        Missing strikes are NaN and missing open interest is 0. One pass over a chain's
+        calls serves both max pain and the selection filter.
+        """
+        # Locals keep the per-contract loop on fast name lookups
+        to_float, to_int, nan = _to_float, _to_int, np.nan
+        strikes = np.fromiter(
+            (to_float(getattr(c, "strike", None), nan) for c in contracts), float, len(contracts)
+        )
+        ois = np.fromiter(
+            (to_int(getattr(c, "open_interest", None), 0) for c in contracts), float, len(contracts)
+        )
+        return strikes, ois
     
     def get_option_greeks(self, osi_symbols: List[str]) -> Dict[str, Dict]:
-        """Get Greeks for multiple option contracts.
+        """Get Greeks for multiple option contracts in one batch request.
         
         Args:
             osi_symbols: List of OSI format option symbols
@@ -353,37 +745,58 @@ class MarketDataManager:
             Dictionary mapping OSI symbol to comprehensive Greeks dict with ALL fields
         """
         try:
-            if len(osi_symbols) == 1:
-                greek_response = self.client.client.get_option_greek(osi_symbols[0])
-                # Use comprehensive serializer to extract ALL fields
-                greeks_dict = extract_greeks_data(greek_response.greeks)
-                # Extract symbol from response if available
-                symbol = getattr(greek_response, "osi_symbol", None) or getattr(
-                    greek_response, "symbol", None
-                ) or osi_symbols[0]
-                return {symbol: greeks_dict}
-            else:
-                greeks_response = self.client.client.get_option_greeks(osi_symbols)
-                result = {}
-                for i, greek_data in enumerate(greeks_response.greeks):
-                    # Use comprehensive serializer
-                    greeks_dict = extract_greeks_data(greek_data.greeks)
-                    # Extract symbol
-                    symbol = getattr(greek_data, "osi_symbol", None) or getattr(
-                        greek_data, "symbol", None
-                    )
-                    if symbol is None and i < len(osi_symbols):
-                        symbol = osi_symbols[i]
-                    if symbol is None:
-                        continue
-                    result[symbol] = greeks_dict
-                return result
+            greeks_response = self._retry_on_429(
+                lambda: self.client.client.get_option_greeks(osi_symbols), "greeks"
+            )
+            result = {}
+            for i, greek_data in enumerate(greeks_response.greeks):
+                # Use comprehensive serializer
+                greeks_dict = extract_greeks_data(greek_data.greeks)
+                # Extract symbol
+                symbol = getattr(greek_data, "osi_symbol", None) or getattr(
+                    greek_data, "symbol", None
+                )
+                if symbol is None and i < len(osi_symbols):
+                    symbol = osi_symbols[i]
+                if symbol is None:
+                    continue
+                result[symbol] = greeks_dict
+            return result
                 
         except Exception as e:
             logger.error(f"Error retrieving Greeks: {e}")
             return {}
+
+    def get_option_greeks_bulk(
+        self, osi_symbols: List[str], chunk_size: int = _GREEKS_CHUNK_SIZE
+    ) -> Dict[str, Dict]:
+        """Get Greeks for an arbitrary number of contracts (e.g. collected across underlyings).
+        
+        Symbols are de-duplicated and split into chunks of at most chunk_size; chunks are
+        fetched concurrently through get_option_greeks.
+        
+        Args:
+            osi_symbols: List of OSI format option symbols
+            chunk_size: Maximum symbols per batch request
+            
+        Returns:
+            Dictionary mapping OSI symbol to Greeks dict (failed chunks are omitted)
+        """
+        symbols = list(dict.fromkeys(osi_symbols))
+        if not symbols:
+            return {}
+        chunks = [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+        if len(chunks) == 1:
+            return self.get_option_greeks(chunks[0])
+        result: Dict[str, Dict] = {}
+        with ThreadPoolExecutor(max_workers=min(_GREEKS_MAX_WORKERS, len(chunks))) as pool:
+            for greeks in pool.map(self.get_option_greeks, chunks):
+                result.update(greeks)
+        return result
     
-    def get_quotes_comprehensive(self, symbols: List[str], instrument_type: InstrumentType = InstrumentType.EQUITY) -> Dict[str, Dict]:
+    def get_quotes_comprehensive(
+        self, symbols: List[str], instrument_type: InstrumentType = InstrumentType.EQUITY
+    ) -> Dict[str, LazyQuoteView]:
         """Get comprehensive quote data for multiple symbols (ALL fields for AI consumption).
         
         Args:
@@ -391,31 +804,31 @@ class MarketDataManager:
             instrument_type: Type of instrument (default: EQUITY)
             
         Returns:
-            Dictionary mapping symbol to comprehensive quote dict with ALL available fields
+            Dictionary mapping symbol to a read-only quote mapping with ALL available fields.
+            Fields are serialized on first access; use .to_dict() for a plain dict.
         """
         try:
-            instruments = [
-                OrderInstrument(symbol=symbol, type=instrument_type)
-                for symbol in symbols
-            ]
+            instruments = self._instruments(symbols, instrument_type)
 
             def _fetch():
                 return self.client.client.get_quotes(instruments)
 
             quotes = self._retry_on_429(_fetch)
 
-            result = {}
-            now = time.time()
+            result: Dict[str, LazyQuoteView] = {}
+            priced: Dict[str, float] = {}
             for quote in quotes:
-                quote_data = extract_quote_data(quote)
-                symbol = quote_data.get("symbol")
+                symbol = getattr(getattr(quote, "instrument", None), "symbol", None)
                 if symbol:
-                    result[symbol] = quote_data
-                    if quote_data.get("last"):
-                        self._quote_cache[symbol] = quote_data["last"]
-                        self._quote_cache_ts[symbol] = now
+                    view = LazyQuoteView(quote)
+                    result[symbol] = view
+                    last = view.last
+                    if last:
+                        priced[symbol] = last
+            # One cache write (and one timestamp) for the whole batch
+            self._quote_cache.update(priced)
 
-            logger.debug(f"Retrieved comprehensive quotes for {len(result)} symbols")
+            logger.debug("Retrieved comprehensive quotes for {} symbols", len(result))
             return result
 
         except Exception as e:
@@ -458,50 +871,191 @@ class MarketDataManager:
             logger.error(f"Error retrieving comprehensive option chain: {e}")
             return None
     
+    @staticmethod
+    def _best_call(
+        calls,
+        target_min: float,
+        target_max: float,
+        anchor: float,
+        call_arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> Optional["_CallPick"]:
+        """Pick the liquid call in [target_min, target_max] whose strike is closest to anchor.
+        
+        Strikes are read first and only contracts inside the strike range have their
+        quote fields loaded (the range is a narrow band of a typical chain). The spread,
+        OI and volume filters are then applied as vectorized masks. A missing bid or a
+        missing/zero ask disqualifies a contract (a 0.0 bid is a real quote and is left to
+        the spread filter); missing or zero OI/volume skip that filter.
+        Ties go to the earliest contract in chain order.
+        """
+        if not calls:
+            return None
+        if call_arrays is None:
+            call_arrays = MarketDataManager._strike_oi_arrays(calls)
+        strikes, all_ois = call_arrays
+        in_range = np.flatnonzero((strikes >= target_min) & (strikes <= target_max))
+        if not in_range.size:
+            return None
+        n = in_range.size
+        bids = np.empty(n)
+        asks = np.empty(n)
+        ois = all_ois[in_range]
+        vols = np.empty(n)
+        to_float, to_int, nan = _to_float, _to_int, np.nan
+        # tolist() yields Python ints, which index a list faster than numpy scalars
+        for j, i in enumerate(in_range.tolist()):
+            call = calls[i]
+            bids[j] = to_float(getattr(call, "bid", None), nan)
+            asks[j] = to_float(getattr(call, "ask", None), nan)
+            vols[j] = to_int(getattr(call, "volume", None), 0)
+
+        mids = (bids + asks) / 2
+        with np.errstate(invalid="ignore", divide="ignore"):
+            spread_pct = np.where(mids > 0, (asks - bids) / mids, np.inf)
+        max_spread, min_oi, min_vol = config.max_bid_ask_spread_pct, config.min_open_interest, config.min_volume
+        mask = (
+            ~np.isnan(bids)
+            & (asks > 0)
+            & (spread_pct <= max_spread)
+            & ((ois == 0) | (ois >= min_oi))
+            & ((vols == 0) | (vols >= min_vol))
+        )
+        if not mask.any():
+            return None
+        # Index into the in-range slice so the winner's parsed quote can be reused
+        pos = np.flatnonzero(mask)
+        best = int(pos[int(np.argmin(np.abs(strikes[in_range[pos]] - anchor)))])
+        return _CallPick(
+            contract=calls[int(in_range[best])],
+            strike=float(strikes[in_range[best]]),
+            bid=float(bids[best]),
+            ask=float(asks[best]),
+            open_interest=int(ois[best]) or None,
+            volume=int(vols[best]) or None,
+        )
+
+    @staticmethod
+    def _target_expirations(expirations: List[date], today: date) -> List[date]:
+        """Expirations inside the configured DTE window, else inside the fallback window.
+
+        expirations must be ascending (as returned by get_option_expirations); each window
+        is located by bisection and returned as an ascending slice.
+        """
+        for dte_min, dte_max in (
+            (config.option_dte_min, config.option_dte_max),
+            (config.option_dte_fallback_min, config.option_dte_fallback_max),
+        ):
+            lo = bisect_left(expirations, today + timedelta(days=dte_min))
+            hi = bisect_right(expirations, today + timedelta(days=dte_max))
+            if lo < hi:
+                return expirations[lo:hi]
+        return []
+
+    def prefetch(
+        self,
+        symbols: List[str],
+        underlying_type: InstrumentType = InstrumentType.EQUITY,
+        max_expirations: int = _PREFETCH_EXPIRATIONS
+    ) -> None:
+        """Warm the expiration and chain caches for a watchlist before per-symbol selection.
+        
+        Expirations for all symbols are fetched concurrently, then chains for the first
+        max_expirations target expirations of each symbol. Later select_option_contract
+        calls within the cache TTLs are served from memory.
+        """
+        symbols = list(dict.fromkeys(s for s in symbols if s))
+        if not symbols:
+            return
+        today = date.today()
+        with ThreadPoolExecutor(max_workers=min(_SELECTION_MAX_WORKERS, len(symbols))) as pool:
+            all_expirations = list(pool.map(
+                lambda symbol: self.get_option_expirations(symbol, underlying_type), symbols
+            ))
+            jobs = [
+                (symbol, expiration)
+                for symbol, expirations in zip(symbols, all_expirations)
+                for expiration in self._target_expirations(expirations, today)[:max_expirations]
+            ]
+            list(pool.map(lambda job: self.get_option_chain(job[0], job[1], underlying_type), jobs))
+        logger.debug("Prefetched {} option chains for {} symbols", len(jobs), len(symbols))
+
+    def _prefetch_option_chains(
+        self,
+        underlying_symbol: str,
+        expirations: List[date],
+        underlying_type: InstrumentType = InstrumentType.EQUITY
+    ) -> Iterator[Tuple[date, Optional[OptionChainResponse]]]:
+        """Fetch chains a couple of expirations ahead of the caller, yielding them in the given order.
+
+        Only the first _CHAIN_LOOKAHEAD chains are requested up front; each further chain the
+        caller asks for starts the fetch for the one after it. Selection usually stops at the first
+        expiration with a pick, so later chains are never requested. A chain not ready within
+        _CHAIN_FETCH_TIMEOUT_SEC is yielded as None.
+        """
+        if not expirations:
+            return
+        pool = ThreadPoolExecutor(max_workers=min(_CHAIN_LOOKAHEAD, len(expirations)))
+        try:
+            futures = deque(
+                pool.submit(self.get_option_chain, underlying_symbol, expiration, underlying_type)
+                for expiration in expirations[:_CHAIN_LOOKAHEAD]
+            )
+            for index, expiration in enumerate(expirations):
+                # The caller asked for another chain: keep _CHAIN_LOOKAHEAD requests in flight
+                ahead = index + _CHAIN_LOOKAHEAD - 1
+                if index and ahead < len(expirations):
+                    futures.append(pool.submit(
+                        self.get_option_chain, underlying_symbol, expirations[ahead], underlying_type
+                    ))
+                future = futures.popleft()
+                try:
+                    chain = future.result(timeout=_CHAIN_FETCH_TIMEOUT_SEC)
+                except FuturesTimeoutError:
+                    logger.warning(
+                        "Option chain for {} expiring {} timed out after {}s",
+                        underlying_symbol, expiration, _CHAIN_FETCH_TIMEOUT_SEC,
+                    )
+                    chain = None
+                yield expiration, chain
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
     def select_option_contract(
         self,
         underlying_symbol: str,
         underlying_price: float,
-        underlying_type: InstrumentType = InstrumentType.EQUITY
-    ) -> Optional[Dict]:
+        underlying_type: InstrumentType = InstrumentType.EQUITY,
+        now: Optional[datetime] = None
+    ) -> Optional[SelectedContract]:
         """Select an option contract based on selection rules.
         
         Args:
             underlying_symbol: Underlying symbol
             underlying_price: Current underlying price
             underlying_type: Type of underlying instrument
+            now: Timezone-aware time for the same-day cutoff check (bulk callers pass one
+                reading for all symbols); defaults to the current time
             
         Returns:
-            Dictionary with contract details including OSI symbol, or None if no valid contract
+            SelectedContract with contract details including OSI symbol, or None if no valid contract
         """
         try:
             # Get expirations
             expirations = self.get_option_expirations(underlying_symbol, underlying_type)
             if not expirations:
-                logger.warning(f"No expirations found for {underlying_symbol}")
+                logger.warning("No expirations found for {}", underlying_symbol)
                 return None
             
-            # Filter expirations by DTE
             today = date.today()
-            target_expirations = [
-                exp for exp in expirations
-                if config.option_dte_min <= (exp - today).days <= config.option_dte_max
-            ]
+            target_expirations = self._target_expirations(expirations, today)
             
-            # Fallback to wider range if needed
             if not target_expirations:
-                target_expirations = [
-                    exp for exp in expirations
-                    if config.option_dte_fallback_min <= (exp - today).days <= config.option_dte_fallback_max
-                ]
-            
-            if not target_expirations:
-                logger.warning(f"No suitable expirations found for {underlying_symbol}")
+                logger.warning("No suitable expirations found for {}", underlying_symbol)
                 return None
             
             # Public does not allow opening same-day expiring option positions after 3:30 PM ET
-            if is_after_same_day_option_cutoff_et():
-                target_expirations = [e for e in target_expirations if e > today]
+            if target_expirations[0] == today and is_after_same_day_option_cutoff_et(now):
+                target_expirations = target_expirations[bisect_right(target_expirations, today):]
                 if not target_expirations:
                     logger.warning(
                         "No expirations left after excluding same-day (Public cutoff 3:30 PM ET)."
@@ -512,95 +1066,91 @@ class MarketDataManager:
             target_min = underlying_price * config.strike_range_min
             target_max = underlying_price * config.strike_range_max
             chains_tried = 0
-            for expiration in sorted(target_expirations):
-                chain = self.get_option_chain(underlying_symbol, expiration, underlying_type)
+            for expiration, chain in self._prefetch_option_chains(
+                underlying_symbol, target_expirations, underlying_type
+            ):
                 if not chain:
                     continue
                 chains_tried += 1
                 
                 # Filter CALLs only
                 calls = chain.calls if hasattr(chain, 'calls') else []
+                calls = calls or []
+                # Strike/OI arrays shared by max pain and the selection filter
+                call_arrays = self._strike_oi_arrays(calls)
                 
                 # Find strike closest to target range (spot * 1.00 to 1.10)
                 max_pain_strike = None
                 if config.use_max_pain_for_selection:
-                    max_pain_result = self.compute_max_pain(chain)
+                    max_pain_result = self.compute_max_pain(chain, call_arrays)
                     if max_pain_result is not None:
                         max_pain_strike, _ = max_pain_result
                 
-                best_contract = None
-                best_strike_diff = float('inf')
-                
-                for call in calls:
-                    if getattr(call, "strike", None) is None:
-                        continue
-                    strike = float(call.strike)
-                    
-                    # Check if strike is in range
-                    if strike < target_min or strike > target_max:
-                        continue
-                    
-                    # Liquidity filters
-                    bid = float(call.bid) if call.bid else None
-                    ask = float(call.ask) if call.ask else None
-                    
-                    if bid is None or ask is None:
-                        continue
-                    
-                    mid = (bid + ask) / 2
-                    spread_pct = (ask - bid) / mid if mid > 0 else float('inf')
-                    
-                    if spread_pct > config.max_bid_ask_spread_pct:
-                        continue
-                    
-                    # Check OI and volume if available
-                    oi = int(call.open_interest) if hasattr(call, 'open_interest') and call.open_interest else None
-                    volume = int(call.volume) if hasattr(call, 'volume') and call.volume else None
-                    
-                    if oi is not None and oi < config.min_open_interest:
-                        continue
-                    if volume is not None and volume < config.min_volume:
-                        continue
-                    
-                    # Strategic pick: prefer strike closest to max pain when enabled, else closest to ATM
-                    if max_pain_strike is not None:
-                        strike_diff = abs(strike - max_pain_strike)
-                    else:
-                        strike_diff = abs(strike - underlying_price)
-                    if strike_diff < best_strike_diff:
-                        best_strike_diff = strike_diff
-                        best_contract = call
+                # Strategic pick: prefer strike closest to max pain when enabled, else closest to ATM
+                anchor = max_pain_strike if max_pain_strike is not None else underlying_price
+                pick = self._best_call(calls, target_min, target_max, anchor, call_arrays)
                 
-                if best_contract:
-                    osi_symbol = best_contract.symbol if hasattr(best_contract, "symbol") else None
-                    bid = getattr(best_contract, "bid", None)
-                    ask = getattr(best_contract, "ask", None)
-                    strike_val = getattr(best_contract, "strike", None)
-                    if osi_symbol and bid is not None and ask is not None and strike_val is not None:
-                        return {
-                            "osi_symbol": osi_symbol,
-                            "underlying": underlying_symbol,
-                            "expiration": expiration.isoformat(),
-                            "strike": float(strike_val),
-                            "bid": float(bid),
-                            "ask": float(ask),
-                            "mid": (float(bid) + float(ask)) / 2,
-                            "open_interest": int(best_contract.open_interest) if getattr(best_contract, "open_interest", None) else None,
-                            "volume": int(best_contract.volume) if getattr(best_contract, "volume", None) else None,
-                        }
+                if pick is not None:
+                    osi_symbol = getattr(pick.contract, "symbol", None)
+                    if osi_symbol:
+                        return SelectedContract(
+                            osi_symbol=osi_symbol,
+                            underlying=underlying_symbol,
+                            expiration=expiration.isoformat(),
+                            strike=pick.strike,
+                            bid=pick.bid,
+                            ask=pick.ask,
+                            mid=(pick.bid + pick.ask) / 2,
+                            open_interest=pick.open_interest,
+                            volume=pick.volume,
+                        )
             
-            reason = (
-                "no option chain data" if chains_tried == 0
-                else f"no call in strike {target_min:.1f}-{target_max:.1f} or failed spread/OI/volume (tried {chains_tried} expirations)"
-            )
-            logger.warning(f"No suitable option contract found for {underlying_symbol}: {reason}")
+            if chains_tried == 0:
+                logger.warning("No suitable option contract found for {}: no option chain data", underlying_symbol)
+            else:
+                logger.warning(
+                    "No suitable option contract found for {}: no call in strike {:.1f}-{:.1f} "
+                    "or failed spread/OI/volume (tried {} expirations)",
+                    underlying_symbol, target_min, target_max, chains_tried,
+                )
             return None
             
         except Exception as e:
-            logger.error(f"Error selecting option contract for {underlying_symbol}: {e}")
+            logger.error("Error selecting option contract for {}: {}", underlying_symbol, e)
             return None
     
+    def select_option_contracts_bulk(
+        self,
+        requests: List[Tuple[str, float]],
+        underlying_type: InstrumentType = InstrumentType.EQUITY
+    ) -> Dict[str, Optional[SelectedContract]]:
+        """Select option contracts for several underlyings concurrently.
+        
+        Args:
+            requests: List of (underlying_symbol, underlying_price)
+            underlying_type: Type of underlying instrument
+            
+        Returns:
+            Dictionary mapping underlying symbol to SelectedContract (None if no valid contract)
+        """
+        if not requests:
+            return {}
+        result: Dict[str, Optional[SelectedContract]] = {}
+        now = now_et()
+        with ThreadPoolExecutor(max_workers=min(_SELECTION_MAX_WORKERS, len(requests))) as pool:
+            futures = {
+                pool.submit(self.select_option_contract, symbol, price, underlying_type, now): symbol
+                for symbol, price in requests
+            }
+            for future in as_completed(futures):
+                result[futures[future]] = future.result()
+        return result
+    
     def clear_cache(self):
-        """Clear the quote cache."""
+        """Clear the quote, bid/ask, option expiration, option chain, and request instrument caches."""
         self._quote_cache.clear()
+        self._bid_ask_cache.clear()
+        self._expirations_cache.clear()
+        self._chain_cache.clear()
+        self._order_instruments.clear()
         logger.debug("Quote cache cleared")
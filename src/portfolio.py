@@ -1,9 +1,14 @@
 """Portfolio allocation and position tracking."""
 import re
-from typing import Dict, List, Optional
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 from loguru import logger
 from datetime import date
 
+import numpy as np
+
 from public_api_sdk import InstrumentType
 
 from src.client import TradingClient
@@ -11,9 +16,92 @@ from src.market_data import MarketDataManager
 from src.config import config
 from src.utils.sdk_serializer import extract_portfolio_position_data, extract_portfolio_data
 
+_OPTION_SUFFIX = "-OPTION"  # API may return option symbols with this suffix
+_OSI_LEADING_ALPHA_RE = re.compile(r"^([A-Z]+)")
+
+
+def _strip_option_suffix(symbol: str) -> str:
+    """Drop a trailing -OPTION (literal suffix check; no regex)."""
+    return symbol[:-len(_OPTION_SUFFIX)] if symbol.endswith(_OPTION_SUFFIX) else symbol
+
+
+def _coerce_float(x: Any) -> float:
+    """Coerce an API amount to float (0.0 if it cannot be read).
+
+    Handles plain numbers, Decimal and numeric strings, lists (summed) and objects
+    carrying the amount in .value, .buying_power or .cash_only_buying_power.
+    """
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        pass
+    if isinstance(x, list):
+        return sum(_coerce_float(v) for v in x)
+    for attr in ("value", "buying_power", "cash_only_buying_power"):
+        v = getattr(x, attr, None)
+        if v is not None:
+            try:
+                return float(v)
+            except (TypeError, ValueError):
+                return 0.0
+    return 0.0
+
+
+def _intern(s: Optional[str]) -> Optional[str]:
+    """sys.intern for plain str values; anything else is returned unchanged."""
+    return sys.intern(s) if type(s) is str else s
+
+
+def _parse_osi(s: str) -> Optional[Tuple[str, str, str, str]]:
+    """Split an OSI symbol (SYMBOL + YYMMDD + C/P + STRIKE*1000 as 8 digits).
+
+    The fields after the ticker have fixed widths, so they are sliced from the end
+    of the string. Returns (underlying, date_str, option_type, strike_str), or None
+    if s is not a well-formed OSI symbol.
+    """
+    if len(s) < 16 or not s.isascii():
+        return None
+    opt_char = s[-9]
+    if opt_char not in ("C", "P"):
+        return None
+    strike_str = s[-8:]
+    date_str = s[-15:-9]
+    underlying = s[:-15]
+    if not (underlying.isalpha() and underlying.isupper() and strike_str.isdigit() and date_str.isdigit()):
+        return None
+    return underlying, date_str, opt_char, strike_str
+
+
+# Allocation buckets; the index is the int8 code used in _position_columns
+_THEME_KEYS = ("theme_a", "theme_b", "theme_c", "moonshot")
+_ASSET_CLASSES = ("equity", "crypto", "bonds", "alt")
+_ASSET_CLASS = {
+    InstrumentType.CRYPTO: "crypto",
+    InstrumentType.BOND: "bonds",
+    InstrumentType.TREASURY: "bonds",
+    InstrumentType.ALT: "alt",
+}
+_ASSET_CLASS_CODE = {instrument_type: _ASSET_CLASSES.index(cls) for instrument_type, cls in _ASSET_CLASS.items()}
+
+# Helpers called back-to-back (equity, cash, buying power, breakdowns) share one response
+_PORTFOLIO_CACHE_TTL_SEC = 2.0
+
 
 class Position:
     """Represents a single position."""
+
+    # expiration is a property backed by _expiration (string) and _expiration_date (parsed)
+    __slots__ = (
+        "symbol",
+        "quantity",
+        "entry_price",
+        "instrument_type",
+        "osi_symbol",
+        "_expiration",
+        "_expiration_date",
+        "strike",
+        "underlying",
+    )
     
     def __init__(
         self,
@@ -38,14 +126,20 @@ class Position:
             strike: Strike price for options
             underlying: Underlying symbol for options
         """
-        self.symbol = symbol
+        # Interned: symbols key self.positions and repeat across OSI/underlying lookups
+        self.symbol = _intern(symbol)
         self.quantity = quantity
         self.entry_price = entry_price
         self.instrument_type = instrument_type
         self.osi_symbol = osi_symbol
         self.expiration = expiration
         self.strike = strike
-        self.underlying = underlying
+        if instrument_type == InstrumentType.OPTION and not underlying and symbol:
+            # Derive underlying from OSI (e.g. "UMC250117C00100000" or "AMPX...-OPTION")
+            letter_match = _OSI_LEADING_ALPHA_RE.match(_strip_option_suffix(str(symbol)).strip())
+            if letter_match:
+                underlying = letter_match.group(1)
+        self.underlying = _intern(underlying)
     
     def get_market_value(self, current_price: float) -> float:
         """Calculate current market value.
@@ -82,21 +176,34 @@ class Position:
             return 0.0
         return ((current_price - self.entry_price) / self.entry_price) * 100
     
-    def get_dte(self) -> Optional[int]:
+    @property
+    def expiration(self) -> Optional[str]:
+        """Expiration date string (YYYY-MM-DD) for options."""
+        return self._expiration
+
+    @expiration.setter
+    def expiration(self, value: Optional[str]) -> None:
+        # Parsed once here so get_dte() does no string parsing per call
+        self._expiration = value
+        self._expiration_date: Optional[date] = None
+        if value:
+            try:
+                self._expiration_date = date.fromisoformat(value)
+            except (ValueError, TypeError) as e:
+                logger.debug("Could not parse expiration date '{}': {}", value, e)
+
+    def get_dte(self, today: Optional[date] = None) -> Optional[int]:
         """Get days to expiration for options.
         
+        Args:
+            today: Reference date (defaults to date.today(); pass it when looping over positions)
+        
         Returns:
             Days to expiration or None if not an option
         """
-        if not self.expiration:
-            return None
-        
-        try:
-            exp_date = date.fromisoformat(self.expiration)
-            return (exp_date - date.today()).days
-        except (ValueError, TypeError) as e:
-            logger.debug(f"Could not parse expiration date '{self.expiration}': {e}")
+        if self._expiration_date is None:
             return None
+        return (self._expiration_date - (today or date.today())).days
     
     def is_itm(self, underlying_price: float) -> bool:
         """Check if option is in the money.
@@ -114,6 +221,96 @@ class Position:
         return underlying_price > self.strike
 
 
+def _position_from_data(pos_data: Dict[str, Any]) -> Optional[Position]:
+    """Build a Position from extracted portfolio position fields (None to skip the row)."""
+    symbol = pos_data.get("symbol")
+    if not symbol:
+        return None
+
+    quantity = pos_data.get("quantity") or 0
+    if quantity == 0:
+        return None
+
+    instrument_type = InstrumentType.EQUITY
+    instrument_type_str = pos_data.get("instrument_type")
+    if isinstance(instrument_type_str, str):
+        type_upper = instrument_type_str.upper()
+        if "OPTION" in type_upper:
+            instrument_type = InstrumentType.OPTION
+        elif "CRYPTO" in type_upper:
+            instrument_type = InstrumentType.CRYPTO
+
+    # Extract entry price (prefer unit_cost, fallback to average_cost or calculated)
+    entry_price = pos_data.get("unit_cost") or pos_data.get("average_cost") or 0.0
+    if entry_price == 0.0 and quantity > 0:
+        total_cost = pos_data.get("total_cost")
+        if total_cost:
+            entry_price = total_cost / quantity
+
+    if instrument_type != InstrumentType.OPTION:
+        return Position(symbol=symbol, quantity=quantity, entry_price=entry_price, instrument_type=instrument_type)
+
+    # For options, parse OSI symbol to extract underlying, strike, expiration
+    # API may return symbol with suffix e.g. "AMPX260320C00014000-OPTION"
+    underlying = None
+    strike = None
+    expiration = None
+    osi_clean = _strip_option_suffix(str(symbol)).strip()
+    try:
+        parsed = _parse_osi(osi_clean)
+        if parsed:
+            underlying, date_str, _option_type, strike_str = parsed
+            # For OSI format, YY is always in current century (2000-2099)
+            expiration = f"20{date_str[:2]}-{date_str[2:4]}-{date_str[4:6]}"
+            strike = int(strike_str) / 1000.0
+        # Otherwise Position falls back to the leading letters as the underlying
+    except Exception as e:
+        logger.debug("Could not parse OSI symbol {}: {}", symbol, e)
+
+    return Position(
+        symbol=symbol,
+        quantity=quantity,
+        entry_price=entry_price,
+        instrument_type=instrument_type,
+        osi_symbol=symbol,
+        expiration=expiration,
+        strike=strike,
+        underlying=underlying,
+    )
+
+
+def build_positions(raw_positions: Iterable[Any]) -> List[Position]:
+    """Convert SDK portfolio positions to Position objects, skipping empty or unreadable rows.
+
+    Args:
+        raw_positions: PortfolioPosition objects (or dicts) from the portfolio response
+
+    Returns:
+        Positions in response order
+    """
+    positions: List[Position] = []
+    append = positions.append
+    for pos in raw_positions:
+        try:
+            # Use comprehensive serializer to extract ALL fields
+            position = _position_from_data(extract_portfolio_position_data(pos))
+        except Exception as e:
+            logger.warning(f"Error loading position: {e}", exc_info=True)
+            continue
+        if position is not None:
+            append(position)
+            logger.debug("Loaded position: {} x{} @ ${:.2f}", position.symbol, position.quantity, position.entry_price)
+    return positions
+
+
+class PortfolioSnapshot(NamedTuple):
+    """Account totals and allocations read from a single portfolio response."""
+    equity: float
+    buying_power: float
+    cash: float
+    allocations: Dict[str, float]
+
+
 class PortfolioManager:
     """Manages portfolio allocation and position tracking."""
     
@@ -127,16 +324,37 @@ class PortfolioManager:
         self.client = client
         self.data_manager = data_manager
         self.positions: Dict[str, Position] = {}  # symbol -> Position
+        self._portfolio_cache: Optional[Any] = None
+        self._portfolio_cache_ts = 0.0
+        # (positions/config fingerprint, grouping) from the last get_positions_by_theme
+        self._themes_cache: Optional[Tuple[tuple, Dict[str, List[Position]]]] = None
+        # (same fingerprint, _position_columns result)
+        self._columns_cache: Optional[Tuple[tuple, Tuple[List[Position], np.ndarray, np.ndarray]]] = None
         logger.info("Portfolio manager initialized")
+
+    def _get_portfolio(self) -> Any:
+        """Portfolio response, reused for _PORTFOLIO_CACHE_TTL_SEC across helper calls."""
+        now = time.monotonic()
+        if self._portfolio_cache is not None and now - self._portfolio_cache_ts < _PORTFOLIO_CACHE_TTL_SEC:
+            return self._portfolio_cache
+        portfolio = self.client.client.get_portfolio(self.client.account_number)
+        self._portfolio_cache = portfolio
+        self._portfolio_cache_ts = now
+        return portfolio
+
+    def invalidate_portfolio_cache(self) -> None:
+        """Force the next portfolio read to hit the API (e.g. after an order fills)."""
+        self._portfolio_cache = None
     
     def refresh_portfolio(self):
         """Refresh portfolio data from API."""
         try:
-            portfolio = self.client.client.get_portfolio(self.client.account_number)
+            self.invalidate_portfolio_cache()
+            portfolio = self._get_portfolio()
             
-            # Get equity and buying power with proper handling
-            equity = self.get_equity()
-            buying_power = self.get_buying_power()
+            # Get equity and buying power with proper handling (from the response already fetched)
+            equity = self.get_equity(portfolio)
+            buying_power = self.get_buying_power(portfolio)
             
             # Clear existing positions before loading fresh ones
             self.positions.clear()
@@ -144,82 +362,8 @@ class PortfolioManager:
             # Load positions from portfolio response using comprehensive extraction
             # PortfolioPosition structure: instrument.symbol, quantity, cost_basis.unit_cost, etc.
             if hasattr(portfolio, 'positions') and portfolio.positions:
-                for pos in portfolio.positions:
-                    try:
-                        # Use comprehensive serializer to extract ALL fields
-                        pos_data = extract_portfolio_position_data(pos)
-                        
-                        symbol = pos_data.get("symbol")
-                        if not symbol:
-                            continue
-                        
-                        quantity = pos_data.get("quantity") or 0
-                        if quantity == 0:
-                            continue
-                        
-                        instrument_type_str = pos_data.get("instrument_type")
-                        if isinstance(instrument_type_str, str):
-                            # Convert string to InstrumentType enum
-                            instrument_type = InstrumentType.EQUITY
-                            if "OPTION" in instrument_type_str.upper():
-                                instrument_type = InstrumentType.OPTION
-                            elif "CRYPTO" in instrument_type_str.upper():
-                                instrument_type = InstrumentType.CRYPTO
-                        else:
-                            instrument_type = InstrumentType.EQUITY
-                        
-                        # Extract entry price (prefer unit_cost, fallback to average_cost or calculated)
-                        entry_price = pos_data.get("unit_cost") or pos_data.get("average_cost") or 0.0
-                        if entry_price == 0.0 and pos_data.get("total_cost") and quantity > 0:
-                            entry_price = pos_data.get("total_cost") / quantity
-                        
-                        # For options, parse OSI symbol to extract underlying, strike, expiration
-                        osi_symbol = symbol if instrument_type == InstrumentType.OPTION else None
-                        underlying = None
-                        strike = None
-                        expiration = None
-                        
-                        if instrument_type == InstrumentType.OPTION and osi_symbol:
-                            # Parse OSI format: SYMBOL + YYMMDD + C/P + STRIKE*1000 (8 digits)
-                            # API may return symbol with suffix e.g. "AMPX260320C00014000-OPTION"
-                            osi_clean = re.sub(r"-OPTION$", "", str(osi_symbol)).strip()
-                            try:
-                                match = re.match(r'^([A-Z]+)(\d{6})([CP])(\d{8})$', osi_clean)
-                                if match:
-                                    underlying = match.group(1)
-                                    date_str = match.group(2)
-                                    option_type = match.group(3)
-                                    strike_str = match.group(4)
-                                    yy = int(date_str[:2])
-                                    mm = int(date_str[2:4])
-                                    dd = int(date_str[4:6])
-                                    # For OSI format, YY is always in current century (2000-2099)
-                                    year = 2000 + yy
-                                    expiration = f"{year:04d}-{mm:02d}-{dd:02d}"
-                                    strike = float(strike_str) / 1000.0
-                                else:
-                                    # Fallback: underlying = leading letters before first digit
-                                    letter_match = re.match(r"^([A-Z]+)", osi_clean)
-                                    if letter_match:
-                                        underlying = letter_match.group(1)
-                            except Exception as e:
-                                logger.debug(f"Could not parse OSI symbol {osi_symbol}: {e}")
-                        
-                        position = Position(
-                            symbol=symbol,
-                            quantity=quantity,
-                            entry_price=entry_price,
-                            instrument_type=instrument_type,
-                            osi_symbol=osi_symbol,
-                            expiration=expiration,
-                            strike=strike,
-                            underlying=underlying
-                        )
-                        self.positions[symbol] = position
-                        logger.debug(f"Loaded position: {symbol} x{quantity} @ ${entry_price:.2f}")
-                    except Exception as e:
-                        logger.warning(f"Error loading position: {e}", exc_info=True)
-                        continue
+                for position in build_positions(portfolio.positions):
+                    self.positions[position.symbol] = position
             
             logger.info(f"Portfolio refreshed: equity=${equity:.2f}, buying_power=${buying_power:.2f}")
             
@@ -234,57 +378,40 @@ class PortfolioManager:
             Dictionary with all portfolio fields including comprehensive position data
         """
         try:
-            portfolio = self.client.client.get_portfolio(self.client.account_number)
+            portfolio = self._get_portfolio()
             portfolio_data = extract_portfolio_data(portfolio)
             
             # Add calculated fields
-            portfolio_data["equity"] = self.get_equity()
-            portfolio_data["buying_power"] = self.get_buying_power()
-            portfolio_data["cash"] = self.get_cash()
+            portfolio_data["equity"] = self.get_equity(portfolio)
+            portfolio_data["buying_power"] = self.get_buying_power(portfolio)
+            portfolio_data["cash"] = self.get_cash(portfolio)
             
             return portfolio_data
         except Exception as e:
             logger.error(f"Error getting comprehensive portfolio: {e}")
             return {}
     
-    def get_equity(self) -> float:
+    def get_equity(self, portfolio: Optional[Any] = None) -> float:
         """Get current portfolio equity.
         
+        Args:
+            portfolio: Portfolio response to read from (fetched from API if not provided)
+        
         Returns:
             Equity value (sum of all asset-type values from API, or cash when API equity is 0).
         """
         try:
-            portfolio = self.client.client.get_portfolio(self.client.account_number)
-            equity = portfolio.equity
-            
-            # Handle different response formats
-            if isinstance(equity, list):
-                # API returns List[PortfolioEquity] with .value (Decimal) per asset type
-                total = 0.0
-                for x in equity:
-                    if isinstance(x, (int, float)):
-                        total += float(x)
-                    elif hasattr(x, "value"):
-                        total += float(x.value)
-                    elif hasattr(x, "__float__"):
-                        total += float(x)
-                equity = total if total > 0 else 0.0
-            elif hasattr(equity, "__float__"):
-                equity = float(equity)
-            elif hasattr(equity, "value"):
-                equity = float(equity.value)
-            elif isinstance(equity, str):
-                equity = float(equity)
-            else:
-                try:
-                    equity = float(equity)
-                except (TypeError, ValueError):
-                    logger.warning(f"Unexpected equity type: {type(equity)}, value: {equity}")
-                    equity = 0.0
+            if portfolio is None:
+                portfolio = self._get_portfolio()
+            raw_equity = portfolio.equity
+            # API returns List[PortfolioEquity] with .value (Decimal) per asset type
+            equity = _coerce_float(raw_equity)
+            if isinstance(raw_equity, list) and equity < 0:
+                equity = 0.0
 
             # Fallback: API may return 0 equity for cash-only; use cash as effective equity
             if equity == 0:
-                cash = self.get_cash()
+                cash = self.get_cash(portfolio)
                 if cash > 0:
                     equity = cash
             return float(equity)
@@ -292,96 +419,46 @@ class PortfolioManager:
             logger.error(f"Error getting equity: {e}")
             return 0.0
     
-    def get_buying_power(self) -> float:
+    def get_buying_power(self, portfolio: Optional[Any] = None) -> float:
         """Get current buying power.
         
+        Args:
+            portfolio: Portfolio response to read from (fetched from API if not provided)
+        
         Returns:
             Buying power value
         """
         try:
-            portfolio = self.client.client.get_portfolio(self.client.account_number)
-            buying_power = portfolio.buying_power
-            
-            # Handle different response formats
-            if isinstance(buying_power, list):
-                if len(buying_power) == 0:
-                    buying_power = 0.0
-                elif len(buying_power) == 1:
-                    buying_power = buying_power[0] if isinstance(buying_power[0], (int, float)) else 0.0
-                else:
-                    # Multiple values - sum them
-                    buying_power = sum(float(x) for x in buying_power if isinstance(x, (int, float)))
-            elif hasattr(buying_power, 'buying_power'):
-                # BuyingPower object with buying_power attribute
-                bp_value = buying_power.buying_power
-                buying_power = float(bp_value) if hasattr(bp_value, '__float__') else float(bp_value)
-            elif hasattr(buying_power, 'cash_only_buying_power'):
-                # BuyingPower object - use cash_only_buying_power as fallback
-                bp_value = buying_power.cash_only_buying_power
-                buying_power = float(bp_value) if hasattr(bp_value, '__float__') else float(bp_value)
-            elif hasattr(buying_power, '__float__'):
-                # Object with __float__ method (like Decimal)
-                buying_power = float(buying_power)
-            elif hasattr(buying_power, 'value'):
-                # Object with value attribute
-                buying_power = float(buying_power.value)
-            elif isinstance(buying_power, str):
-                buying_power = float(buying_power)
-            else:
-                try:
-                    buying_power = float(buying_power)
-                except (TypeError, ValueError):
-                    logger.warning(f"Unexpected buying_power type: {type(buying_power)}, value: {buying_power}")
-                    buying_power = 0.0
-            
-            return float(buying_power)
+            if portfolio is None:
+                portfolio = self._get_portfolio()
+            # BuyingPower object (buying_power / cash_only_buying_power), Decimal, list or str
+            return _coerce_float(portfolio.buying_power)
         except Exception as e:
             logger.error(f"Error getting buying_power: {e}")
             return 0.0
     
-    def get_cash(self) -> float:
+    def get_cash(self, portfolio: Optional[Any] = None) -> float:
         """Get cash balance.
         
+        Args:
+            portfolio: Portfolio response to read from (fetched from API if not provided)
+        
         Returns:
             Cash balance
         """
         try:
-            portfolio = self.client.client.get_portfolio(self.client.account_number)
+            if portfolio is None:
+                portfolio = self._get_portfolio()
             
             # Try to get cash directly
             if hasattr(portfolio, 'cash'):
-                cash = portfolio.cash
-                # Handle different response formats
-                if isinstance(cash, list):
-                    if len(cash) == 0:
-                        cash = 0.0
-                    elif len(cash) == 1:
-                        cash = cash[0] if isinstance(cash[0], (int, float)) else 0.0
-                    else:
-                        # Multiple values - sum them
-                        cash = sum(float(x) for x in cash if isinstance(x, (int, float)))
-                elif hasattr(cash, '__float__'):
-                    # Object with __float__ method (like Decimal)
-                    cash = float(cash)
-                elif hasattr(cash, 'value'):
-                    # Object with value attribute
-                    cash = float(cash.value)
-                elif isinstance(cash, str):
-                    cash = float(cash)
-                else:
-                    try:
-                        cash = float(cash)
-                    except (TypeError, ValueError):
-                        logger.warning(f"Unexpected cash type: {type(cash)}, value: {cash}")
-                        cash = 0.0
-                return float(cash)
+                return _coerce_float(portfolio.cash)
             else:
                 # Fallback to cash_only_buying_power from buying_power object if available
                 if hasattr(portfolio, 'buying_power') and hasattr(portfolio.buying_power, 'cash_only_buying_power'):
-                    bp_value = portfolio.buying_power.cash_only_buying_power
-                    return float(bp_value) if hasattr(bp_value, '__float__') else float(bp_value)
+                    return float(portfolio.buying_power.cash_only_buying_power)
                 # Otherwise fallback to buying power
-                return self.get_buying_power()
+                return self.get_buying_power(portfolio)
         except Exception as e:
             logger.error(f"Error getting cash: {e}")
             return 0.0
@@ -389,9 +466,19 @@ class PortfolioManager:
     def get_positions_by_theme(self) -> Dict[str, List[Position]]:
         """Get positions grouped by theme.
         
+        The grouping is reused until the set of Position objects or the theme config
+        changes (refresh_portfolio builds new objects, so a refresh always regroups).
+        
         Returns:
             Dictionary mapping theme name to list of positions
         """
+        key = (
+            tuple(map(id, self.positions.values())),
+            tuple(config.theme_underlyings),
+            config.moonshot_symbol,
+        )
+        if self._themes_cache is not None and self._themes_cache[0] == key:
+            return {theme: list(members) for theme, members in self._themes_cache[1].items()}
         themes = {
             "theme_a": [],  # UMC
             "theme_b": [],  # TE
@@ -399,37 +486,40 @@ class PortfolioManager:
             "moonshot": [],
         }
         
-        theme_symbols = config.theme_underlyings
+        # Underlying -> theme key (first listed theme wins if a symbol repeats)
+        theme_map: Dict[str, str] = {}
+        for symbol, theme in zip(config.theme_underlyings, _THEME_KEYS[:3]):
+            theme_map.setdefault(symbol, theme)
+        moonshot_symbol = config.moonshot_symbol
         for position in self.positions.values():
             # Moonshot: match by symbol (e.g. GME.WS)
-            if position.symbol == config.moonshot_symbol:
+            if position.symbol == moonshot_symbol:
                 themes["moonshot"].append(position)
                 continue
-            # Theme A/B/C: options by underlying, or equity by symbol
-            underlying = position.underlying
-            if position.instrument_type == InstrumentType.OPTION and not underlying and position.symbol:
-                # Derive underlying from OSI (e.g. "UMC250117C00100000" or "AMPX...-OPTION")
-                base = re.sub(r"-OPTION$", "", str(position.symbol)).strip()
-                letter_match = re.match(r"^([A-Z]+)", base)
-                if letter_match:
-                    underlying = letter_match.group(1)
-            symbol_for_theme = underlying or position.symbol
-            if symbol_for_theme == theme_symbols[0]:
-                themes["theme_a"].append(position)
-            elif len(theme_symbols) > 1 and symbol_for_theme == theme_symbols[1]:
-                themes["theme_b"].append(position)
-            elif len(theme_symbols) > 2 and symbol_for_theme == theme_symbols[2]:
-                themes["theme_c"].append(position)
-        
-        return themes
+            # Theme A/B/C: options by underlying (set from OSI at construction), or equity by symbol
+            theme = theme_map.get(position.underlying or position.symbol)
+            if theme is not None:
+                themes[theme].append(position)
+        
+        self._themes_cache = (key, themes)
+        return {theme: list(members) for theme, members in themes.items()}
     
-    def get_current_allocations(self) -> Dict[str, float]:
+    def get_current_allocations(
+        self,
+        equity: Optional[float] = None,
+        cash: Optional[float] = None,
+    ) -> Dict[str, float]:
         """Calculate current allocations as percentages of equity.
         
+        Args:
+            equity: Equity already read this cycle (fetched if not provided)
+            cash: Cash already read this cycle (fetched if not provided)
+        
         Returns:
             Dictionary with allocation percentages
         """
-        equity = self.get_equity()
+        if equity is None:
+            equity = self.get_equity()
         if equity == 0:
             return {
                 "theme_a": 0.0,
@@ -439,27 +529,16 @@ class PortfolioManager:
                 "cash": 0.0,
             }
         
-        themes = self.get_positions_by_theme()
+        positions, theme_codes, _ = self._position_columns()
+        self._prefetch_quotes(positions)
         
-        # Calculate market values
-        theme_a_value = sum(
-            pos.get_market_value(self.get_position_price(pos))
-            for pos in themes["theme_a"]
-        )
-        theme_b_value = sum(
-            pos.get_market_value(self.get_position_price(pos))
-            for pos in themes["theme_b"]
-        )
-        theme_c_value = sum(
-            pos.get_market_value(self.get_position_price(pos))
-            for pos in themes["theme_c"]
-        )
-        moonshot_value = sum(
-            pos.get_market_value(self.get_position_price(pos))
-            for pos in themes["moonshot"]
-        )
+        # Calculate market values (last bucket collects positions outside every theme)
+        theme_a_value, theme_b_value, theme_c_value, moonshot_value, _ = np.bincount(
+            theme_codes, weights=self._position_market_values(positions), minlength=len(_THEME_KEYS) + 1
+        ).tolist()
         
-        cash = self.get_cash()
+        if cash is None:
+            cash = self.get_cash()
         
         return {
             "theme_a": theme_a_value / equity,
@@ -469,6 +548,58 @@ class PortfolioManager:
             "cash": cash / equity,
         }
 
+    def _position_columns(self) -> Tuple[List[Position], np.ndarray, np.ndarray]:
+        """Positions with parallel int8 theme and asset-class code columns.
+
+        Codes index _THEME_KEYS (len(_THEME_KEYS) = no theme) and _ASSET_CLASSES. They only
+        depend on which Position objects are held and the theme config, so they are rebuilt
+        when get_positions_by_theme regroups. Quantities are not cached here because
+        add_position/remove_position change them in place.
+        """
+        themes = self.get_positions_by_theme()
+        key = self._themes_cache[0]
+        if self._columns_cache is not None and self._columns_cache[0] == key:
+            return self._columns_cache[1]
+        positions = list(self.positions.values())
+        n = len(positions)
+        theme_of = {id(pos): code for code, theme in enumerate(_THEME_KEYS) for pos in themes[theme]}
+        no_theme = len(_THEME_KEYS)
+        theme_codes = np.fromiter((theme_of.get(id(pos), no_theme) for pos in positions), dtype=np.int8, count=n)
+        type_codes = np.fromiter(
+            (_ASSET_CLASS_CODE.get(pos.instrument_type, 0) for pos in positions),  # 0 = "equity"
+            dtype=np.int8,
+            count=n,
+        )
+        columns = (positions, theme_codes, type_codes)
+        self._columns_cache = (key, columns)
+        return columns
+
+    def _position_market_values(self, positions: List[Position]) -> np.ndarray:
+        """Market value (quantity x current price) per position as a float64 array.
+
+        One pass: each position is priced once and its value written straight into the array.
+        """
+        get_price = self.get_position_price
+        return np.fromiter(
+            (pos.get_market_value(get_price(pos)) for pos in positions), dtype=np.float64, count=len(positions)
+        )
+
+    def get_snapshot(self) -> PortfolioSnapshot:
+        """Read equity, buying power, cash and allocations from one portfolio request.
+
+        Returns:
+            PortfolioSnapshot for the current account state
+        """
+        portfolio = self._get_portfolio()
+        equity = self.get_equity(portfolio)
+        cash = self.get_cash(portfolio)
+        return PortfolioSnapshot(
+            equity=equity,
+            buying_power=self.get_buying_power(portfolio),
+            cash=cash,
+            allocations=self.get_current_allocations(equity=equity, cash=cash),
+        )
+
     def _classify_asset_type(self, instrument_type: InstrumentType) -> str:
         """Map InstrumentType to asset class bucket.
 
@@ -478,14 +609,8 @@ class PortfolioManager:
         Returns:
             Asset class: "equity", "crypto", "bonds", "alt"
         """
-        if instrument_type == InstrumentType.CRYPTO:
-            return "crypto"
-        elif instrument_type in (InstrumentType.BOND, InstrumentType.TREASURY):
-            return "bonds"
-        elif instrument_type == InstrumentType.ALT:
-            return "alt"
-        else:  # EQUITY, OPTION, INDEX, MULTI_LEG_INSTRUMENT
-            return "equity"
+        # EQUITY, OPTION, INDEX, MULTI_LEG_INSTRUMENT fall through to equity
+        return _ASSET_CLASS.get(instrument_type, "equity")
 
     def get_allocations_by_type(self) -> Dict[str, Dict[str, float]]:
         """Calculate portfolio allocation by asset type.
@@ -515,19 +640,13 @@ class PortfolioManager:
                 "cash": {"pct": 0.0, "value": 0.0},
             }
 
-        # Initialize type value accumulators
-        type_values = {
-            "equity": 0.0,
-            "crypto": 0.0,
-            "bonds": 0.0,
-            "alt": 0.0,
-        }
-
         # Sum market values per asset type
-        for position in self.positions.values():
-            asset_type = self._classify_asset_type(position.instrument_type)
-            market_value = position.get_market_value(self.get_position_price(position))
-            type_values[asset_type] += market_value
+        positions, _, type_codes = self._position_columns()
+        self._prefetch_quotes(positions)
+        sums = np.bincount(
+            type_codes, weights=self._position_market_values(positions), minlength=len(_ASSET_CLASSES)
+        )
+        type_values = dict(zip(_ASSET_CLASSES, sums.tolist()))
 
         # Add cash
         cash = self.get_cash()
@@ -569,16 +688,58 @@ class PortfolioManager:
         """
         equity = self.get_equity()
         targets = self.get_target_allocations()
-        current = self.get_current_allocations()
+        current = self.get_current_allocations(equity=equity)
         
         needs = {}
-        for theme in ["theme_a", "theme_b", "theme_c", "moonshot"]:
+        for theme in _THEME_KEYS:
             target_value = equity * targets[theme]
             current_value = equity * current[theme]
             needs[theme] = target_value - current_value
         
         return needs
     
+    def _prefetch_quotes(self, positions: Iterable[Position], include_underlyings: bool = False) -> None:
+        """Warm the market data quote cache for positions with one request per instrument type.
+
+        The option and equity requests run concurrently. get_position_price then reads each
+        price from the cache instead of issuing a quote request per position. Failures are
+        logged; prices fall back to per-symbol lookups.
+
+        Args:
+            positions: Positions about to be priced
+            include_underlyings: Also fetch option underlyings (used by the breakdown display)
+        """
+        option_symbols: Dict[str, None] = {}
+        equity_symbols: Dict[str, None] = {}
+        for position in positions:
+            if position.instrument_type == InstrumentType.OPTION and position.osi_symbol:
+                option_symbols[position.osi_symbol] = None
+                if include_underlyings and position.underlying:
+                    equity_symbols[position.underlying] = None
+            else:
+                equity_symbols[position.symbol] = None
+        requests = [
+            (list(symbols), instrument_type)
+            for symbols, instrument_type in (
+                (option_symbols, InstrumentType.OPTION),
+                (equity_symbols, InstrumentType.EQUITY),
+            )
+            if symbols
+        ]
+
+        def _fetch(request: Tuple[List[str], InstrumentType]) -> None:
+            symbols, instrument_type = request
+            try:
+                self.data_manager.get_quotes(symbols, instrument_type)
+            except Exception as e:
+                logger.warning(f"Could not prefetch {instrument_type.value} quotes: {e}")
+
+        if len(requests) > 1:
+            with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+                list(executor.map(_fetch, requests))
+        elif requests:
+            _fetch(requests[0])
+
     def get_position_price(self, position: Position) -> float:
         """Get current price for a position. Always returns a float (never None).
         
@@ -624,28 +785,34 @@ class PortfolioManager:
         return fallback if fallback and fallback > 0 else (float(position.entry_price) if position.entry_price else 0.0)
 
     def display_portfolio_breakdown(self):
-        """Display comprehensive portfolio holdings breakdown."""
+        """Display comprehensive portfolio holdings breakdown.
+
+        Lines are collected and logged as one record, so the sinks take one write
+        for the whole report instead of one per line.
+        """
+        lines: List[str] = []
         equity = self.get_equity()
         buying_power = self.get_buying_power()
         cash = self.get_cash()
         
-        logger.info("")
-        logger.info("=" * 70)
-        logger.info("PORTFOLIO BREAKDOWN")
-        logger.info("=" * 70)
-        logger.info(f"Total Equity:     ${equity:>12,.2f}")
-        logger.info(f"Buying Power:     ${buying_power:>12,.2f}")
-        logger.info(f"Cash:             ${cash:>12,.2f}")
-        logger.info("")
-        
-        # Get allocations
-        current_allocations = self.get_current_allocations()
+        lines.append("")
+        lines.append("=" * 70)
+        lines.append("PORTFOLIO BREAKDOWN")
+        lines.append("=" * 70)
+        lines.append(f"Total Equity:     ${equity:>12,.2f}")
+        lines.append(f"Buying Power:     ${buying_power:>12,.2f}")
+        lines.append(f"Cash:             ${cash:>12,.2f}")
+        lines.append("")
+        
+        # Get allocations (equity/cash were just read; themes are grouped once and reused)
+        self._prefetch_quotes(self.positions.values(), include_underlyings=True)
+        current_allocations = self.get_current_allocations(equity=equity, cash=cash)
         target_allocations = self.get_target_allocations()
         themes = self.get_positions_by_theme()
         
         # Display allocation summary
-        logger.info("ALLOCATION SUMMARY")
-        logger.info("-" * 70)
+        lines.append("ALLOCATION SUMMARY")
+        lines.append("-" * 70)
         theme_names = {
             "theme_a": f"Theme A ({config.theme_underlyings[0]})",
             "theme_b": f"Theme B ({config.theme_underlyings[1]})",
@@ -660,22 +827,24 @@ class PortfolioManager:
             current_value = equity * current_allocations.get(theme_key, 0.0)
             
             status = "✓" if abs(current_pct - target_pct) < 5 else "⚠"
-            logger.info(
+            lines.append(
                 f"{status} {theme_label:25s} "
                 f"Current: {current_pct:>6.1f}% (${current_value:>8,.2f}) | "
                 f"Target: {target_pct:>6.1f}%"
             )
         
-        logger.info("")
+        lines.append("")
         
         # Display positions by theme
+        today = date.today()
+        underlying_prices: Dict[str, float] = {}  # many options share an underlying
         total_positions_value = 0.0
         total_pnl = 0.0
         has_any_positions = any(len(positions) > 0 for key, positions in themes.items() if key != "cash")
         
         if not has_any_positions:
-            logger.info("No positions currently held.")
-            logger.info("")
+            lines.append("No positions currently held.")
+            lines.append("")
         
         for theme_key, theme_label in theme_names.items():
             if theme_key == "cash":
@@ -685,11 +854,13 @@ class PortfolioManager:
             if not positions:
                 continue
             
-            logger.info(f"{theme_label.upper()}")
-            logger.info("-" * 70)
+            lines.append(f"{theme_label.upper()}")
+            lines.append("-" * 70)
             
             theme_value = 0.0
             theme_pnl = 0.0
+            option_count = 0
+            equity_count = 0
             
             for position in positions:
                 current_price = self.get_position_price(position)
@@ -706,11 +877,17 @@ class PortfolioManager:
                 
                 # Format position display
                 if position.instrument_type == InstrumentType.OPTION:
-                    dte = position.get_dte()
+                    option_count += 1
+                    dte = position.get_dte(today)
                     dte_str = f"DTE: {dte}" if dte is not None else "DTE: N/A"
                     strike_str = f"Strike: ${position.strike:.2f}" if position.strike else "Strike: N/A"
                     underlying = position.underlying or "N/A"
-                    underlying_price = self.data_manager.get_quote(underlying) if underlying != "N/A" else 0
+                    underlying_price = underlying_prices.get(underlying)
+                    if underlying_price is None:
+                        underlying_price = (
+                            float(self.data_manager.get_quote(underlying) or 0.0) if underlying != "N/A" else 0.0
+                        )
+                        underlying_prices[underlying] = underlying_price
                     itm_str = "ITM" if position.is_itm(underlying_price) else "OTM"
                     
                     # Clean symbol display: show underlying + expiration + strike if available
@@ -719,35 +896,35 @@ class PortfolioManager:
                         display_symbol = f"{underlying} {exp_short} ${position.strike:.0f}C"
                     else:
                         # Fallback to cleaned OSI symbol
-                        display_symbol = re.sub(r"-OPTION$", "", position.symbol).strip()
+                        display_symbol = _strip_option_suffix(position.symbol).strip()
                     
-                    logger.info(
+                    lines.append(
                         f"  {display_symbol:20s} | "
                         f"Qty: {position.quantity:>4d} | "
                         f"Entry: ${position.entry_price:>7.2f} | "
                         f"Current: ${current_price:>7.2f} | "
                         f"Value: ${market_value:>8,.2f}"
                     )
-                    logger.info(
+                    lines.append(
                         f"    P/L: ${pnl:>8,.2f} ({pnl_pct:>+6.1f}%) | "
                         f"{dte_str} | {strike_str} | {itm_str} | "
                         f"Underlying: {underlying} @ ${underlying_price:.2f}"
                     )
                 else:
-                    logger.info(
+                    if position.instrument_type == InstrumentType.EQUITY:
+                        equity_count += 1
+                    lines.append(
                         f"  {position.symbol:20s} | "
                         f"Qty: {position.quantity:>4d} | "
                         f"Entry: ${position.entry_price:>7.2f} | "
                         f"Current: ${current_price:>7.2f} | "
                         f"Value: ${market_value:>8,.2f}"
                     )
-                    logger.info(
+                    lines.append(
                         f"    P/L: ${pnl:>8,.2f} ({pnl_pct:>+6.1f}%)"
                     )
             
-            # Count options vs equity in this theme
-            option_count = sum(1 for p in positions if p.instrument_type == InstrumentType.OPTION)
-            equity_count = sum(1 for p in positions if p.instrument_type == InstrumentType.EQUITY)
+            # Options vs equity in this theme (counted in the loop above)
             position_summary = []
             if option_count > 0:
                 position_summary.append(f"{option_count} option{'s' if option_count != 1 else ''}")
@@ -755,22 +932,23 @@ class PortfolioManager:
                 position_summary.append(f"{equity_count} equity position{'s' if equity_count != 1 else ''}")
             summary_str = f" ({', '.join(position_summary)})" if position_summary else ""
             
-            logger.info(f"  Theme Total: ${theme_value:>10,.2f} | P/L: ${theme_pnl:>10,.2f}{summary_str}")
-            logger.info("")
+            lines.append(f"  Theme Total: ${theme_value:>10,.2f} | P/L: ${theme_pnl:>10,.2f}{summary_str}")
+            lines.append("")
         
         # Summary (equity from API may include other assets beyond positions + cash)
-        logger.info("PORTFOLIO SUMMARY")
-        logger.info("-" * 70)
-        logger.info(f"Total Positions Value: ${total_positions_value:>10,.2f}")
-        logger.info(f"Total P/L:             ${total_pnl:>10,.2f} ({total_pnl/equity*100 if equity > 0 else 0:.2f}%)")
-        logger.info(f"Cash:                  ${cash:>10,.2f}")
+        lines.append("PORTFOLIO SUMMARY")
+        lines.append("-" * 70)
+        lines.append(f"Total Positions Value: ${total_positions_value:>10,.2f}")
+        lines.append(f"Total P/L:             ${total_pnl:>10,.2f} ({total_pnl/equity*100 if equity > 0 else 0:.2f}%)")
+        lines.append(f"Cash:                  ${cash:>10,.2f}")
         positions_plus_cash = total_positions_value + cash
         if equity > 0 and abs(equity - positions_plus_cash) > 0.01:
             other = equity - positions_plus_cash
-            logger.info(f"Other (savings/etc):   ${other:>10,.2f} ({(other/equity)*100:.1f}%)")
-        logger.info(f"Total Equity:          ${equity:>10,.2f}")
-        logger.info("=" * 70)
-        logger.info("")
+            lines.append(f"Other (savings/etc):   ${other:>10,.2f} ({(other/equity)*100:.1f}%)")
+        lines.append(f"Total Equity:          ${equity:>10,.2f}")
+        lines.append("=" * 70)
+        lines.append("")
+        logger.info("\n".join(lines))
     
     def add_position(self, position: Position):
         """Add a position to the portfolio.
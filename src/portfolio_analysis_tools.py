@@ -1,10 +1,45 @@
 """Portfolio analysis tools for AI integration (REQ-022)."""
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from loguru import logger
 from src.portfolio import PortfolioManager
 from src.utils.strategy_math import kelly_fraction
 from src.utils.strategy_presets import PRESET_STRATEGIES
 from src.utils.monte_carlo import monte_carlo_returns
+from src.utils.bounded_cache import BoundedCache
+
+# Monte Carlo outcomes per unit of capital, reused across compare_strategies calls.
+# Every path is capital * product of per-trade multipliers, so results scale exactly with capital.
+_MC_CACHE_TTL_SEC = 300
+_MC_CACHE = BoundedCache(maxsize=128, ttl=_MC_CACHE_TTL_SEC)
+_MC_CAPITAL_KEYS = ("median", "mean", "5pct", "95pct")
+
+
+def _cached_monte_carlo(
+    strategy_key: str,
+    strategy_profile,
+    risk_fraction: float,
+    capital: float,
+    simulations: int,
+    seed: Optional[int] = None,
+) -> Dict[str, float]:
+    """monte_carlo_returns for capital, served from a per-unit-capital cache when possible."""
+    key = (strategy_key, strategy_profile, risk_fraction, simulations, seed)
+    unit = _MC_CACHE.get(key)
+    if unit is None:
+        unit = monte_carlo_returns(
+            strategy=strategy_profile,
+            initial_capital=1.0,
+            risk_fraction=risk_fraction,
+            simulations=simulations,
+            seed=seed
+        )
+        _MC_CACHE[key] = unit
+    else:
+        logger.debug(f"Monte Carlo cache hit: {strategy_key}")
+    result = dict(unit)
+    for name in _MC_CAPITAL_KEYS:
+        result[name] = unit[name] * capital
+    return result
 
 
 def analyze_portfolio(portfolio_manager: PortfolioManager) -> Dict[str, Any]:
@@ -111,10 +146,11 @@ def compare_strategies(
         if seed is not None:
             strategy_seed = seed + hash(strategy_key) % 10000
 
-        mc_result = monte_carlo_returns(
-            strategy=strategy_profile,
-            initial_capital=capital,
+        mc_result = _cached_monte_carlo(
+            strategy_key,
+            strategy_profile,
             risk_fraction=kelly,
+            capital=capital,
             simulations=simulations,
             seed=strategy_seed
         )
@@ -2,11 +2,15 @@
 from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
+import time
 import uuid
 from loguru import logger
 
 from src.config import config
 
+# Steps logged within this many seconds of each other share one wall-clock timestamp
+_STEP_CLOCK_RESOLUTION_SEC = 0.010
+
 
 # =====================================
 # Data Classes
@@ -138,6 +142,16 @@ class ChainOfThoughtLogger:
         self.session_id = f"research_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
         self.steps: List[ReasoningStep] = []
         self.current_step = 0
+        self._now = datetime.now(timezone.utc)
+        self._now_mono = time.monotonic()
+
+    def _step_timestamp(self) -> datetime:
+        """Wall-clock time for a step, re-read only when the last read is older than 10ms."""
+        mono = time.monotonic()
+        if mono - self._now_mono >= _STEP_CLOCK_RESOLUTION_SEC:
+            self._now = datetime.now(timezone.utc)
+            self._now_mono = mono
+        return self._now
 
     def log_step(self, step_name: str, reasoning: str, data: Optional[Dict] = None,
                  confidence: Optional[float] = None) -> ReasoningStep:
@@ -158,13 +172,19 @@ class ChainOfThoughtLogger:
             step_name=step_name,
             reasoning=reasoning,
             data=data or {},
-            confidence=confidence
+            confidence=confidence,
+            timestamp=self._step_timestamp()
         )
         self.steps.append(step)
 
-        # Log to console
-        confidence_str = f" (confidence: {confidence:.0%})" if confidence else ""
-        logger.info(f"[COT Step {self.current_step}] {step_name}{confidence_str}: {reasoning[:200]}")
+        # Log to console (loguru defers the message formatting until a sink accepts INFO)
+        logger.info(
+            "[COT Step {}] {}{}: {}",
+            self.current_step,
+            step_name,
+            f" (confidence: {confidence:.0%})" if confidence else "",
+            reasoning[:200],
+        )
 
         # Persist to database if storage available
         if self.storage and config.cot_logging_enabled:
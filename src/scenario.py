@@ -88,8 +88,8 @@ class ScenarioEngine:
                 results["current_value"] = current_value
 
             # Calculate value at each price point
-            worst_value = float('inf')
-            best_value = float('-inf')
+            worst_value: Optional[float] = None
+            best_value: Optional[float] = None
             worst_price = None
             best_price = None
 
@@ -103,15 +103,15 @@ class ScenarioEngine:
                 results["price_scenarios"][price_point] = total_value
 
                 # Track worst and best case scenarios
-                if total_value < worst_value:
+                if worst_value is None or total_value < worst_value:
                     worst_value = total_value
                     worst_price = price_point
-                if total_value > best_value:
+                if best_value is None or total_value > best_value:
                     best_value = total_value
                     best_price = price_point
 
             # Calculate changes from current value
-            if current_value != 0:
+            if current_value != 0 and worst_value is not None:
                 results["worst_case"] = {
                     "price": worst_price,
                     "value": worst_value,
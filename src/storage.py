@@ -1,13 +1,16 @@
 """SQLite database storage for trading bot."""
 import sqlite3
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime, date, timedelta
 from loguru import logger
 import json
 
 from src.config import config
 
+_EQUITY_PEAK_KEY = "equity_peak"  # bot_state key of the ε-adjusted kill-switch peak
+
 
 def _get_snapshot_config_dict() -> Dict[str, Any]:
     """Build dict of all non-sensitive config for snapshots (learning/analytics)."""
@@ -25,6 +28,10 @@ class StorageManager:
             db_path: Path to database file (defaults to config)
         """
         self.db_path = db_path or config.db_path
+        # Rolling equity high per lookback window: days -> (table version, (high, ISO date of the high)).
+        # run.py and run_telegram.py both write equity_history, so a hit is trusted only while the
+        # table's (row count, latest created_at) is unchanged since the high was read.
+        self._equity_high_cache: Dict[int, Tuple[Tuple[int, Optional[str]], Tuple[float, str]]] = {}
         self._init_database()
         logger.info(f"Storage manager initialized: {self.db_path}")
     
@@ -312,7 +319,29 @@ class StorageManager:
 
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
+        self._insert_order(cursor, order)
+        conn.commit()
+        conn.close()
 
+    def record_fill(self, order: Dict, fill: Dict):
+        """Save a filled order and its fill in a single transaction.
+
+        Args:
+            order: Order dictionary (status/filled_at should reflect the fill)
+            fill: Fill dictionary
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                cursor = conn.cursor()
+                self._insert_order(cursor, order)
+                self._insert_fill(cursor, fill)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _insert_order(cursor: sqlite3.Cursor, order: Dict):
+        """Insert or replace an order row using an open cursor (caller commits)."""
         preflight_json = json.dumps(order.get("preflight")) if order.get("preflight") else None
         rationale = order.get("rationale") or ""
         theme = order.get("theme")
@@ -341,9 +370,6 @@ class StorageManager:
             order.get("filled_at"),
             order.get("canceled_at"),
         ))
-
-        conn.commit()
-        conn.close()
     
     def update_order_status(self, order_id: str, status: str, filled_at: Optional[str] = None):
         """Update order status.
@@ -380,7 +406,13 @@ class StorageManager:
         """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
-        
+        self._insert_fill(cursor, fill)
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def _insert_fill(cursor: sqlite3.Cursor, fill: Dict):
+        """Insert a fill row using an open cursor (caller commits)."""
         cursor.execute("""
             INSERT INTO fills (order_id, symbol, quantity, fill_price, fill_time)
             VALUES (?, ?, ?, ?, ?)
@@ -391,9 +423,6 @@ class StorageManager:
             fill["fill_price"],
             fill.get("fill_time", datetime.now().isoformat()),
         ))
-        
-        conn.commit()
-        conn.close()
     
     def save_contract(self, contract: Dict):
         """Save a chosen option contract.
@@ -488,10 +517,95 @@ class StorageManager:
             equity,
             datetime.now().isoformat(),
         ))
+        # Same connection and commit as the insert: the peak read/write adds no round-trip of its own
+        self._update_equity_peak(cursor, equity)
         
         conn.commit()
         conn.close()
-    
+
+    def _update_equity_peak(self, cursor: sqlite3.Cursor, equity: float):
+        """Raise the kill-switch peak only on a new high by more than kill_switch_epsilon.
+
+        Small up-ticks leave the peak alone so noise does not re-arm the kill switch.
+        A peak older than the lookback window is reseeded from the window high.
+        """
+        days = config.kill_switch_lookback_days
+        cutoff_date = (date.today() - timedelta(days=days)).isoformat()
+        cursor.execute("SELECT value FROM bot_state WHERE key = ?", (_EQUITY_PEAK_KEY,))
+        row = cursor.fetchone()
+        peak = self._parse_equity_peak(row[0] if row else None)
+        if peak is None or peak[1] < cutoff_date:
+            high = self._query_equity_high(cursor, days)
+            if high is None:
+                return
+            new_peak = high
+        elif equity > peak[0] * (1 + config.kill_switch_epsilon):
+            new_peak = (equity, date.today().isoformat())
+        else:
+            return
+        cursor.execute("""
+            INSERT OR REPLACE INTO bot_state (key, value, updated_at)
+            VALUES (?, ?, ?)
+        """, (
+            _EQUITY_PEAK_KEY,
+            json.dumps({"equity": new_peak[0], "date": new_peak[1]}),
+            datetime.now().isoformat(),
+        ))
+
+    @staticmethod
+    def _parse_equity_peak(raw: Optional[str]) -> Optional[Tuple[float, str]]:
+        """Parse the persisted kill-switch peak as (equity, ISO date)."""
+        if not raw:
+            return None
+        try:
+            data = json.loads(raw)
+            return float(data["equity"]), data["date"]
+        except (ValueError, TypeError, KeyError):
+            return None
+
+    def get_equity_peak(self, days: int) -> Optional[float]:
+        """Get the ε-adjusted equity peak used for kill-switch drawdown.
+
+        Args:
+            days: Lookback window; a peak older than this is ignored
+
+        Returns:
+            Peak equity value or None if no peak within the window
+        """
+        peak = self._parse_equity_peak(self.get_bot_state(_EQUITY_PEAK_KEY))
+        if peak is None:
+            return None
+        cutoff_date = (date.today() - timedelta(days=days)).isoformat()
+        return peak[0] if peak[1] >= cutoff_date else None
+
+    def get_drawdown_reference(self, days: int) -> Optional[float]:
+        """Get the equity that kill-switch drawdown is measured from.
+
+        Every drawdown check (kill switch, governance, alerts, status) uses this so they agree.
+
+        Args:
+            days: Lookback window
+
+        Returns:
+            The ε-adjusted peak, else the highest equity in the window, or None without history
+        """
+        return self.get_equity_peak(days) or self.get_equity_high_last_n_days(days)
+
+    @staticmethod
+    def _query_equity_high(cursor: sqlite3.Cursor, days: int) -> Optional[Tuple[float, str]]:
+        """Highest equity in the last N days as (equity, ISO date), or None."""
+        cutoff_date = (date.today() - timedelta(days=days)).isoformat()
+        cursor.execute("""
+            SELECT equity, date FROM equity_history
+            WHERE date >= ?
+            ORDER BY equity DESC
+            LIMIT 1
+        """, (cutoff_date,))
+        result = cursor.fetchone()
+        if not result or not result[0]:
+            return None
+        return result[0], result[1]
+
     def get_equity_high_last_n_days(self, days: int) -> Optional[float]:
         """Get highest equity in last N days.
         
@@ -501,20 +615,24 @@ class StorageManager:
         Returns:
             Highest equity value or None
         """
+        cutoff_date = (date.today() - timedelta(days=days)).isoformat()
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
-        
-        cutoff_date = (date.today() - timedelta(days=days)).isoformat()
-        
-        cursor.execute("""
-            SELECT MAX(equity) FROM equity_history
-            WHERE date >= ?
-        """, (cutoff_date,))
-        
-        result = cursor.fetchone()
+        # Every write (ours or another process's) bumps created_at, so an unchanged version
+        # means the cached high is still the table's high until it ages out of the window
+        cursor.execute("SELECT COUNT(*), MAX(created_at) FROM equity_history")
+        version = cursor.fetchone()
+        cached = self._equity_high_cache.get(days)
+        if cached and cached[0] == version and cached[1][1] >= cutoff_date:
+            conn.close()
+            return cached[1][0]
+
+        result = self._query_equity_high(cursor, days)
         conn.close()
-        
-        return result[0] if result and result[0] else None
+        if result is None:
+            return None
+        self._equity_high_cache[days] = (version, result)
+        return result[0]
 
     def get_balance_trends(self, days: int = 30, max_points: int = 500) -> List[Dict]:
         """Get portfolio balance snapshots over time for trend observation (includes config for learning).
@@ -657,28 +775,43 @@ class StorageManager:
         """
         self.set_bot_state("trading_paused", "true" if paused else "false")
 
-    def get_cooldown_until(self) -> Optional[datetime]:
-        """Get cool-down expiry time.
+    def get_cooldown_until_ts(self) -> Optional[float]:
+        """Get cool-down expiry as a unix timestamp.
 
         Returns:
-            Datetime when cool-down expires, or None if not in cool-down
+            Epoch seconds when cool-down expires, or None if not in cool-down
         """
         cooldown_str = self.get_bot_state("cooldown_until")
         if not cooldown_str:
             return None
         try:
-            return datetime.fromisoformat(cooldown_str)
+            return float(cooldown_str)
+        except (ValueError, TypeError):
+            pass
+        # Older rows stored a naive ISO datetime
+        try:
+            return datetime.fromisoformat(cooldown_str).timestamp()
         except (ValueError, TypeError):
             return None
 
-    def set_cooldown_until(self, until: Optional[datetime]):
+    def get_cooldown_until(self) -> Optional[datetime]:
+        """Get cool-down expiry time.
+
+        Returns:
+            Datetime when cool-down expires, or None if not in cool-down
+        """
+        until_ts = self.get_cooldown_until_ts()
+        return datetime.fromtimestamp(until_ts) if until_ts is not None else None
+
+    def set_cooldown_until(self, until: Optional[Union[float, datetime]]):
         """Set cool-down expiry time.
 
         Args:
-            until: Datetime when cool-down should expire, or None to clear cool-down
+            until: Unix timestamp (or datetime) when cool-down should expire, or None to clear cool-down
         """
         if until:
-            self.set_bot_state("cooldown_until", until.isoformat())
+            until_ts = until.timestamp() if isinstance(until, datetime) else float(until)
+            self.set_bot_state("cooldown_until", repr(until_ts))
         else:
             self.delete_bot_state("cooldown_until")
 
@@ -688,10 +821,32 @@ class StorageManager:
         Returns:
             True if in cool-down, False otherwise
         """
-        cooldown_until = self.get_cooldown_until()
-        if not cooldown_until:
+        until_ts = self.get_cooldown_until_ts()
+        if until_ts is None:
             return False
-        return datetime.now() < cooldown_until
+        return time.time() < until_ts
+
+    def get_last_rebalance_date(self) -> Optional[datetime]:
+        """Get when the scheduled daily rebalance last ran.
+
+        Returns:
+            Datetime (in the rebalance timezone) of the last run, or None if never run
+        """
+        value = self.get_bot_state("last_rebalance_at")
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            return None
+
+    def set_last_rebalance_date(self, when: datetime):
+        """Record when the scheduled daily rebalance ran.
+
+        Args:
+            when: Datetime of the run (in the rebalance timezone)
+        """
+        self.set_bot_state("last_rebalance_at", when.isoformat())
 
     # =====================================
     # Proactive Alerts (REQ-014)
@@ -7,7 +7,7 @@ from public_api_sdk import InstrumentType
 
 from src.config import config
 from src.portfolio import PortfolioManager, Position
-from src.market_data import MarketDataManager
+from src.market_data import MarketDataManager, SelectedContract
 from src.execution import ExecutionManager
 
 
@@ -146,7 +146,7 @@ class HighConvexityStrategy:
         
         return False
     
-    def should_roll(self, position: Position, current_price: float) -> Tuple[bool, Optional[Dict]]:
+    def should_roll(self, position: Position, current_price: float) -> Tuple[bool, Optional[SelectedContract]]:
         """Check if position should be rolled.
         
         Args:
@@ -195,7 +195,7 @@ class HighConvexityStrategy:
         
         # Estimate roll cost (close current + open new)
         # This is simplified - actual cost depends on fills
-        new_contract_price = new_contract["mid"]
+        new_contract_price = new_contract.mid
         roll_debit = new_contract_price - current_price
         
         # Check roll cost limits: reject if EITHER limit is exceeded
@@ -281,6 +281,20 @@ class HighConvexityStrategy:
             "theme_c": config.theme_underlyings[2] if len(config.theme_underlyings) > 2 else None,
         }
         
+        # Check entry signals first so option caches are warmed only for themes that will trade
+        entry_prices = {}
+        for theme_name, underlying in theme_map.items():
+            if underlying is None or rebalance_needs[theme_name] <= 100:
+                continue
+            underlying_price = self.data.get_quote(underlying)
+            if not underlying_price:
+                continue
+            if not self.check_entry_signal(underlying, underlying_price):
+                logger.info(f"Entry signal not valid for {underlying}")
+                continue
+            entry_prices[theme_name] = underlying_price
+        self.data.prefetch([theme_map[theme_name] for theme_name in entry_prices])
+        
         for theme_name, underlying in theme_map.items():
             if underlying is None:
                 continue
@@ -288,13 +302,8 @@ class HighConvexityStrategy:
             need = rebalance_needs[theme_name]
             
             if need > 100:  # Need to add position
-                # Check entry signal
-                underlying_price = self.data.get_quote(underlying)
-                if not underlying_price:
-                    continue
-                
-                if not self.check_entry_signal(underlying, underlying_price):
-                    logger.info(f"Entry signal not valid for {underlying}")
+                underlying_price = entry_prices.get(theme_name)
+                if underlying_price is None:
                     continue
                 
                 # Select option contract
@@ -309,18 +318,18 @@ class HighConvexityStrategy:
                     continue
                 
                 # Calculate quantity
-                contract_price = contract["mid"]
+                contract_price = contract.mid
                 quantity = int(need / contract_price)
                 
                 if quantity > 0:
                     rationale = f"Rebalance: {theme_name} below target (add {underlying})"
                     orders.append({
                         "action": "BUY",
-                        "symbol": contract["osi_symbol"],
+                        "symbol": contract.osi_symbol,
                         "quantity": quantity,
                         "price": contract_price,
                         "underlying": underlying,
-                        "contract_info": contract,
+                        "contract_info": contract.to_dict(),
                         "rationale": rationale,
                         "theme": theme_name,  # REQ-011: tag with theme for analytics
                     })
@@ -434,11 +443,11 @@ class HighConvexityStrategy:
                 # Open new
                 orders.append({
                     "action": "BUY",
-                    "symbol": new_contract["osi_symbol"],
+                    "symbol": new_contract.osi_symbol,
                     "quantity": position.quantity,
-                    "price": new_contract["mid"],
+                    "price": new_contract.mid,
                     "underlying": position.underlying,
-                    "contract_info": new_contract,
+                    "contract_info": new_contract.to_dict(),
                     "reason": "ROLL_OPEN",
                     "rationale": rationale_open,
                     "theme": theme,  # REQ-011: tag with theme for analytics
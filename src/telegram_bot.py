@@ -1042,6 +1042,17 @@ def run_tool(tool_name: str, arguments: Dict[str, Any], bot_instance: TradingBot
             # Use comprehensive position data when available
             comprehensive_positions = portfolio_comprehensive.get("positions", [])
             position_dict = {p.get("symbol"): p for p in comprehensive_positions}
+
+            # Warm the name cache in one concurrent pass for positions the portfolio data does not name
+            name_lookups = [
+                (getattr(pos, "underlying", None) or sym)
+                if pos.instrument_type == InstrumentType.OPTION
+                else sym
+                for sym, pos in pm.positions.items()
+                if not _display_name_from_public(position_dict.get(sym, {}), sym)
+            ]
+            if name_lookups:
+                pm.data_manager.get_instrument_display_names(name_lookups, InstrumentType.EQUITY)
             
             for sym, pos in list(pm.positions.items()):
                 price = pm.get_position_price(pos)
@@ -1110,7 +1121,7 @@ def run_tool(tool_name: str, arguments: Dict[str, Any], bot_instance: TradingBot
                 "cash": pm.get_cash(),
                 "allocations": pm.get_current_allocations(),
             })
-            high_equity = bot_instance.storage.get_equity_high_last_n_days(config.kill_switch_lookback_days)
+            high_equity = bot_instance.storage.get_drawdown_reference(config.kill_switch_lookback_days)
             if high_equity is None or high_equity <= 0:
                 return (
                     f"Equity: ${equity:,.2f}. No high-water mark in last {config.kill_switch_lookback_days} days yet; "
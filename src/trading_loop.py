@@ -94,7 +94,7 @@ def run_research(bot: Any) -> Dict[str, Any]:
         "allocations": allocations,
     })
 
-    high_equity = bot.storage.get_equity_high_last_n_days(config.kill_switch_lookback_days)
+    high_equity = bot.storage.get_drawdown_reference(config.kill_switch_lookback_days)
     drawdown_pct = (equity - high_equity) / high_equity if high_equity and high_equity > 0 else 0.0
 
     trends = bot.storage.get_balance_trends(days=7, max_points=50)
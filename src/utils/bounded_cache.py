@@ -0,0 +1,83 @@
+"""Size-capped LRU cache with an optional per-entry TTL."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Mapping, Optional, Tuple, Union
+
+_MISSING = object()
+
+
+class BoundedCache:
+    """Thread-safe dict-like cache holding at most maxsize entries (least recently used evicted first).
+
+    With ttl set, entries older than ttl seconds read as missing and are dropped on
+    access. ttl may be a callable so a runtime-configurable value is re-read on use.
+    """
+
+    def __init__(self, maxsize: int, ttl: Union[None, float, Callable[[], float]] = None):
+        self.maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        # Reads reorder the LRU too, so every access (not just writes) takes the lock
+        self._lock = threading.Lock()
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        if self._ttl is None:
+            return False
+        ttl = self._ttl() if callable(self._ttl) else self._ttl
+        return now - stored_at >= ttl
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond maxsize (caller holds the lock)."""
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for key (refreshing its LRU position), else default."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if self._expired(entry[0], time.monotonic()):
+                self._data.pop(key, None)
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            self._evict()
+
+    def update(self, items: Union[Mapping, Iterable[Tuple[Hashable, Any]]]) -> None:
+        """Insert many entries with one timestamp."""
+        pairs = items.items() if isinstance(items, Mapping) else items
+        with self._lock:
+            now = time.monotonic()
+            for key, value in pairs:
+                self._data[key] = (now, value)
+                self._data.move_to_end(key)
+            self._evict()
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,72 @@
+"""On-disk option chain cache keyed by (symbol, instrument type, expiration).
+
+Chains carry live bid/ask, so entries use the same short TTL as the in-memory chain
+cache: the disk copy only lets a restarted process skip refetching chains it pulled
+moments ago. Chains are stored as JSON (pydantic model_dump_json) rather than pickle,
+so reading the cache directory can never execute code.
+"""
+import glob
+import os
+import time
+from typing import Optional
+
+from loguru import logger
+from public_api_sdk import OptionChainResponse
+
+_SUFFIX = ".json"
+
+
+class ChainDiskCache:
+    """JSON-per-chain cache under a directory (one file per key, expired files pruned on write)."""
+
+    def __init__(self, cache_dir: str, ttl_seconds: float):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self._pruned_at = 0.0
+
+    def _path(self, symbol: str, expiration: str, underlying_type: str) -> str:
+        return os.path.join(self.cache_dir, f"options_{symbol}_{underlying_type}_{expiration}{_SUFFIX}")
+
+    def get(self, symbol: str, expiration: str, underlying_type: str) -> Optional[OptionChainResponse]:
+        """Return the cached chain, or None if missing, expired, or unreadable."""
+        path = self._path(symbol, expiration, underlying_type)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.ttl_seconds:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return OptionChainResponse.model_validate_json(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Could not read cached chain {}: {}", path, e)
+            return None
+
+    def set(self, symbol: str, expiration: str, underlying_type: str, chain: OptionChainResponse) -> None:
+        """Write chain to disk (atomic replace). Errors are logged, never raised."""
+        path = self._path(symbol, expiration, underlying_type)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(chain.model_dump_json(by_alias=True))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.debug("Could not write cached chain {}: {}", path, e)
+        self._prune()
+
+    def _prune(self) -> None:
+        """Delete expired chain files, at most once per TTL interval."""
+        now = time.time()
+        if now - self._pruned_at < self.ttl_seconds:
+            return
+        self._pruned_at = now
+        removed = 0
+        for path in glob.glob(os.path.join(self.cache_dir, f"options_*{_SUFFIX}")):
+            try:
+                if now - os.path.getmtime(path) >= self.ttl_seconds:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                continue
+        if removed:
+            logger.debug("Pruned {} expired chain file(s) from {}", removed, self.cache_dir)
@@ -33,6 +33,7 @@ TELEGRAM_EDITABLE_KEYS: Set[str] = {
     "min_open_interest",
     "min_volume",
     "use_max_pain_for_selection",
+    "option_chain_disk_cache",
     "roll_trigger_dte",
     "roll_target_dte",
     "max_roll_debit_pct",
@@ -49,6 +50,7 @@ TELEGRAM_EDITABLE_KEYS: Set[str] = {
     "order_poll_timeout_seconds",
     "order_poll_timeout_loop_seconds",
     "order_poll_interval_seconds",
+    "quote_cache_ttl_seconds",
     "use_sma_filter",
     "sma_period",
     "manual_mode_only",
@@ -58,12 +60,14 @@ TELEGRAM_EDITABLE_KEYS: Set[str] = {
     "rebalance_timezone",
     "kill_switch_drawdown_pct",
     "kill_switch_lookback_days",
+    "kill_switch_epsilon",
     "kill_switch_cooldown_days",
     "max_single_position_pct",
     "max_correlated_pct",
     "db_path",
     "log_level",
     "log_file",
+    "audit_log_file",
     "dry_run",
     "execution_tier",
     "confirm_trade_threshold_usd",
@@ -93,6 +97,7 @@ TELEGRAM_EDITABLE_KEYS: Set[str] = {
 # Coerce string values from chat to correct type when saving
 BOOL_KEYS = {
     "use_max_pain_for_selection",
+    "option_chain_disk_cache",
     "use_sma_filter",
     "manual_mode_only",
     "trade_during_extended_hours",
@@ -113,7 +118,7 @@ INT_KEYS = {
     "roll_trigger_dte", "roll_target_dte",
     "close_if_dte_lt", "close_if_otm_dte_lt",
     "max_trades_per_day", "order_poll_timeout_seconds", "order_poll_timeout_loop_seconds",
-    "order_poll_interval_seconds", "sma_period",
+    "order_poll_interval_seconds", "quote_cache_ttl_seconds", "sma_period",
     "rebalance_time_hour", "rebalance_time_minute",
     "kill_switch_lookback_days", "kill_switch_cooldown_days",
     "confirm_trade_threshold_contracts", "cooldown_duration_minutes",
@@ -129,6 +134,7 @@ FLOAT_KEYS = {
     "order_price_offset_pct", "kill_switch_drawdown_pct", "max_single_position_pct",
     "max_correlated_pct", "confirm_trade_threshold_usd", "cooldown_loss_threshold_pct",
     "cooldown_loss_threshold_usd", "kill_switch_warning_pct", "cap_warning_threshold_pct",
+    "kill_switch_epsilon",
 }
 
 
@@ -35,7 +35,7 @@ def check_governance(
     if action == "BUY" and storage is not None:
         try:
             storage.save_equity_history(equity)
-            high_equity = storage.get_equity_high_last_n_days(config.kill_switch_lookback_days)
+            high_equity = storage.get_drawdown_reference(config.kill_switch_lookback_days)
             if high_equity is not None and high_equity > 0:
                 drawdown_pct = (equity - high_equity) / high_equity
                 if drawdown_pct <= -config.kill_switch_drawdown_pct:
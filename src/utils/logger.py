@@ -7,20 +7,29 @@ from src.config import config
 
 
 def setup_logging():
-    """Configure logging for the application."""
+    """Configure logging for the application.
+
+    Sinks are enqueued: records are written by a background thread so the
+    order-execution path never blocks on stdout or disk.
+    """
     logger.remove()  # Remove default handler
     
-    # Ensure log directory exists
-    log_dir = os.path.dirname(config.log_file)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    # Ensure log directories exist
+    for path in (config.log_file, config.audit_log_file):
+        log_dir = os.path.dirname(path)
+        if log_dir and not os.path.exists(log_dir):
+            os.makedirs(log_dir)
     
     # Console handler
     logger.add(
         sys.stdout,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
         level=config.log_level,
-        colorize=True
+        colorize=True,
+        filter=lambda record: "audit" not in record["extra"],
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
     
     # File handler
@@ -30,7 +39,25 @@ def setup_logging():
         level=config.log_level,
         rotation="10 MB",
         retention="7 days",
-        compression="zip"
+        compression="zip",
+        filter=lambda record: "audit" not in record["extra"],
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
+    )
+
+    # Order audit trail: compact one-line records bound with audit=True
+    logger.add(
+        config.audit_log_file,
+        format="{time:YYYY-MM-DD HH:mm:ss} | {message}",
+        level="INFO",
+        rotation="10 MB",
+        retention="30 days",
+        compression="zip",
+        filter=lambda record: "audit" in record["extra"],
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
     
     logger.info("Logging configured")
@@ -0,0 +1,46 @@
+"""O(N log N) max pain payoff kernel (prefix sums; no strike x contract temporaries)."""
+import numpy as np
+
+
+def _prefix_sums(strikes: np.ndarray, oi: np.ndarray):
+    """Sort contracts by strike and return (sorted strikes, cumulative OI, cumulative strike*OI)."""
+    order = np.argsort(strikes, kind="stable")
+    k = strikes[order]
+    w = oi[order]
+    cum_oi = np.concatenate(([0.0], np.cumsum(w)))
+    cum_koi = np.concatenate(([0.0], np.cumsum(k * w)))
+    return k, cum_oi, cum_koi
+
+
+def max_pain_totals(
+    strikes: np.ndarray,
+    call_k: np.ndarray,
+    call_oi: np.ndarray,
+    put_k: np.ndarray,
+    put_oi: np.ndarray,
+) -> np.ndarray:
+    """Total holder value (per share, before the x100 multiplier) at each candidate strike.
+
+    Uses prefix sums over strike-sorted contracts, so each candidate costs one
+    binary search instead of a pass over the whole chain:
+        calls ITM at S: S * sum(oi) - sum(K * oi) over K <= S
+        puts ITM at S:  sum(K * oi) - S * sum(oi) over K > S
+
+    Args:
+        strikes: Candidate settlement strikes
+        call_k, call_oi: Call strikes and open interest
+        put_k, put_oi: Put strikes and open interest
+
+    Returns:
+        Array of totals aligned with strikes
+    """
+    ck, c_oi, c_koi = _prefix_sums(call_k, call_oi)
+    pk, p_oi, p_koi = _prefix_sums(put_k, put_oi)
+
+    ci = np.searchsorted(ck, strikes, side="right")
+    call_value = strikes * c_oi[ci] - c_koi[ci]
+
+    pi = np.searchsorted(pk, strikes, side="right")
+    put_value = (p_koi[-1] - p_koi[pi]) - strikes * (p_oi[-1] - p_oi[pi])
+
+    return call_value + put_value
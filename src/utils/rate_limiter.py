@@ -0,0 +1,48 @@
+"""Client-side token bucket for pacing API requests below the server quota."""
+import threading
+import time
+from typing import Optional
+
+# After a 429 the bucket runs at half rate for this long
+_PENALTY_SEC = 30.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a request may be sent.
+
+    A 429 from the server halves the refill rate for _PENALTY_SEC (adaptive
+    feedback), so a quota that is tighter than configured is learned quickly.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: Optional[int] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(burst if burst is not None else max(1, int(rate_per_minute // 6)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._penalty_until = 0.0
+        self._lock = threading.Lock()
+
+    def _current_rate(self, now: float) -> float:
+        return self.rate / 2 if now < self._penalty_until else self.rate
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available. No-op when rate <= 0."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                rate = self._current_rate(now)
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / rate
+            time.sleep(wait)
+
+    def penalize(self) -> None:
+        """Record a 429: halve the rate for the next _PENALTY_SEC and drop any saved burst."""
+        with self._lock:
+            self._penalty_until = time.monotonic() + _PENALTY_SEC
+            self._tokens = min(self._tokens, 0.0)
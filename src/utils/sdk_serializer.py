@@ -5,11 +5,13 @@ extracted and formatted for AI comprehension. It recursively serializes SDK obje
 to dictionaries, handling all data types including Decimals, datetimes, enums, etc.
 """
 import json
+from collections.abc import Mapping
 from datetime import datetime, date
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Union
 from enum import Enum
 from loguru import logger
+from pydantic import BaseModel
 
 
 def serialize_sdk_object(obj: Any, max_depth: int = 10, current_depth: int = 0) -> Any:
@@ -69,6 +71,11 @@ def serialize_sdk_object(obj: Any, max_depth: int = 10, current_depth: int = 0)
             for k, v in obj.items()
         }
     
+    # SDK responses are pydantic models: dump declared fields once instead of reflecting
+    # over dir(), which also walks model_fields/model_config metadata
+    if isinstance(obj, BaseModel):
+        return serialize_sdk_object(obj.model_dump(), max_depth, current_depth)
+    
     # Handle SDK objects (objects with attributes)
     if hasattr(obj, '__dict__') or hasattr(obj, '__slots__'):
         result = {}
@@ -160,6 +167,39 @@ def extract_quote_data(quote_obj: Any) -> Dict[str, Any]:
     return result
 
 
+class LazyQuoteView(Mapping):
+    """Read-only mapping over a Quote that runs extract_quote_data only on first key access.
+
+    Bulk quote fetches can hand these out without building a full dict per symbol;
+    callers that need a real dict (e.g. for json.dumps) use to_dict().
+    """
+
+    __slots__ = ("_quote", "_data")
+
+    def __init__(self, quote_obj: Any):
+        self._quote = quote_obj
+        self._data: Optional[Dict[str, Any]] = None
+
+    @property
+    def last(self) -> Optional[float]:
+        """Last price read straight from the SDK object (no serialization)."""
+        return _safe_float(getattr(self._quote, "last", None))
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = extract_quote_data(self._quote)
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self.to_dict()[key]
+
+    def __iter__(self):
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+
 def extract_option_contract_data(contract_obj: Any) -> Dict[str, Any]:
     """Extract comprehensive data from an option contract object.
     
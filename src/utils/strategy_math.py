@@ -1,13 +1,14 @@
 """Strategy-level mathematical analysis: expected value, Kelly fraction, risk of ruin (REQ-019)."""
+from functools import lru_cache
 from typing import Optional
 from dataclasses import dataclass
 import random
 from loguru import logger
 
 
-@dataclass
+@dataclass(frozen=True)
 class StrategyProfile:
-    """Data model for strategy statistics.
+    """Data model for strategy statistics (immutable, so it can key memoized results).
 
     Attributes:
         name: Human-readable strategy name
@@ -46,9 +47,13 @@ def expected_value(strategy: StrategyProfile) -> float:
     return strategy.win_rate * strategy.avg_win - (1 - strategy.win_rate) * strategy.avg_loss
 
 
+@lru_cache(maxsize=256)
 def kelly_fraction(strategy: StrategyProfile, cap: float = 0.25) -> float:
     """Calculate Kelly criterion for optimal position sizing.
 
+    Memoized per (strategy, cap): profiles are frozen, and presets are asked
+    for their Kelly fraction on every strategy comparison.
+
     Kelly = (b*p - q) / b, where:
       b = avg_win / avg_loss (payoff ratio)
       p = win_rate
@@ -67,7 +67,7 @@ def check_theme_change_governance(storage, proposal: dict) -> Tuple[bool, str]:
     # Rule 4: Kill switch - no theme changes during drawdown
     try:
         equity = storage.get_latest_equity()
-        high_equity = storage.get_equity_high_last_n_days(config.kill_switch_lookback_days)
+        high_equity = storage.get_drawdown_reference(config.kill_switch_lookback_days)
 
         if equity and high_equity and high_equity > 0:
             drawdown_pct = (equity - high_equity) / high_equity
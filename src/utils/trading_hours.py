@@ -1,5 +1,6 @@
 """Trading hours and exchange cutoffs (e.g. Public.com same-day option rule)."""
 from datetime import datetime, time
+from typing import Optional
 from zoneinfo import ZoneInfo
 
 ET = ZoneInfo("America/New_York")
@@ -13,8 +14,10 @@ def now_et() -> datetime:
     return datetime.now(ET)
 
 
-def is_after_same_day_option_cutoff_et() -> bool:
+def is_after_same_day_option_cutoff_et(now: Optional[datetime] = None) -> bool:
     """True if current time in ET is at or after 3:30 PM ET.
     Public does not allow opening same-day expiring option positions after this time.
+    Pass now (timezone-aware) to share one clock read across many checks.
     """
-    return now_et().time() >= SAME_DAY_OPTION_CUTOFF_TIME
+    now = now.astimezone(ET) if now is not None else now_et()
+    return now.time() >= SAME_DAY_OPTION_CUTOFF_TIME
@@ -28,7 +28,7 @@ def mock_storage():
     storage.get_pending_alerts = Mock(return_value=[])
     storage.save_pending_alerts = Mock()
     storage.clear_pending_alerts = Mock()
-    storage.get_equity_high_last_n_days = Mock(return_value=1000.0)
+    storage.get_drawdown_reference = Mock(return_value=1000.0)
     return storage
 
 
@@ -63,7 +63,7 @@ def test_kill_switch_warning_at_threshold(alert_manager, mock_portfolio_manager,
     with patch.object(config, 'proactive_alerts_enabled', True):
         with patch.object(config, 'kill_switch_warning_pct', 0.20):
             with patch.object(config, 'kill_switch_drawdown_pct', 0.25):
-                mock_storage.get_equity_high_last_n_days.return_value = 1000.0
+                mock_storage.get_drawdown_reference.return_value = 1000.0
                 mock_portfolio_manager.get_equity.return_value = 795.0  # -20.5% drawdown
 
                 alerts = alert_manager.check_all_alerts()
@@ -79,7 +79,7 @@ def test_kill_switch_warning_not_triggered_above_threshold(alert_manager, mock_p
     """Test kill switch warning does not trigger above threshold."""
     with patch.object(config, 'proactive_alerts_enabled', True):
         with patch.object(config, 'kill_switch_warning_pct', 0.20):
-            mock_storage.get_equity_high_last_n_days.return_value = 1000.0
+            mock_storage.get_drawdown_reference.return_value = 1000.0
             mock_portfolio_manager.get_equity.return_value = 850.0  # -15% drawdown
 
             alerts = alert_manager.check_all_alerts()
@@ -93,7 +93,7 @@ def test_kill_switch_warning_not_triggered_below_kill_switch(alert_manager, mock
     with patch.object(config, 'proactive_alerts_enabled', True):
         with patch.object(config, 'kill_switch_warning_pct', 0.20):
             with patch.object(config, 'kill_switch_drawdown_pct', 0.25):
-                mock_storage.get_equity_high_last_n_days.return_value = 1000.0
+                mock_storage.get_drawdown_reference.return_value = 1000.0
                 mock_portfolio_manager.get_equity.return_value = 740.0  # -26% drawdown
 
                 alerts = alert_manager.check_all_alerts()
@@ -205,7 +205,7 @@ def test_coalescing_blocks_duplicate_alerts(alert_manager, mock_storage, mock_po
         with patch.object(config, 'kill_switch_warning_pct', 0.20):
             with patch.object(config, 'kill_switch_drawdown_pct', 0.25):
                 with patch.object(config, 'alert_coalescing_hours', 24):
-                    mock_storage.get_equity_high_last_n_days.return_value = 1000.0
+                    mock_storage.get_drawdown_reference.return_value = 1000.0
                     mock_portfolio_manager.get_equity.return_value = 790.0  # -21% drawdown
 
                     alerts1 = alert_manager.check_all_alerts()
@@ -225,7 +225,7 @@ def test_coalescing_allows_alert_after_24_hours(alert_manager, mock_storage, moc
         with patch.object(config, 'kill_switch_warning_pct', 0.20):
             with patch.object(config, 'kill_switch_drawdown_pct', 0.25):
                 with patch.object(config, 'alert_coalescing_hours', 24):
-                    mock_storage.get_equity_high_last_n_days.return_value = 1000.0
+                    mock_storage.get_drawdown_reference.return_value = 1000.0
                     mock_portfolio_manager.get_equity.return_value = 790.0
 
                     mock_storage.get_alert_last_triggered = Mock(
@@ -245,7 +245,7 @@ def test_multiple_alerts_triggered_simultaneously(alert_manager, mock_portfolio_
                     with patch.object(config, 'moonshot_max', 0.30):
                         with patch.object(config, 'roll_trigger_dte', 60):
                             with patch.object(config, 'roll_warning_days_before', 7):
-                                mock_storage.get_equity_high_last_n_days.return_value = 1000.0
+                                mock_storage.get_drawdown_reference.return_value = 1000.0
                                 mock_portfolio_manager.get_equity.return_value = 790.0
                                 mock_portfolio_manager.get_current_allocations.return_value = {
                                     "moonshot": 0.29, "theme_a": 0.0, "theme_b": 0.0, "theme_c": 0.0, "cash": 0.0
@@ -266,7 +266,7 @@ def test_alert_structure(alert_manager, mock_portfolio_manager, mock_storage):
     with patch.object(config, 'proactive_alerts_enabled', True):
         with patch.object(config, 'kill_switch_warning_pct', 0.20):
             with patch.object(config, 'kill_switch_drawdown_pct', 0.25):
-                mock_storage.get_equity_high_last_n_days.return_value = 1000.0
+                mock_storage.get_drawdown_reference.return_value = 1000.0
                 mock_portfolio_manager.get_equity.return_value = 790.0
 
                 alerts = alert_manager.check_all_alerts()
@@ -290,7 +290,7 @@ def test_storage_integration(mock_storage, mock_portfolio_manager):
     with patch.object(config, 'proactive_alerts_enabled', True):
         with patch.object(config, 'kill_switch_warning_pct', 0.20):
             with patch.object(config, 'kill_switch_drawdown_pct', 0.25):
-                mock_storage.get_equity_high_last_n_days.return_value = 1000.0
+                mock_storage.get_drawdown_reference.return_value = 1000.0
                 mock_portfolio_manager.get_equity.return_value = 790.0
 
                 alerts = alert_manager.check_all_alerts()
@@ -1,5 +1,6 @@
 """Tests for allocation math."""
 import pytest
+from datetime import date
 from unittest.mock import Mock, MagicMock
 from src.portfolio import PortfolioManager, Position
 from src.market_data import MarketDataManager
@@ -79,6 +80,68 @@ def test_get_current_allocations_with_positions(portfolio_manager, mock_data_man
     assert allocations["theme_a"] == pytest.approx(0.05, abs=0.01)
 
 
+def test_positions_by_theme_regrouped_only_when_positions_change(portfolio_manager):
+    """The theme grouping is reused until positions are added, removed or replaced."""
+    equity = Position(symbol="UMC", quantity=10, entry_price=5.0, instrument_type=InstrumentType.EQUITY)
+    portfolio_manager.add_position(equity)
+    first = portfolio_manager.get_positions_by_theme()
+    cached = portfolio_manager._themes_cache
+    assert portfolio_manager.get_positions_by_theme() == first
+    assert portfolio_manager._themes_cache is cached
+
+    first["theme_a"].clear()  # callers get copies
+    assert portfolio_manager.get_positions_by_theme()["theme_a"] == [equity]
+
+    option = Position(
+        symbol="TE250117C00010000", quantity=1, entry_price=1.0,
+        instrument_type=InstrumentType.OPTION, osi_symbol="TE250117C00010000",
+    )
+    portfolio_manager.positions = {"TE250117C00010000": option}
+    themes = portfolio_manager.get_positions_by_theme()
+    assert themes["theme_a"] == [] and themes["theme_b"] == [option]
+
+
+def test_allocations_prefetch_quotes_once_per_instrument_type(portfolio_manager, mock_data_manager):
+    """Position prices are warmed with one bulk quote request per instrument type."""
+    portfolio_manager.add_position(Position(symbol="UMC", quantity=10, entry_price=5.0))
+    portfolio_manager.add_position(Position(symbol="TE", quantity=5, entry_price=3.0))
+    portfolio_manager.add_position(Position(
+        symbol="UMC250117C00100000", quantity=1, entry_price=50.0,
+        instrument_type=InstrumentType.OPTION, osi_symbol="UMC250117C00100000", underlying="UMC",
+    ))
+
+    portfolio_manager.get_current_allocations()
+
+    calls = {c.args[1]: c.args[0] for c in mock_data_manager.get_quotes.call_args_list}
+    assert mock_data_manager.get_quotes.call_count == 2
+    assert calls[InstrumentType.OPTION] == ["UMC250117C00100000"]
+    assert sorted(calls[InstrumentType.EQUITY]) == ["TE", "UMC"]
+
+
+def test_position_dte_uses_parsed_expiration():
+    """Expiration is parsed once; get_dte takes an optional reference date."""
+    position = Position(
+        symbol="UMC250117C00100000", quantity=1, entry_price=1.0,
+        instrument_type=InstrumentType.OPTION, expiration="2025-01-17",
+    )
+    assert position.get_dte(date(2025, 1, 7)) == 10
+    position.expiration = "2025-01-27"
+    assert position.get_dte(date(2025, 1, 7)) == 20
+    assert Position(symbol="X", quantity=1, entry_price=1.0, expiration="bad").get_dte() is None
+
+
+def test_allocations_track_in_place_quantity_changes(portfolio_manager, mock_data_manager):
+    """Cached position columns never hold stale quantities (add_position merges in place)."""
+    mock_data_manager.get_quote.return_value = 10.0
+    portfolio_manager.add_position(Position(symbol="UMC", quantity=10, entry_price=5.0))
+    portfolio_manager.add_position(Position(symbol="OTHER", quantity=3, entry_price=5.0))
+    assert portfolio_manager.get_current_allocations()["theme_a"] == pytest.approx(100.0 / 1200.0)
+
+    portfolio_manager.add_position(Position(symbol="UMC", quantity=20, entry_price=5.0))
+    assert portfolio_manager.get_current_allocations()["theme_a"] == pytest.approx(300.0 / 1200.0)
+    assert portfolio_manager.get_allocations_by_type()["equity"]["value"] == pytest.approx(330.0)
+
+
 def test_calculate_rebalance_needs(portfolio_manager, mock_data_manager):
     """Test rebalancing needs calculation."""
     from src.config import config
@@ -61,3 +61,21 @@ def test_client_context_manager():
             assert client.account_number == "TEST123"
         
         mock_client_instance.close.assert_called_once()
+
+
+def test_client_enlarges_connection_pool():
+    """The SDK session keeps its retry policy but gets a larger keep-alive pool."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retry = Retry(total=3, status_forcelist=[429, 500])
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    with patch('src.client.PublicApiClient') as mock_client_class:
+        mock_client_class.return_value = Mock(api_client=Mock(session=session))
+        TradingClient(account_number="TEST123")
+
+    adapter = session.get_adapter("https://api.public.com")
+    assert adapter._pool_maxsize == 64
+    assert adapter.max_retries is retry
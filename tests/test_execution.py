@@ -2,7 +2,7 @@
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from decimal import Decimal
-from src.execution import ExecutionManager
+from src.execution import ExecutionManager, FillResult
 from src.client import TradingClient
 from src.portfolio import PortfolioManager
 from public_api_sdk import OrderSide, OrderType, InstrumentType
@@ -193,3 +193,21 @@ def test_cancel_order_dry_run(execution_manager):
         assert result == True
     finally:
         config.dry_run = original_dry_run
+
+
+def test_fill_result_from_result():
+    """Test FillResult normalizes status and tolerates missing keys."""
+    fill = FillResult.from_result({
+        "order_id": "ORDER123",
+        "symbol": "AAPL",
+        "quantity": 2,
+        "price": 150.0,
+        "status": "filled",
+    })
+    assert fill.status == "FILLED"
+    assert fill.symbol == "AAPL"
+    assert fill.price == 150.0
+
+    empty = FillResult.from_result({"order_id": "ORDER456"})
+    assert empty.status == ""
+    assert empty.quantity is None
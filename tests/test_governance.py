@@ -10,7 +10,7 @@ from src.portfolio import PortfolioManager, Position, InstrumentType
 def mock_storage():
     """Create a mock storage instance."""
     storage = Mock()
-    storage.get_equity_high_last_n_days.return_value = 12000.0
+    storage.get_drawdown_reference.return_value = 12000.0
     storage.get_bot_state.return_value = None
     return storage
 
@@ -55,7 +55,7 @@ class TestKillSwitch:
 
         # Set up large drawdown: equity 9000 vs high 12000 = 25% drawdown
         mock_portfolio.get_equity.return_value = 9000.0
-        mock_storage.get_equity_high_last_n_days.return_value = 12000.0
+        mock_storage.get_drawdown_reference.return_value = 12000.0
 
         order_details = {
             "action": "BUY",
@@ -78,7 +78,7 @@ class TestKillSwitch:
 
         # Set up large drawdown
         mock_portfolio.get_equity.return_value = 9000.0
-        mock_storage.get_equity_high_last_n_days.return_value = 12000.0
+        mock_storage.get_drawdown_reference.return_value = 12000.0
 
         order_details = {
             "action": "SELL",
@@ -224,7 +224,7 @@ class TestGovernanceIntegration:
         # No kill switch (equity at high)
         mock_portfolio.get_equity.return_value = 10000.0
         mock_portfolio.get_cash.return_value = 5000.0
-        mock_storage.get_equity_high_last_n_days.return_value = 10000.0
+        mock_storage.get_drawdown_reference.return_value = 10000.0
 
         # Small order
         order_details = {
@@ -249,7 +249,7 @@ class TestGovernanceIntegration:
 
         # Even with kill switch active
         mock_portfolio.get_equity.return_value = 9000.0
-        mock_storage.get_equity_high_last_n_days.return_value = 12000.0
+        mock_storage.get_drawdown_reference.return_value = 12000.0
 
         order_details = {
             "action": "SELL",
@@ -301,7 +301,7 @@ class TestEdgeCases:
 
         mock_portfolio.get_equity.return_value = 10000.0
         mock_portfolio.get_cash.return_value = 5000.0
-        mock_storage.get_equity_high_last_n_days.return_value = None  # No history
+        mock_storage.get_drawdown_reference.return_value = None  # No history
 
         order_details = {
             "action": "BUY",
@@ -5,7 +5,7 @@ from datetime import datetime
 
 from src.strategy import HighConvexityStrategy
 from src.portfolio import PortfolioManager, Position
-from src.market_data import MarketDataManager
+from src.market_data import MarketDataManager, SelectedContract
 from src.execution import ExecutionManager
 from src.config import config
 from public_api_sdk import InstrumentType
@@ -49,12 +49,17 @@ def test_rebalance_orders_have_theme_tag(mock_components):
     }
 
     data_manager.get_quote.return_value = 100.0
-    data_manager.select_option_contract.return_value = {
-        "osi_symbol": "UMC250117C00100000",
-        "mid": 2.50,
-        "strike": 100.0,
-        "expiration": "2025-01-17",
-    }
+    data_manager.select_option_contract.return_value = SelectedContract(
+        osi_symbol="UMC250117C00100000",
+        underlying="UMC",
+        expiration="2025-01-17",
+        strike=100.0,
+        bid=2.45,
+        ask=2.55,
+        mid=2.50,
+        open_interest=None,
+        volume=None,
+    )
 
     strategy = HighConvexityStrategy(portfolio_manager, data_manager, execution_manager)
 
@@ -17,7 +17,7 @@ def mock_client():
 def mock_storage():
     """Create a mock storage instance."""
     storage = Mock()
-    storage.get_equity_high_last_n_days.return_value = 12000.0
+    storage.get_drawdown_reference.return_value = 12000.0
     storage.get_bot_state.return_value = None
     storage.set_bot_state.return_value = None
     storage.save_order.return_value = None
@@ -36,7 +36,7 @@ def mock_storage():
 def mock_bot(mock_storage_cls, mock_strategy_cls, mock_market_cls, mock_exec_cls, mock_portfolio_cls, mock_client):
     """Create a TradingBot instance with mocked dependencies."""
     mock_storage_instance = Mock()
-    mock_storage_instance.get_equity_high_last_n_days.return_value = 12000.0
+    mock_storage_instance.get_drawdown_reference.return_value = 12000.0
     mock_storage_cls.return_value = mock_storage_instance
 
     mock_portfolio_instance = Mock()
@@ -57,9 +57,34 @@ def mock_bot(mock_storage_cls, mock_strategy_cls, mock_market_cls, mock_exec_cls
     return bot
 
 
+def _bare_bot():
+    """TradingBot with mocked collaborators, built without running __init__."""
+    bot = TradingBot.__new__(TradingBot)
+    bot.portfolio_manager = Mock()
+    bot.storage = Mock()
+    bot.execution_manager = Mock()
+    bot.strategy = Mock()
+    return bot
+
+
 class TestKillSwitch:
     """Tests for kill switch functionality."""
 
+    @patch("src.main.config")
+    def test_kill_switch_checked_after_failed_equity_read(self, mock_config):
+        """A zero equity read (API error) must not disable later drawdown checks."""
+        mock_config.kill_switch_drawdown_pct = 0.25
+        mock_config.kill_switch_lookback_days = 30
+        bot = _bare_bot()
+
+        bot.portfolio_manager.get_equity.return_value = 0.0
+        bot.storage.get_drawdown_reference.return_value = None
+        assert bot.check_kill_switch() is False
+
+        bot.portfolio_manager.get_equity.return_value = 8500.0
+        bot.storage.get_drawdown_reference.return_value = 12000.0
+        assert bot.check_kill_switch() is True
+
     @patch("src.main.config")
     def test_kill_switch_inactive_no_drawdown(self, mock_config, mock_bot):
         """Test kill switch remains inactive when no drawdown."""
@@ -67,7 +92,7 @@ class TestKillSwitch:
         mock_config.kill_switch_lookback_days = 30
 
         mock_bot.portfolio_manager.get_equity.return_value = 11500.0
-        mock_bot.storage.get_equity_high_last_n_days.return_value = 12000.0
+        mock_bot.storage.get_drawdown_reference.return_value = 12000.0
 
         result = mock_bot.check_kill_switch()
 
@@ -80,7 +105,7 @@ class TestKillSwitch:
         mock_config.kill_switch_lookback_days = 30
 
         mock_bot.portfolio_manager.get_equity.return_value = 8500.0  # 29% down from 12000
-        mock_bot.storage.get_equity_high_last_n_days.return_value = 12000.0
+        mock_bot.storage.get_drawdown_reference.return_value = 12000.0
 
         result = mock_bot.check_kill_switch()
 
@@ -93,7 +118,7 @@ class TestKillSwitch:
         mock_config.kill_switch_lookback_days = 30
 
         mock_bot.portfolio_manager.get_equity.return_value = 5000.0
-        mock_bot.storage.get_equity_high_last_n_days.return_value = None
+        mock_bot.storage.get_drawdown_reference.return_value = None
 
         result = mock_bot.check_kill_switch()
 
@@ -104,6 +129,21 @@ class TestKillSwitch:
 class TestCooldown:
     """Tests for cooldown functionality."""
 
+    @patch("src.main.config")
+    def test_cooldown_thresholds_on_single_fill(self, mock_config):
+        """Cool-down triggers on a percentage or dollar loss past the thresholds."""
+        mock_config.cooldown_enabled = True
+        bot = _bare_bot()
+        order = {"action": "SELL", "entry_price": 10.0}
+
+        small = {"price": 9.5, "quantity": 1, "symbol": "UMC"}
+        assert bot.check_and_trigger_cooldown(order, small, 0.10, 500.0, 60) is False
+        pct = {"price": 8.0, "quantity": 1, "symbol": "UMC"}
+        assert bot.check_and_trigger_cooldown(order, pct, 0.10, 500.0, 60) is True
+        usd = {"price": 9.5, "quantity": 2000, "symbol": "UMC"}
+        assert bot.check_and_trigger_cooldown(order, usd, 0.10, 500.0, 60) is True
+        assert bot.storage.set_cooldown_until.call_count == 2
+
     @patch("src.main.config")
     def test_cooldown_not_triggered_small_loss(self, mock_config, mock_bot):
         """Test cooldown not triggered on small loss."""
@@ -236,6 +276,74 @@ class TestOrderExecution:
         # No orders should be sent
         assert result["orders_sent"] == 0
 
+    @staticmethod
+    def _order_bot(mock_config, orders, fill_price):
+        """Bare bot that fills every planned order at fill_price, recording submission order."""
+        mock_config.max_trades_per_day = 10
+        mock_config.confirm_trade_threshold_usd = 1_000_000.0
+        mock_config.confirm_trade_threshold_contracts = 1_000
+        mock_config.proactive_alerts_enabled = False
+        mock_config.cooldown_enabled = True
+        mock_config.cooldown_loss_threshold_pct = 0.10
+        mock_config.cooldown_loss_threshold_usd = 500.0
+        mock_config.cooldown_duration_minutes = 60
+
+        bot = _bare_bot()
+        bot.check_kill_switch = Mock(return_value=False)
+        bot._submit_io = Mock()
+        bot.storage.is_in_cooldown.return_value = False
+        bot.execution_manager.has_pending_order_for_order.return_value = False
+        bot.strategy.trades_today = 0
+        bot.strategy.run_daily_logic.return_value = orders
+
+        sent = []
+
+        def execute_order(order_details, poll_timeout_seconds=None):
+            sent.append(order_details["symbol"])
+            return {
+                "order_id": f"ORD-{len(sent)}",
+                "symbol": order_details["symbol"],
+                "quantity": order_details["quantity"],
+                "price": fill_price,
+                "status": "FILLED",
+            }
+
+        bot.execution_manager.execute_order.side_effect = execute_order
+        return bot, sent
+
+    @patch("src.main.config")
+    def test_orders_execute_serially_in_planned_order(self, mock_config):
+        """Trim, sells and buys go out one at a time in the order the strategy planned them."""
+        orders = [
+            {"action": "SELL", "symbol": "MOON", "quantity": 1, "price": 5.0},
+            {"action": "SELL", "symbol": "OLD", "quantity": 1, "price": 5.0},
+            {"action": "BUY", "symbol": "NEW1", "quantity": 1, "price": 5.0},
+            {"action": "BUY", "symbol": "NEW2", "quantity": 1, "price": 5.0},
+        ]
+        bot, sent = self._order_bot(mock_config, orders, fill_price=5.0)
+
+        result = bot.run_daily_logic()
+
+        assert sent == ["MOON", "OLD", "NEW1", "NEW2"]
+        assert result["orders_sent"] == 4
+        assert bot.strategy.trades_today == 4
+
+    @patch("src.main.config")
+    def test_cooldown_stops_remaining_orders(self, mock_config):
+        """A losing exit that triggers cool-down stops every later order in the run."""
+        orders = [
+            {"action": "SELL", "symbol": "LOSER", "quantity": 1, "price": 8.0, "entry_price": 10.0},
+            {"action": "BUY", "symbol": "NEW1", "quantity": 1, "price": 5.0},
+            {"action": "BUY", "symbol": "NEW2", "quantity": 1, "price": 5.0},
+        ]
+        bot, sent = self._order_bot(mock_config, orders, fill_price=8.0)
+
+        result = bot.run_daily_logic()
+
+        assert sent == ["LOSER"]
+        assert result["orders_sent"] == 1
+        bot.storage.set_cooldown_until.assert_called_once()
+
 
 class TestRebalanceScheduling:
     """Tests for scheduled rebalancing."""
@@ -1,7 +1,9 @@
 """Tests for MarketDataManager."""
+import threading
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from datetime import date
+from types import SimpleNamespace
 from src.market_data import MarketDataManager
 from src.client import TradingClient
 from public_api_sdk import InstrumentType, OptionExpirationsResponse, OptionChainResponse
@@ -89,6 +91,27 @@ def test_get_option_chain(market_data_manager, mock_client):
     mock_client.client.get_option_chain.assert_called_once()
 
 
+def test_option_chain_and_expirations_cached(market_data_manager, mock_client):
+    """Test repeated chain/expiration lookups reuse cached responses until cleared."""
+    mock_response = Mock(spec=OptionExpirationsResponse)
+    mock_response.expirations = ["2025-01-17"]
+    mock_client.client.get_option_expirations.return_value = mock_response
+    mock_chain = Mock(spec=OptionChainResponse)
+    mock_chain.calls = []
+    mock_client.client.get_option_chain.return_value = mock_chain
+
+    expiration = date(2025, 1, 17)
+    for _ in range(3):
+        assert market_data_manager.get_option_expirations("AAPL") == [expiration]
+        assert market_data_manager.get_option_chain("AAPL", expiration) is mock_chain
+    assert mock_client.client.get_option_expirations.call_count == 1
+    assert mock_client.client.get_option_chain.call_count == 1
+
+    market_data_manager.clear_cache()
+    market_data_manager.get_option_chain("AAPL", expiration)
+    assert mock_client.client.get_option_chain.call_count == 2
+
+
 def test_get_option_greeks_single(market_data_manager, mock_client):
     """Test getting Greeks for single option (comprehensive serializer returns delta, etc.)."""
     class MockGreek:
@@ -99,14 +122,44 @@ def test_get_option_greeks_single(market_data_manager, mock_client):
             self.greeks.theta = -0.05
             self.greeks.vega = 0.2
     
-    mock_response = MockGreek()
-    mock_response.osi_symbol = "AAPL250117C00150000"
-    mock_client.client.get_option_greek.return_value = mock_response
+    mock_greek = MockGreek()
+    mock_greek.osi_symbol = "AAPL250117C00150000"
+    mock_client.client.get_option_greeks.return_value = Mock(greeks=[mock_greek])
     
     greeks = market_data_manager.get_option_greeks(["AAPL250117C00150000"])
     
     assert "AAPL250117C00150000" in greeks
     assert greeks["AAPL250117C00150000"]["delta"] == 0.5
+    # Single symbols go through the batch endpoint too
+    mock_client.client.get_option_greek.assert_not_called()
+
+
+def test_get_option_greeks_bulk_chunks_requests(market_data_manager, mock_client):
+    """Test bulk Greeks splits symbols into capped batch requests and merges results."""
+    # Plain objects: bare Mocks sprout attributes forever and make the serializer walk to max depth
+    def _greeks(symbols):
+        items = [
+            SimpleNamespace(
+                osi_symbol=sym,
+                greeks=SimpleNamespace(delta=0.5, gamma=0.1, theta=-0.05, vega=0.2),
+            )
+            for sym in symbols
+        ]
+        return SimpleNamespace(greeks=items)
+
+    mock_client.client.get_option_greeks.side_effect = _greeks
+    symbols = [f"AAPL250117C00{150 + i}000" for i in range(5)]
+
+    greeks = market_data_manager.get_option_greeks_bulk(symbols + symbols[:1], chunk_size=2)
+
+    assert set(greeks) == set(symbols)
+    assert mock_client.client.get_option_greeks.call_count == 3
+
+    mock_client.client.get_option_greeks.reset_mock()
+    import asyncio
+    greeks = asyncio.run(market_data_manager.get_option_greeks_async(symbols, chunk_size=2))
+    assert set(greeks) == set(symbols)
+    assert mock_client.client.get_option_greeks.call_count == 3
 
 
 def test_clear_cache(market_data_manager):
@@ -176,6 +229,24 @@ def test_compute_max_pain_no_oi_returns_none():
     assert result is None
 
 
+def test_compute_max_pain_ignores_contracts_without_strike():
+    """Test max pain skips contracts missing a strike and treats missing OI as zero."""
+    chain = Mock(spec=OptionChainResponse)
+    class Contract:
+        def __init__(self, strike, oi):
+            self.strike = strike
+            self.open_interest = oi
+    chain.calls = [Contract(None, 500), Contract(100, 100), Contract(110, None)]
+    chain.puts = [Contract(90, 100), Contract(None, 500)]
+    result = MarketDataManager.compute_max_pain(chain)
+    # At 90: calls 0, puts 0 -> 0; ties resolve to the lowest strike
+    assert result == (90.0, 0.0)
+
+    chain.calls = [Contract(None, 500)]
+    chain.puts = []
+    assert MarketDataManager.compute_max_pain(chain) is None
+
+
 def test_get_quotes_comprehensive(market_data_manager, mock_client):
     """Test get_quotes_comprehensive returns dict of full quote data per symbol."""
     class MockQuote:
@@ -226,3 +297,317 @@ def test_get_option_chain_comprehensive(market_data_manager, mock_client):
     assert result.get("max_pain_strike") == 100.0
     assert len(result.get("calls", [])) == 1
     assert result["calls"][0]["symbol"] == "AAPL250117C00150000"
+
+
+def test_compute_max_pain_small_and_large_chain_paths_agree():
+    """Test the payoff-matrix path (tiny chains) matches the prefix-sum kernel."""
+    chain = Mock(spec=OptionChainResponse)
+    class Contract:
+        def __init__(self, strike, oi):
+            self.strike = strike
+            self.open_interest = oi
+    chain.calls = [Contract(90 + i, (i * 37) % 200) for i in range(20)]
+    chain.puts = [Contract(85 + i, (i * 53) % 150) for i in range(20)]
+    small = MarketDataManager.compute_max_pain(chain)
+    with patch("src.market_data._MAX_PAIN_PREFIX_SUM_MIN_STRIKES", 1):
+        large = MarketDataManager.compute_max_pain(chain)
+    assert small is not None
+    assert small[0] == large[0]
+    assert small[1] == pytest.approx(large[1])
+
+
+def test_option_chain_disk_cache_survives_restart(mock_client, tmp_path):
+    """Test chains persisted to disk are reused by a fresh manager when enabled."""
+    from src.config import config
+
+    original = (config.option_chain_disk_cache, config.option_chain_cache_dir)
+    try:
+        config.option_chain_disk_cache = True
+        config.option_chain_cache_dir = str(tmp_path)
+        fetched = OptionChainResponse(baseSymbol="AAPL", calls=[], puts=[])
+        mock_client.client.get_option_chain.return_value = fetched
+
+        expiration = date(2025, 1, 17)
+        MarketDataManager(mock_client).get_option_chain("AAPL", expiration)
+        chain = MarketDataManager(mock_client).get_option_chain("AAPL", expiration)
+
+        assert chain == fetched
+        assert mock_client.client.get_option_chain.call_count == 1
+        assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+    finally:
+        config.option_chain_disk_cache, config.option_chain_cache_dir = original
+
+
+def test_chain_disk_cache_expires_and_prunes_old_files(tmp_path):
+    """Test disk entries expire after the TTL and expired files are deleted on the next write."""
+    import os
+    import time as _time
+    from src.utils.chain_disk_cache import ChainDiskCache
+
+    cache = ChainDiskCache(str(tmp_path), ttl_seconds=60)
+    chain = OptionChainResponse(baseSymbol="AAPL", calls=[], puts=[])
+    cache.set("AAPL", "2025-01-17", "EQUITY", chain)
+    assert cache.get("AAPL", "2025-01-17", "EQUITY") == chain
+
+    old = str(next(tmp_path.iterdir()))
+    os.utime(old, (_time.time() - 120, _time.time() - 120))
+    assert cache.get("AAPL", "2025-01-17", "EQUITY") is None
+
+    cache._pruned_at = 0.0
+    cache.set("MSFT", "2025-01-17", "EQUITY", chain)
+    assert not os.path.exists(old)
+    assert cache.get("MSFT", "2025-01-17", "EQUITY") == chain
+
+
+def test_get_option_chains_async(market_data_manager, mock_client):
+    """Test async chain fan-out returns one chain per expiration."""
+    import asyncio
+
+    mock_chain = Mock(spec=OptionChainResponse)
+    mock_chain.calls = []
+    mock_client.client.get_option_chain.return_value = mock_chain
+    expirations = [date(2025, 1, 17), date(2025, 2, 21)]
+
+    chains = asyncio.run(market_data_manager.get_option_chains_async("AAPL", expirations))
+
+    assert list(chains) == expirations
+    assert all(chain is mock_chain for chain in chains.values())
+    assert mock_client.client.get_option_chain.call_count == 2
+
+
+def test_get_quote_bid_ask_cached_briefly(market_data_manager, mock_client):
+    """Test repeated bid/ask lookups within the short TTL reuse one API call."""
+    quote = Mock(bid=1.0, ask=1.2, last=1.1)
+    mock_client.client.get_quotes.return_value = [quote]
+
+    first = market_data_manager.get_quote_bid_ask("AAPL250117C00150000", InstrumentType.OPTION)
+    first["mid"] = 0.0  # caller mutation must not leak into the cache
+    second = market_data_manager.get_quote_bid_ask("AAPL250117C00150000", InstrumentType.OPTION)
+
+    assert second["mid"] == pytest.approx(1.1)
+    assert mock_client.client.get_quotes.call_count == 1
+
+
+def test_retry_on_429_honors_retry_after_and_reraises_others(market_data_manager):
+    """429s are detected by type and wait Retry-After; other errors are not retried."""
+    from public_api_sdk.exceptions import RateLimitError, ValidationError
+
+    limiter = market_data_manager._rate_limiters["quotes"] = Mock()
+    fn = Mock(side_effect=[RateLimitError(retry_after=7), "ok"])
+    with patch("src.market_data.time.sleep") as sleep:
+        assert market_data_manager._retry_on_429(fn) == "ok"
+    sleep.assert_called_once_with(7.0)
+    assert limiter.acquire.call_count == 2
+    limiter.penalize.assert_called_once()
+
+    # An error message mentioning "rate" is no longer mistaken for a rate limit
+    fn = Mock(side_effect=ValidationError("invalid rate field"))
+    with patch("src.market_data.time.sleep") as sleep:
+        with pytest.raises(ValidationError):
+            market_data_manager._retry_on_429(fn)
+    sleep.assert_not_called()
+    assert fn.call_count == 1
+
+
+def test_token_bucket_paces_and_backs_off_after_429():
+    """The limiter lets a burst through, then waits; a 429 halves its rate."""
+    from src.utils.rate_limiter import TokenBucket
+
+    bucket = TokenBucket(rate_per_minute=60, burst=2)
+    with patch("src.utils.rate_limiter.time.sleep") as sleep:
+        bucket.acquire()
+        bucket.acquire()
+        sleep.assert_not_called()
+        sleep.side_effect = lambda s: setattr(bucket, "_tokens", 1.0)
+        bucket.acquire()
+        assert sleep.call_args[0][0] == pytest.approx(1.0, abs=0.05)
+
+        bucket.penalize()
+        sleep.reset_mock()
+        bucket.acquire()
+        assert sleep.call_args[0][0] == pytest.approx(2.0, abs=0.05)
+
+
+def test_concurrent_get_quote_calls_are_coalesced(market_data_manager, mock_client):
+    """Symbols requested while a quote request is in flight share the next request."""
+    import threading
+    import time as _time
+
+    def _quotes(instruments):
+        if len(mock_client.client.get_quotes.call_args_list) == 1:
+            # Hold the first request until the other callers have queued up
+            deadline = _time.time() + 5
+            while _time.time() < deadline:
+                pending = market_data_manager._pending_quotes.get(InstrumentType.EQUITY, {})
+                if len(pending) == 3:
+                    break
+                _time.sleep(0.005)
+        return [Mock(instrument=Mock(symbol=i.symbol), last=100.0) for i in instruments]
+
+    mock_client.client.get_quotes.side_effect = _quotes
+    results = {}
+
+    def _get(symbol):
+        results[symbol] = market_data_manager.get_quote(symbol)
+
+    first = threading.Thread(target=_get, args=("AAPL",))
+    first.start()
+    while not mock_client.client.get_quotes.called:
+        _time.sleep(0.005)
+    others = [threading.Thread(target=_get, args=(s,)) for s in ("MSFT", "NVDA", "TSLA")]
+    for t in others:
+        t.start()
+    for t in [first, *others]:
+        t.join(timeout=10)
+
+    assert results == {"AAPL": 100.0, "MSFT": 100.0, "NVDA": 100.0, "TSLA": 100.0}
+    assert mock_client.client.get_quotes.call_count == 2
+    batched = {i.symbol for i in mock_client.client.get_quotes.call_args_list[1][0][0]}
+    assert batched == {"MSFT", "NVDA", "TSLA"}
+
+
+def test_quote_batch_leader_hands_off_after_round_cap(market_data_manager, mock_client):
+    """A leader sends at most _QUOTE_BATCH_MAX_ROUNDS requests; waiters pick up the rest."""
+    mock_client.client.get_quotes.side_effect = lambda instruments: [
+        Mock(instrument=Mock(symbol=i.symbol), last=100.0) for i in instruments
+    ]
+    drain = market_data_manager._drain_quote_batches
+    results = {}
+
+    def _get(symbol):
+        results[symbol] = market_data_manager.get_quote(symbol)
+
+    with patch("src.market_data._QUOTE_BATCH_MAX_SYMBOLS", 1), \
+            patch("src.market_data._QUOTE_BATCH_MAX_ROUNDS", 1), \
+            patch.object(market_data_manager, "_drain_quote_batches", side_effect=drain) as spy:
+        threads = [threading.Thread(target=_get, args=(s,)) for s in ("AAPL", "MSFT", "NVDA", "TSLA")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+
+    assert results == {"AAPL": 100.0, "MSFT": 100.0, "NVDA": 100.0, "TSLA": 100.0}
+    # One request per leadership term, so the queue was passed between callers
+    assert mock_client.client.get_quotes.call_count == 4
+    assert spy.call_count == 4
+    assert not market_data_manager._quote_batch_active
+
+
+def test_quote_cache_is_bounded_and_expires():
+    """The quote cache evicts least recently used entries and drops expired ones."""
+    from src.utils.bounded_cache import BoundedCache
+
+    cache = BoundedCache(2, ttl=30)
+    cache.update({"AAPL": 1.0, "MSFT": 2.0})
+    assert cache["AAPL"] == 1.0  # AAPL is now most recently used
+    cache["NVDA"] = 3.0
+    assert "MSFT" not in cache and len(cache) == 2
+
+    with patch("src.utils.bounded_cache.time.monotonic", return_value=10**9):
+        assert cache.get("AAPL") is None
+        with pytest.raises(KeyError):
+            cache["NVDA"]
+    assert len(cache) == 0
+
+
+def test_bounded_cache_concurrent_access_stays_bounded():
+    """Concurrent readers and writers never corrupt the LRU order or exceed maxsize."""
+    from src.utils.bounded_cache import BoundedCache
+
+    cache = BoundedCache(50)
+
+    def worker(offset):
+        for i in range(2000):
+            key = (offset + i) % 200
+            cache[key] = i
+            cache.get((key + 1) % 200)
+            cache.pop((key + 2) % 200)
+
+    threads = [threading.Thread(target=worker, args=(n * 37,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(cache) <= 50
+
+
+def test_get_quotes_requests_only_uncached_symbols(market_data_manager, mock_client):
+    """Fresh cached prices are merged in; force_refresh requests every symbol."""
+    market_data_manager._quote_cache["AAPL"] = 150.0
+    mock_client.client.get_quotes.side_effect = lambda instruments: [
+        Mock(instrument=Mock(symbol=i.symbol), last=300.0) for i in instruments
+    ]
+
+    assert market_data_manager.get_quotes(["AAPL", "MSFT"]) == {"AAPL": 150.0, "MSFT": 300.0}
+    requested = [i.symbol for i in mock_client.client.get_quotes.call_args[0][0]]
+    assert requested == ["MSFT"]
+
+    mock_client.client.get_quotes.reset_mock()
+    market_data_manager.get_quotes(["AAPL", "MSFT"])
+    mock_client.client.get_quotes.assert_not_called()
+
+    assert market_data_manager.get_quotes(["AAPL", "MSFT"], force_refresh=True)["AAPL"] == 300.0
+    assert mock_client.client.get_quotes.call_count == 1
+
+
+def test_instrument_name_misses_are_cached_then_retried(market_data_manager, mock_client):
+    """A failed name lookup is not re-queried until its negative-cache entry expires."""
+    mock_client.client.get_instrument.side_effect = Exception("not found")
+    assert market_data_manager.get_instrument_display_name("ZZZZ") is None
+    assert market_data_manager.get_instrument_display_name("ZZZZ") is None
+    assert mock_client.client.get_instrument.call_count == 1
+
+    mock_client.client.get_instrument.side_effect = None
+    mock_client.client.get_instrument.return_value = {"name": "Zeta Corp"}
+    market_data_manager._instrument_name_misses.clear()  # as if the 1h TTL elapsed
+    assert market_data_manager.get_instrument_display_name("ZZZZ") == "Zeta Corp"
+    assert market_data_manager.get_instrument_display_name("ZZZZ") == "Zeta Corp"
+    assert mock_client.client.get_instrument.call_count == 2
+
+
+def test_concurrent_get_option_chain_calls_share_one_request(market_data_manager, mock_client):
+    """Callers asking for a chain that is already being fetched wait for that request."""
+    import threading
+    import time as _time
+
+    release = threading.Event()
+    mock_chain = Mock(spec=OptionChainResponse)
+    mock_chain.calls = []
+
+    def _chain(request):
+        release.wait(5)
+        return mock_chain
+
+    mock_client.client.get_option_chain.side_effect = _chain
+    expiration = date(2025, 1, 17)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(market_data_manager.get_option_chain("AAPL", expiration)))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    # Hold the request until it is in flight (bounded, so a regression fails instead of hanging)
+    deadline = _time.time() + 5
+    while not market_data_manager._inflight_chains and _time.time() < deadline:
+        _time.sleep(0.005)
+    release.set()
+    for t in threads:
+        t.join(timeout=10)
+
+    assert results == [mock_chain] * 4
+    assert mock_client.client.get_option_chain.call_count == 1
+    assert not market_data_manager._inflight_chains
+
+
+def test_get_instrument_display_names_fetches_only_uncached(market_data_manager, mock_client):
+    """Bulk name lookups reuse cached names and fetch the rest through the per-symbol path."""
+    market_data_manager._instrument_name_cache[("AAPL", "EQUITY")] = "Apple Inc."
+    mock_client.client.get_instrument.side_effect = lambda symbol, _type: {"name": f"{symbol} Corp"}
+
+    names = market_data_manager.get_instrument_display_names(["AAPL", "MSFT", "NVDA", "MSFT", ""])
+
+    assert names == {"AAPL": "Apple Inc.", "MSFT": "MSFT Corp", "NVDA": "NVDA Corp"}
+    assert sorted(c.args[0] for c in mock_client.client.get_instrument.call_args_list) == ["MSFT", "NVDA"]
+    assert market_data_manager.get_instrument_display_name("NVDA") == "NVDA Corp"
+    assert mock_client.client.get_instrument.call_count == 2
@@ -74,8 +74,9 @@ def test_select_option_contract_suitable_contract(mock_get_chain, data_manager,
     
     # Should find contract with strike 105 (5% OTM, within 0-10% range)
     if result:
-        assert result["strike"] == 105.0
-        assert result["osi_symbol"] == "UMC250420C00105000"
+        assert result.strike == 105.0
+        assert result.osi_symbol == "UMC250420C00105000"
+        assert result.to_dict()["mid"] == 5.0
 
 
 @patch('src.market_data.MarketDataManager.get_option_chain')
@@ -104,3 +105,122 @@ def test_select_option_contract_liquidity_filter(mock_get_chain, data_manager, m
     
     # Should be filtered out due to wide spread
     assert result is None
+
+
+def test_select_option_contracts_bulk(data_manager):
+    """Test bulk selection returns one result per underlying."""
+    def _select(symbol, price, underlying_type=InstrumentType.EQUITY, now=None):
+        return {"osi_symbol": f"{symbol}-C", "underlying": symbol} if symbol != "NONE" else None
+
+    with patch.object(data_manager, "select_option_contract", side_effect=_select):
+        result = data_manager.select_option_contracts_bulk([("UMC", 10.0), ("NONE", 5.0)])
+
+    assert result["UMC"]["osi_symbol"] == "UMC-C"
+    assert result["NONE"] is None
+
+
+def test_best_call_applies_liquidity_filters():
+    """Test vectorized call filter skips illiquid/out-of-range strikes and picks closest to anchor."""
+    from types import SimpleNamespace
+
+    def call(strike, bid, ask, oi=100, volume=50):
+        return SimpleNamespace(strike=strike, bid=bid, ask=ask, open_interest=oi, volume=volume)
+
+    wide_spread = call(104.0, 1.0, 3.0)
+    no_bid = call(105.0, None, 5.0)
+    out_of_range = call(120.0, 4.9, 5.0)
+    liquid = call(108.0, 4.9, 5.0)
+    calls = [wide_spread, no_bid, out_of_range, liquid]
+
+    assert MarketDataManager._best_call(calls, 100.0, 110.0, 105.0).contract is liquid
+    assert MarketDataManager._best_call([no_bid], 100.0, 110.0, 105.0) is None
+    assert MarketDataManager._best_call([], 100.0, 110.0, 105.0) is None
+
+
+def test_best_call_reads_quotes_only_inside_strike_range():
+    """Quote fields are loaded only for the in-range strike window, not the whole chain."""
+    class Contract:
+        def __init__(self, strike):
+            self.strike = strike
+            self.open_interest = 100
+
+        def __getattr__(self, name):
+            if self.strike < 100.0 or self.strike > 110.0:
+                raise AssertionError(f"read {name} of out-of-range strike {self.strike}")
+            return {"bid": 4.9, "ask": 5.0, "volume": 50}[name]
+
+    calls = [Contract(float(k)) for k in range(50, 200)]
+
+    assert MarketDataManager._best_call(calls, 100.0, 110.0, 104.2).strike == 104.0
+
+
+def test_prefetch_warms_expiration_and_chain_caches(data_manager, mock_client):
+    """Test prefetch fills caches so selection does not refetch."""
+    from src.config import config
+
+    expiration = date.today() + timedelta(days=config.option_dte_min + 1)
+    mock_response = Mock()
+    mock_response.expirations = [expiration.isoformat()]
+    mock_client.client.get_option_expirations.return_value = mock_response
+    mock_chain = Mock(spec=OptionChainResponse)
+    mock_chain.calls = []
+    mock_chain.puts = []
+    mock_client.client.get_option_chain.return_value = mock_chain
+
+    data_manager.prefetch(["UMC", "TE"])
+    assert mock_client.client.get_option_expirations.call_count == 2
+    assert mock_client.client.get_option_chain.call_count == 2
+
+    data_manager.select_option_contract("UMC", 100.0)
+    assert mock_client.client.get_option_expirations.call_count == 2
+    assert mock_client.client.get_option_chain.call_count == 2
+
+
+def test_prefetch_option_chains_skips_timed_out_chain(data_manager):
+    """Test a chain fetch that exceeds the per-chain timeout is yielded as None."""
+    import time as _time
+
+    expirations = [date(2025, 1, 17), date(2025, 2, 21)]
+    chain = Mock(spec=OptionChainResponse)
+
+    def _chain(symbol, expiration, underlying_type):
+        if expiration == expirations[0]:
+            _time.sleep(0.5)
+        return chain
+
+    with patch.object(data_manager, "get_option_chain", side_effect=_chain), \
+            patch("src.market_data._CHAIN_FETCH_TIMEOUT_SEC", 0.05):
+        results = list(data_manager._prefetch_option_chains("UMC", expirations))
+
+    assert results == [(expirations[0], None), (expirations[1], chain)]
+
+
+def test_prefetch_option_chains_fetches_later_expirations_lazily(data_manager):
+    """Test only the first two chains are requested until the caller asks for more."""
+    expirations = [date(2025, 1, 17) + timedelta(days=7 * i) for i in range(6)]
+    chain = Mock(spec=OptionChainResponse)
+
+    with patch.object(data_manager, "get_option_chain", return_value=chain) as get_chain:
+        chains = data_manager._prefetch_option_chains("UMC", expirations)
+        assert next(chains) == (expirations[0], chain)
+        chains.close()
+
+    # The look-ahead fetch may be cancelled before it starts; nothing past it is ever requested
+    requested = {c.args[1] for c in get_chain.call_args_list}
+    assert expirations[0] in requested and requested <= set(expirations[:2])
+
+
+def test_target_expirations_uses_primary_then_fallback_window():
+    """DTE windows are inclusive sorted slices; the fallback applies only when the primary is empty."""
+    today = date(2026, 1, 5)
+    expirations = [today + timedelta(days=d) for d in (0, 7, 30, 60, 90, 120, 400)]
+    with patch("src.market_data.config") as cfg:
+        cfg.option_dte_min, cfg.option_dte_max = 60, 120
+        cfg.option_dte_fallback_min, cfg.option_dte_fallback_max = 7, 30
+        assert MarketDataManager._target_expirations(expirations, today) == expirations[3:6]
+
+        cfg.option_dte_min, cfg.option_dte_max = 200, 300
+        assert MarketDataManager._target_expirations(expirations, today) == expirations[1:3]
+
+        cfg.option_dte_fallback_min, cfg.option_dte_fallback_max = 200, 300
+        assert MarketDataManager._target_expirations(expirations, today) == []
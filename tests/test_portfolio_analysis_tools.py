@@ -152,5 +152,23 @@ def test_compare_strategies_different_capital():
         assert large_median > small_median
 
 
+
+def test_compare_strategies_reuses_monte_carlo_across_capital():
+    """Simulations are cached per unit of capital and scaled to the requested capital."""
+    from unittest.mock import patch
+    from src import portfolio_analysis_tools
+
+    portfolio_analysis_tools._MC_CACHE.clear()
+    with patch.object(
+        portfolio_analysis_tools, "monte_carlo_returns", wraps=portfolio_analysis_tools.monte_carlo_returns
+    ) as mc:
+        small = compare_strategies(capital=5000, simulations=200, seed=7)
+        large = compare_strategies(capital=20000, simulations=200, seed=7)
+
+    assert mc.call_count == len(small)  # second comparison served from the cache
+    for key in small:
+        assert large[key]["monte_carlo"]["median"] == pytest.approx(4 * small[key]["monte_carlo"]["median"])
+        assert large[key]["monte_carlo"]["max_drawdown_risk"] == small[key]["monte_carlo"]["max_drawdown_risk"]
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -63,6 +63,34 @@ def test_get_cash_from_object(portfolio_manager_object):
     assert isinstance(cash, float)
 
 
+def test_get_snapshot_single_portfolio_request(portfolio_manager_object, mock_client_object):
+    """Test snapshot reads equity, buying power and cash from one API call."""
+    snapshot = portfolio_manager_object.get_snapshot()
+
+    assert snapshot.equity == 1200.0
+    assert snapshot.buying_power == 600.0
+    assert snapshot.cash == 300.0
+    assert snapshot.allocations["cash"] == pytest.approx(0.25)
+    assert mock_client_object.client.get_portfolio.call_count == 1
+
+
+def test_portfolio_response_shared_until_refresh(portfolio_manager_object, mock_client_object):
+    """Back-to-back helpers reuse one portfolio response; refresh and invalidation refetch."""
+    mock_client_object.client.get_portfolio.return_value.positions = []
+    pm = portfolio_manager_object
+    pm.get_equity()
+    pm.get_cash()
+    pm.get_buying_power()
+    pm.get_portfolio_comprehensive()
+    assert mock_client_object.client.get_portfolio.call_count == 1
+
+    pm.refresh_portfolio()
+    assert mock_client_object.client.get_portfolio.call_count == 2
+    pm.invalidate_portfolio_cache()
+    pm.get_cash()
+    assert mock_client_object.client.get_portfolio.call_count == 3
+
+
 def test_get_equity_from_list_of_portfolio_equity(mock_client_object, mock_data_manager):
     """Test get_equity when API returns List[PortfolioEquity] (real SDK shape)."""
     from decimal import Decimal
@@ -133,3 +161,35 @@ def test_get_portfolio_comprehensive_returns_dict_with_positions(mock_client_obj
     assert result["cash"] == 300.0
     assert len(result["positions"]) == 1
     assert result["positions"][0]["symbol"] == "AAPL"
+
+
+def test_parse_osi_fixed_width_fields():
+    """OSI parsing slices fields from the end and rejects malformed symbols."""
+    from src.portfolio import _parse_osi
+
+    assert _parse_osi("AMPX260320C00014000") == ("AMPX", "260320", "C", "00014000")
+    assert _parse_osi("F260116P00012500") == ("F", "260116", "P", "00012500")
+    assert _parse_osi("AMPX260320X00014000") is None
+    assert _parse_osi("ampx260320C00014000") is None
+    assert _parse_osi("260320C00014000") is None
+    assert _parse_osi("AMPX26032AC00014000") is None
+
+
+def test_build_positions_parses_options_and_skips_empty_rows():
+    """build_positions maps raw rows to Positions, parsing OSI fields for options."""
+    from public_api_sdk import InstrumentType
+    from src.portfolio import build_positions
+
+    positions = build_positions([
+        {"instrument": {"symbol": "AMPX260320C00014000-OPTION", "type": "OPTION"},
+         "quantity": 2, "cost_basis": {"unit_cost": 1.5}},
+        {"instrument": {"symbol": "UMC", "type": "EQUITY"}, "quantity": 0},
+    ])
+
+    assert len(positions) == 1
+    option = positions[0]
+    assert option.instrument_type == InstrumentType.OPTION
+    assert option.underlying == "AMPX"
+    assert option.expiration == "2026-03-20"
+    assert option.strike == 14.0
+    assert option.entry_price == 1.5
@@ -4,12 +4,27 @@ from datetime import date, timedelta
 from unittest.mock import Mock, MagicMock
 from src.strategy import HighConvexityStrategy
 from src.portfolio import PortfolioManager, Position
-from src.market_data import MarketDataManager
+from src.market_data import MarketDataManager, SelectedContract
 from src.execution import ExecutionManager
 from src.client import TradingClient
 from public_api_sdk import InstrumentType
 
 
+def _contract(mid):
+    """Selected replacement contract priced at mid."""
+    return SelectedContract(
+        osi_symbol="UMC250420C00105000",
+        underlying="UMC",
+        expiration="2025-04-20",
+        strike=105.0,
+        bid=mid - 0.5,
+        ask=mid + 0.5,
+        mid=mid,
+        open_interest=100,
+        volume=50,
+    )
+
+
 @pytest.fixture
 def mock_components():
     """Create mock components."""
@@ -79,11 +94,7 @@ def test_should_roll_dte_low(strategy, mock_components):
     
     # Mock data manager
     data.get_quote.return_value = 105.0  # Underlying price
-    data.select_option_contract.return_value = {
-        "osi_symbol": "UMC250420C00105000",
-        "mid": 55.0,
-        "underlying": "UMC",
-    }
+    data.select_option_contract.return_value = _contract(mid=55.0)
     
     should_roll, new_contract = strategy.should_roll(position, 60.0)
     
@@ -126,11 +137,7 @@ def test_should_roll_cost_too_high(strategy, mock_components):
     # Max absolute: 100
     # If new contract costs 100, roll debit = 100 - 60 = 40
     # 40 > 21 and 40 < 100, so should not roll (exceeds percentage limit)
-    data.select_option_contract.return_value = {
-        "osi_symbol": "UMC250420C00105000",
-        "mid": 100.0,  # Very expensive - 40 debit
-        "underlying": "UMC",
-    }
+    data.select_option_contract.return_value = _contract(mid=100.0)  # Very expensive - 40 debit
     
     should_roll, new_contract = strategy.should_roll(position, 60.0)
     
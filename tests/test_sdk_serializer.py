@@ -12,6 +12,7 @@ from src.utils.sdk_serializer import (
     extract_option_chain_data,
     extract_portfolio_position_data,
     extract_portfolio_data,
+    LazyQuoteView,
 )
 
 
@@ -84,6 +85,22 @@ def test_extract_quote_data_production_shape():
     assert result["mid"] == 150.0
 
 
+def test_lazy_quote_view_serializes_on_first_access():
+    """LazyQuoteView exposes last without serializing; keys build the full dict once."""
+    from unittest.mock import patch
+
+    q = Mock(last=Decimal("150.0"), bid=Decimal("149.9"), ask=Decimal("150.1"))
+    q.instrument = Mock(symbol="AAPL", type="EQUITY")
+    view = LazyQuoteView(q)
+    with patch("src.utils.sdk_serializer.extract_quote_data", wraps=extract_quote_data) as extract:
+        assert view.last == 150.0
+        extract.assert_not_called()
+        assert view["bid"] == 149.9
+        assert view.get("mid") == 150.0
+        assert view.to_dict()["ask"] == 150.1
+        assert extract.call_count == 1
+
+
 def test_extract_greeks_data_production_shape():
     """extract_greeks_data returns delta, gamma, theta, vega."""
     class MockGreeks:
@@ -195,3 +212,24 @@ def test_extract_portfolio_data_production_shape():
     assert result["position_count"] == 1
     assert len(result["positions"]) == 1
     assert result["positions"][0]["symbol"] == "AAPL"
+
+
+def test_serialize_sdk_object_pydantic_model_uses_declared_fields():
+    """Pydantic SDK models serialize to their fields only (no model_* metadata)."""
+    from public_api_sdk import Quote
+
+    quote = Quote.model_validate({
+        "instrument": {"symbol": "AAPL", "type": "EQUITY"},
+        "outcome": "SUCCESS",
+        "last": "150.1",
+        "bid": "150",
+        "ask": "150.2",
+    })
+    data = serialize_sdk_object(quote)
+
+    assert set(data) == set(Quote.model_fields)
+    assert data["instrument"] == {"symbol": "AAPL", "type": "EQUITY"}
+    assert data["last"] == 150.1
+    result = extract_quote_data(quote)
+    assert result["symbol"] == "AAPL"
+    assert result["mid"] == pytest.approx(150.1)
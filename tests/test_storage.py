@@ -97,6 +97,37 @@ def test_save_fill(temp_db):
     assert len(fills) == 1
 
 
+def test_record_fill(temp_db):
+    """Test filled order and fill are written together."""
+    order = {
+        "order_id": "ORDER456",
+        "symbol": "AAPL",
+        "action": "BUY",
+        "quantity": 10,
+        "price": 150.0,
+        "status": "FILLED",
+        "filled_at": datetime.now().isoformat(),
+    }
+    fill = {
+        "order_id": "ORDER456",
+        "symbol": "AAPL",
+        "quantity": 10,
+        "fill_price": 150.0
+    }
+
+    temp_db.record_fill(order, fill)
+
+    orders = temp_db.get_recent_orders()
+    assert len(orders) == 1
+    assert orders[0]["status"] == "FILLED"
+
+    conn = sqlite3.connect(temp_db.db_path)
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM fills WHERE order_id = ?", ("ORDER456",))
+    assert cursor.fetchone()[0] == 1
+    conn.close()
+
+
 def test_save_contract(temp_db):
     """Test saving option contracts."""
     contract = {
@@ -167,6 +198,92 @@ def test_save_and_get_equity_history(temp_db):
     assert high == 1300.0
 
 
+def test_equity_high_cache_tracks_new_highs(temp_db):
+    """Test cached rolling high follows saves."""
+    temp_db.save_equity_history(1000.0)
+    assert temp_db.get_equity_high_last_n_days(30) == 1000.0
+
+    temp_db.save_equity_history(1500.0)
+    assert temp_db.get_equity_high_last_n_days(30) == 1500.0
+
+    # Same-day overwrite with a lower value drops the stale high
+    temp_db.save_equity_history(900.0)
+    assert temp_db.get_equity_high_last_n_days(30) == 900.0
+
+
+def test_equity_high_cache_sees_writes_from_another_process(temp_db):
+    """Test a higher equity saved through a second StorageManager invalidates the cached high."""
+    other = StorageManager(db_path=temp_db.db_path)
+    temp_db.save_equity_history(1000.0)
+    assert temp_db.get_equity_high_last_n_days(30) == 1000.0
+
+    other.save_equity_history(1400.0)
+    assert temp_db.get_equity_high_last_n_days(30) == 1400.0
+
+
+def test_equity_peak_ignores_small_new_highs(temp_db):
+    """Test kill-switch peak only moves on a new high beyond epsilon."""
+    temp_db.save_equity_history(1000.0)
+    assert temp_db.get_equity_peak(30) == 1000.0
+
+    # Within epsilon (default 0.5%): peak unchanged
+    temp_db.save_equity_history(1004.0)
+    assert temp_db.get_equity_peak(30) == 1000.0
+
+    temp_db.save_equity_history(1100.0)
+    assert temp_db.get_equity_peak(30) == 1100.0
+
+
+def test_equity_peak_reseeded_from_window_high_when_stale(temp_db):
+    """Test a peak older than the lookback window is replaced by the window high and its date."""
+    temp_db.set_bot_state("equity_peak", json.dumps({"equity": 5000.0, "date": "2000-01-01"}))
+    temp_db.save_equity_history(1200.0)
+
+    assert temp_db.get_equity_peak(30) == 1200.0
+    stored = json.loads(temp_db.get_bot_state("equity_peak"))
+    assert stored["date"] == date.today().isoformat()
+
+
+def test_drawdown_reference_prefers_peak_over_window_high(temp_db):
+    """Test the drawdown reference is the ε-peak, falling back to the window high."""
+    assert temp_db.get_drawdown_reference(30) is None
+
+    temp_db.save_equity_history(1000.0)
+    temp_db.save_equity_history(1004.0)  # within epsilon: peak stays at 1000
+    assert temp_db.get_equity_high_last_n_days(30) == 1004.0
+    assert temp_db.get_drawdown_reference(30) == 1000.0
+
+    temp_db.delete_bot_state("equity_peak")
+    assert temp_db.get_drawdown_reference(30) == 1004.0
+
+
+def test_cooldown_epoch_deadline(temp_db):
+    """Test cool-down deadline stored as a unix timestamp."""
+    import time
+
+    assert temp_db.is_in_cooldown() is False
+
+    temp_db.set_cooldown_until(time.time() + 600)
+    assert temp_db.is_in_cooldown() is True
+    assert isinstance(temp_db.get_cooldown_until(), datetime)
+
+    temp_db.set_cooldown_until(time.time() - 1)
+    assert temp_db.is_in_cooldown() is False
+
+    # Legacy ISO value still understood
+    temp_db.set_bot_state("cooldown_until", datetime(2099, 1, 1).isoformat())
+    assert temp_db.is_in_cooldown() is True
+
+
+def test_last_rebalance_date_roundtrip(temp_db):
+    """Test last rebalance time persists in bot state."""
+    assert temp_db.get_last_rebalance_date() is None
+
+    when = datetime(2026, 2, 5, 9, 35)
+    temp_db.set_last_rebalance_date(when)
+    assert temp_db.get_last_rebalance_date() == when
+
+
 def test_get_recent_orders(temp_db):
     """Test getting recent orders."""
     for i in range(5):
@@ -202,3 +202,28 @@ def test_rebalance_no_orders(strategy, mock_components):
     
     orders = strategy.rebalance()
     assert len(orders) == 0
+
+
+def test_rebalance_prefetches_only_themes_passing_entry_signal(strategy, mock_components):
+    """Test option caches are warmed only for underlyings whose entry signal allows a trade."""
+    from src.config import config
+    portfolio, data, execution = mock_components
+
+    a = config.theme_underlyings[0]
+    portfolio.get_equity.return_value = 10000.0
+    portfolio.get_current_allocations.return_value = {}
+    portfolio.get_target_allocations.return_value = {}
+    portfolio.calculate_rebalance_needs.return_value = {
+        "theme_a": 1000.0,
+        "theme_b": 1000.0,
+        "theme_c": 0.0,
+        "moonshot": 0.0,
+    }
+    data.get_quote.return_value = 10.0
+    data.select_option_contract.return_value = None
+
+    with patch.object(strategy, "check_entry_signal", side_effect=lambda symbol, price: symbol == a):
+        strategy.rebalance()
+
+    data.prefetch.assert_called_once_with([a])
+    assert [c.args[0] for c in data.select_option_contract.call_args_list] == [a]
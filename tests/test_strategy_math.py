@@ -1,6 +1,11 @@
 """Tests for strategy math module (REQ-019)."""
 import pytest
-from src.utils.strategy_math import StrategyProfile, expected_value, kelly_fraction, risk_of_ruin
+from src.utils.strategy_math import (
+    StrategyProfile,
+    expected_value,
+    kelly_fraction,
+    risk_of_ruin,
+)
 from src.utils.strategy_presets import get_preset, list_presets
 
 
@@ -244,6 +249,18 @@ def test_kelly_fraction_custom_cap():
     assert kelly_50 >= kelly_10
 
 
+def test_kelly_fraction_memoized_per_profile():
+    """Equal (frozen) profiles share one memoized Kelly result."""
+    kelly_fraction.cache_clear()
+    first = kelly_fraction(StrategyProfile("Memo", 0.55, 0.06, 0.04, 100))
+    second = kelly_fraction(StrategyProfile("Memo", 0.55, 0.06, 0.04, 100))
+
+    assert first == second
+    assert kelly_fraction.cache_info().hits == 1
+    with pytest.raises(Exception):
+        get_preset("daily_3pct_grind").win_rate = 0.9
+
+
 def test_risk_of_ruin_custom_threshold():
     """Test ROR with custom ruin threshold."""
     # Test with 50% threshold (less conservative)
@@ -37,7 +37,7 @@ def mock_bot():
     bot.storage = Mock()
     bot.storage.save_equity_history.return_value = None
     bot.storage.save_portfolio_snapshot.return_value = None
-    bot.storage.get_equity_high_last_n_days.return_value = 11000.0
+    bot.storage.get_drawdown_reference.return_value = 11000.0
     bot.storage.get_balance_trends.return_value = [
         {"equity": 10000.0, "config": {"theme_a_target": 0.35}},
         {"equity": 9500.0, "config": {"theme_a_target": 0.35}},